@@ -0,0 +1,6 @@
+"""
+Seed generation, statistics and lattice export for the Voronoi panels.
+
+The modules live in funtions/ and import each other by module name, `python -m interfacingPython`
+(run from the repo root with PYTHONPATH=src/utils) is the command line front end, see __main__.py.
+"""
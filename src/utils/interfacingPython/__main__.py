@@ -0,0 +1,298 @@
+"""
+Command line front end. Run it from the repository root, the folder holding the assetss/ tree
+that run.py and the README use, with src/utils on the import path:
+
+    PYTHONPATH=src/utils python -m interfacingPython <command> ...
+
+    python -m interfacingPython generate --numP 314 --ratio 0.4 --samples 10 --method SSI_batched
+    python -m interfacingPython generate --size 2000x2000 --numP 1000000 --ratio 0.3 --tiles 4 4
+    python -m interfacingPython sweep --ratios 0.10 0.60 0.01 --samples 100 --workers 8
+    python -m interfacingPython analyze --catalog --numP 314 --out summary.csv
+    python -m interfacingPython export --catalog --ratio 0.4 --thickness 0.5 --depth 3
+    python -m interfacingPython serve --workers 4
+    python -m interfacingPython startup
+
+Only argparse runs at start-up: every command imports its modules when it is called, and the
+modules themselves import SciPy / matplotlib only in the functions that use them, so a
+headless generate or sweep (and each of its pool workers) never loads the plotting stack.
+`startup` measures that import time (benchmarkSSI.bench_startup).
+
+Like run.py, every default path (assetss/csvFile, assetss/seedArchive, assetss/seedCatalog.sqlite,
+assetss/resultCache, ...) is relative to the current directory, the CLI never changes it.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CATALOG = os.path.join("assetss", "seedCatalog.sqlite")
+
+# The modules live in funtions/ and import each other by module name
+sys.path.insert(0, os.path.join(ROOT, "funtions"))
+
+
+def _number(text):
+    """'50' -> 50, '50.5' -> 50.5 (so folder names stay 50x50 as in the CSV tree)."""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _polygon(args):
+    """
+    Panel outline from --polygon "x,y" ... or --size WxH (rectangle at the origin).
+
+    Returns:
+        (xp, yp): closed vertex lists.
+    """
+    if args.polygon:
+        pts = [tuple(_number(v) for v in p.split(",")) for p in args.polygon]
+        if pts[0] != pts[-1]:
+            pts.append(pts[0])
+        return [p[0] for p in pts], [p[1] for p in pts]
+    w, h = (_number(v) for v in args.size.lower().split("x"))
+    return [0, w, w, 0, 0], [0, 0, h, h, 0]
+
+
+def _jamming(args):
+    return {"mode": args.jamming} if args.jamming else None
+
+
+def _cache(args):
+    if not args.cache:
+        return None
+    from resultCache import ResultCache
+    return ResultCache(args.cache, int(args.cache_mb * 2**20))
+
+
+def cmd_generate(args):
+    xp, yp = _polygon(args)
+    from sweepRunner import spawn_seeds
+    seeds = spawn_seeds(args.seed, args.samples)
+
+    if args.tiles:
+        import tiledSSI
+        for sample in range(args.samples):
+            X, stats = tiledSSI.tiled_ssi(xp, yp, args.numP, args.ratio, args.timeout, tiles=tuple(args.tiles),
+                                          workers=args.workers, seed=seeds[sample], save=True,
+                                          jamming=_jamming(args))
+            print(f"{sample}: {stats['Status']} {stats['Placed']}/{args.numP} seeds in {stats['Time_s']:.2f}s "
+                  f"(tiles {stats['TileTime_s']:.2f}s, seams {stats['SeamTime_s']:.2f}s)")
+        return 0
+
+    import PointAllocationProcess as Process
+    runner = Process.PointAllocationProcess(xp, yp, args.method)
+    if args.archive:
+        from seedArchive import SeedArchive
+        runner.sink = SeedArchive(args.archive)
+    if args.catalog:
+        from seedCatalog import SeedCatalog
+        runner.catalog = SeedCatalog(args.catalog)
+    if args.jamming:
+        runner.enable_jamming_stop(**_jamming(args))
+    if args.profile:
+        runner.enable_profiling()
+    runner.cache = _cache(args)
+
+    for X, info in runner.iterSeedSets(args.numP, args.ratio, args.timeout, args.samples, seeds, save=True):
+        print(f"{info['Sample']}: {info['Status']} {info['Placed']}/{args.numP} seeds in "
+              f"{info['Time_s']:.2f}s -> {info['Location'] or 'from the result cache'}")
+    return 0
+
+
+def cmd_sweep(args):
+    xp, yp = _polygon(args)
+    start, stop, step = args.ratios
+    ratios = [round(start + step * i, 6) for i in range(int(round((stop - start) / step)))] # stop excluded
+
+    if args.workers == 1 or args.resume:
+        import run
+        run._sequential_sweep(xp, yp, args.numP, ratios, args.samples, args.timeout, args.method,
+                              args.seed, _jamming(args), args.resume, args.profile, _cache(args), args.policy)
+        return 0
+
+    import sweepRunner
+    log = sweepRunner.run_sweep_parallel(xp, yp, args.numP, ratios, args.samples, args.timeout,
+                                         method=args.method, workers=args.workers, baseSeed=args.seed,
+                                         policy=args.policy, jamming=_jamming(args), cache=_cache(args))
+    w, h = max(xp) - min(xp), max(yp) - min(yp)
+    sweepRunner.writeRuntimeLog(log, args.method, args.numP, w, h)
+    return 0
+
+
+def _catalog_rows(args):
+    from seedCatalog import SeedCatalog
+    catalog = SeedCatalog(args.catalog)
+    if args.scan:
+        catalog.scan()
+    return catalog, dict(numP=args.numP, ratio=args.ratio, method=args.method, status=args.status, limit=args.limit)
+
+
+def cmd_analyze(args):
+    xp, yp = _polygon(args) if args.polygon else (None, None)
+
+    if args.cells:
+        import cellMetrics
+        from datetime import datetime
+        catalog, query = _catalog_rows(args)
+        rows = catalog.query(**query)
+        if xp is None and rows:
+            xp, yp = [0, rows[0]["width"], rows[0]["width"], 0, 0], [0, 0, rows[0]["height"], rows[0]["height"], 0]
+        results = cellMetrics.cell_metrics_batch(rows, xp, yp, workers=args.workers)
+        path = args.out or os.path.join("assetss", "statistics", f"cells_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+        print(f"✅ Cell metrics of {len(rows)} sets saved to {cellMetrics.writeMetricsCSV(rows, results, path)}")
+        return 0
+
+    import seedStatistics
+    if args.catalog:
+        catalog, query = _catalog_rows(args)
+        results = seedStatistics.analyze_catalog(catalog, xp, yp, workers=args.workers, **query)
+    else:
+        results = seedStatistics.analyze_archive(args.archive, numP=args.numP, ratio=args.ratio,
+                                                 xp=xp, yp=yp, workers=args.workers)
+    rows = seedStatistics.summary_table(results)
+    for row in rows:
+        print(f"{row['Width']}x{row['Height']} numP={row['numP']} ratio={row['Ratio']:.3f}: {row['Sets']} sets, "
+              f"delta={row['Delta_mean']}, g_peak={row['g_peak']}")
+    print(f"✅ Summary saved to {seedStatistics.writeSummaryCSV(rows, args.out)}")
+    if args.curves:
+        print(f"✅ Curves saved to {seedStatistics.writeCurves(results, args.curves)}")
+    return 0
+
+
+def cmd_export(args):
+    if args.csv:
+        sources = args.csv
+    else:
+        catalog, query = _catalog_rows(args)
+        sources = catalog.query(**query)
+    if args.polygon or args.size:
+        xp, yp = _polygon(args)
+    elif sources and isinstance(sources[0], dict):
+        w, h = sources[0]["width"], sources[0]["height"]
+        xp, yp = [0, w, w, 0, 0], [0, 0, h, h, 0]
+    else:
+        raise SystemExit("--size or --polygon is required when exporting CSV files")
+
+    import stlExport
+    paths = stlExport.export_stl_batch(sources, xp, yp, args.thickness, args.depth, workers=args.workers)
+    print(f"✅ {len(paths)} STL files written" + (f", e.g. {paths[0]}" if paths else ""))
+    return 0
+
+
+def cmd_serve(args):
+    import jobServer
+    jobServer.serve(args.host, args.port, args.workers, args.max_queue)
+    return 0
+
+
+def cmd_startup(args):
+    import benchmarkSSI
+    for module in args.modules or benchmarkSSI.WORKER_MODULES:
+        r = benchmarkSSI.bench_startup(module, args.rounds)
+        heavy = [m for m in ("scipy", "matplotlib") if r[m]]
+        print(f"{module:24s} process {r['startup_s'] * 1e3:6.0f} ms, import {r['import_s'] * 1e3:6.0f} ms"
+              + (f"  ⚠ loads {', '.join(heavy)}" if heavy else ""))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m interfacingPython",
+                                     description="Seed generation, statistics and STL export.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def panel(p, size="50x50"):
+        p.add_argument("--size", default=size, help="Rectangle WxH at the origin (default %(default)s)")
+        p.add_argument("--polygon", nargs="+", metavar="X,Y", help="Polygon vertices instead of --size")
+
+    def cache(p):
+        p.add_argument("--cache", nargs="?", const=os.path.join("assetss", "resultCache"),
+                       help="Reuse seed sets of identical seeded runs (default assetss/resultCache)")
+        p.add_argument("--cache-mb", type=float, default=2048, help="Size limit of the result cache")
+
+    def selection(p):
+        p.add_argument("--catalog", nargs="?", const=DEFAULT_CATALOG,
+                       help="Select the sets from a SeedCatalog (default assetss/seedCatalog.sqlite)")
+        p.add_argument("--scan", action="store_true", help="Rescan the CSV tree / archive into the catalog first")
+        p.add_argument("--numP", type=int)
+        p.add_argument("--ratio", type=float)
+        p.add_argument("--method")
+        p.add_argument("--status", default="Completed")
+        p.add_argument("--limit", type=int)
+        p.add_argument("--workers", type=int)
+
+    p = sub.add_parser("generate", help="Generate seed sets")
+    panel(p)
+    p.add_argument("--numP", type=int, default=314)
+    p.add_argument("--ratio", type=float, required=True)
+    p.add_argument("--method", default="SSI", help="Sampler, see PointAllocationProcess.exampleRun")
+    p.add_argument("--timeout", type=float, default=180)
+    p.add_argument("--samples", type=int, default=1)
+    p.add_argument("--seed", type=int, help="Root seed, every sample gets its own spawned seed")
+    p.add_argument("--archive", help="Store in a SeedArchive instead of the CSV tree")
+    p.add_argument("--catalog", help="Register every set in this SeedCatalog")
+    p.add_argument("--jamming", choices=("estimate", "rate"), help="Stop hopeless runs early (status Jammed)")
+    p.add_argument("--profile", action="store_true", help="Per-phase timings in the run stats")
+    p.add_argument("--tiles", type=int, nargs=2, metavar=("NX", "NY"), help="Tiled parallel SSI of one large panel")
+    p.add_argument("--workers", type=int, help="Processes of the tiled SSI")
+    cache(p)
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("sweep", help="Ratio x sample sweep with a runtime log")
+    panel(p)
+    p.add_argument("--numP", type=int, default=314)
+    p.add_argument("--ratios", type=float, nargs=3, metavar=("START", "STOP", "STEP"), default=(0.10, 0.60, 0.01))
+    p.add_argument("--samples", type=int, default=100)
+    p.add_argument("--timeout", type=float, default=180)
+    p.add_argument("--method", default="SSI")
+    p.add_argument("--seed", type=int, help="Base seed of the sweep")
+    p.add_argument("--workers", type=int, help="Processes, 1 runs the sequential (resumable) sweep")
+    p.add_argument("--policy", default="stop_sweep", choices=("stop_sweep", "skip_ratio", "continue"),
+                   help="After a timeout or jammed run (default %(default)s)")
+    p.add_argument("--jamming", choices=("estimate", "rate"))
+    p.add_argument("--resume", help="Runtime log of an interrupted sequential sweep")
+    p.add_argument("--profile", action="store_true", help="Sequential sweep only, writes <log>_profile.csv")
+    cache(p)
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser("analyze", help="Spatial statistics (or cell metrics) of stored seed sets")
+    panel(p)
+    selection(p)
+    p.add_argument("--archive", default=os.path.join("assetss", "seedArchive"),
+                   help="SeedArchive to analyse when no --catalog is given")
+    p.add_argument("--cells", action="store_true", help="Voronoi cell metrics instead (needs --catalog)")
+    p.add_argument("--out", help="Summary CSV, default assetss/statistics/")
+    p.add_argument("--curves", help="Also store the mean K, L, g curves in this .npz")
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser("export", help="STL lattices of stored seed sets")
+    panel(p, size=None)
+    selection(p)
+    p.add_argument("--csv", nargs="+", help="Seed CSV files instead of a catalog selection")
+    p.add_argument("--thickness", type=float, default=0.5, help="Ligament thickness")
+    p.add_argument("--depth", type=float, default=3.0, help="Extrusion depth")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("serve", help="Local job server for on-demand seed sets (see jobServer)")
+    p.add_argument("--host", default="127.0.0.1", help="Loopback address (default %(default)s)")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--workers", type=int, help="Worker processes, default the CPU count")
+    p.add_argument("--max-queue", type=int, default=64, help="Waiting jobs before requests are refused")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("startup", help="Import time of a headless worker")
+    p.add_argument("modules", nargs="*", help="Modules to time, default benchmarkSSI.WORKER_MODULES")
+    p.add_argument("--rounds", type=int, default=5)
+    p.set_defaults(func=cmd_startup)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    needsCatalog = (args.command == "analyze" and args.cells) or (args.command == "export" and not args.csv)
+    if needsCatalog and not args.catalog:
+        args.catalog = DEFAULT_CATALOG
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,22 @@
 import numpy as np
-from matplotlib.path import Path
 import math
-from scipy.spatial.distance import pdist
+import itertools
 import os
+from spatialHashGrid import SpatialHashGrid
+from seedGrid import SeedGrid
+from polygonDomain import PolygonDomain
+from jammingMonitor import JammingMonitor
+from freeRegionTracker import FreeRegionTracker
+from phaseProfiler import PhaseProfiler
 
 import time
 
+# Next free file index per output folder, so saveSeedsCSV does not list the folder on every save
+_nextCSVIndex = {}
+
 
 class PointAllocationProcess:
-    def __init__(self, xp, yp,method='NotDefinedAllogrithm'):
+    def __init__(self, xp, yp,method='NotDefinedAllogrithm', rng=None, holes=None):
         """
         Initialize a point-allocation process for generating Poisson-like samples
         inside a 2D polygon (here, a rectangle or any area defined by xp, yp).
@@ -19,19 +27,104 @@ class PointAllocationProcess:
             method (str): A short label indicating which sampling algorithm will be used
                           (e.g. 'SSI', 'Bridson', 'BestCandidate', etc.). Defaults to
                           'NotDefinedAlgorithm'.
+            rng (int, np.random.Generator or None): Seed or Generator used by every sampler of
+                          this instance. None draws a fresh seed, see reseed().
+            holes (list of (hx, hy), optional): Openings inside the polygon, no seed is placed
+                          in them and their area is left out of the seed density.
         
         After initialization, these instance attributes are set:
             self.xp, self.yp: The polygon’s vertices.
             self.minx, self.maxx: Minimum and maximum x-value among the vertices.
             self.miny, self.maxy: Minimum and maximum y-value among the vertices.
-            self.method: A string tag you can later use to identify which sampler generated each output file."""
+            self.domain: PolygonDomain built once, used for every containment test.
+            self.method: A string tag you can later use to identify which sampler generated each output file.
+            self.rng: numpy.random.Generator all random draws come from.
+            self.seed: Integer seed of self.rng (None if a Generator was passed in).
+            self.jamming: Optional JammingMonitor, when set the SSI runs stop early with status
+                          "Jammed" once numP is out of reach (see enable_jamming_stop).
+            self.lastRunStats: dict of extra stats of the last run (placed seeds, estimates, ...).
+            self.sink: Where finished seed sets go, None for the CSV tree or an object with a
+                       save(X, info) method such as seedArchive.SeedArchive.
+            self.catalog: Optional seedCatalog.SeedCatalog, every saved set is registered in it
+                          together with its run info.
+            self.autosave: When False the samplers keep their result in self.lastSeeds without
+                           saving it (used by iterSeedSets).
+            self.lastSeeds: (numP, 2) seeds of the last run.
+            self.startSeeds: Optional (k, 2) seeds the next SSI run starts from instead of one
+                             random seed, e.g. the partial seeds of a timed-out run. Used once.
+            self.profiler: Optional PhaseProfiler, when set the runs record per-phase timers
+                           and the acceptance curve in lastRunStats["Profile"] (see enable_profiling).
+            self.cache: Optional resultCache.ResultCache, a run whose seeds are already cached
+                        (same polygon, parameters, method and seed) returns them without
+                        sampling or saving again, see exampleRun."""
       
         self.xp = xp
         self.yp = yp
         self.minx, self.maxx = min(xp), max(xp) # Min and max x-coordinates of the polygon 
         self.miny, self.maxy = min(yp), max(yp) # Min and max y-coordinates of the polygon
+        self.domain = PolygonDomain(xp, yp, holes) # Rectangle fast path or one cached Path
         self.method=method # Method to be used for point generation
+        self.reseed(rng) # Random stream for all samplers of this instance
+        self.jamming = None # No early stop, runs end on Completed/Timeout only
+        self.lastRunStats = {}
+        self.sink = None # None -> one CSV per seed set in assetss/csvFile
+        self.catalog = None # No index update on save
+        self.autosave = True # Every run saves its seeds, as the samplers always did
+        self.lastSeeds = None
+        self.startSeeds = None # Next SSI run starts from scratch
+        self.profiler = None # No instrumentation, the samplers run their plain loops
+        self.cache = None # Every run samples
+
+    def reseed(self, seed=None):
+        """
+        Reset the random stream used by the samplers.
+
+        Parameters:
+            seed (int, np.random.Generator or None): An int seed gives a reproducible stream,
+                a Generator is used as is, None draws a fresh seed from OS entropy. The int seed
+                is kept in self.seed so it can be written to the runtime log and the run can be
+                repeated later with reseed(seed).
+        """
+        if isinstance(seed, np.random.Generator):
+            self.rng = seed
+            self.seed = None
+            self.freshStream = False
+            return
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
+        self.seed = int(seed)
+        self.rng = np.random.default_rng(self.seed)
+        self.freshStream = True # self.seed describes the stream until a run draws from it
         
+    def enable_jamming_stop(self, mode="estimate", **kwargs):
+        """
+        Let the SSI runs stop with status "Jammed" as soon as the acceptance rate shows numP
+        cannot be reached, instead of waiting for the timeout. The timeout still applies.
+
+        Parameters:
+            mode (str): "estimate" or "rate", see JammingMonitor.
+            **kwargs: window, minAcceptRate, checkEvery, passed to JammingMonitor.
+        """
+        self.jamming = JammingMonitor(mode, **kwargs)
+
+    def enable_profiling(self, fillFractions=None):
+        """
+        Record per-phase timers (draw, containment, distance, io), call counters and the
+        acceptance-rate-vs-fill curve of every run in self.lastRunStats["Profile"].
+
+        The phases are split inside exampleRun_SSI_withRejects (method "SSI"); the other
+        samplers only report the io phase. Disabled (the default), the samplers use their
+        plain functions and pay nothing.
+
+        Parameters:
+            fillFractions (tuple of float, optional): Fill levels where the curve is sampled,
+                defaults to phaseProfiler.DEFAULT_FILL_FRACTIONS.
+        """
+        self.profiler = PhaseProfiler() if fillFractions is None else PhaseProfiler(fillFractions)
+
+    def disable_profiling(self):
+        self.profiler = None
+
     def generate_points(self, n):
         """
         Generate homogeneous 2-D Poisson process within the polygon.
@@ -47,8 +140,8 @@ class PointAllocationProcess:
         count = 0
         while count < n:
             # Generate random points within the bounding box of the polygon
-            xt = np.random.uniform(self.minx, self.maxx)
-            yt = np.random.uniform(self.miny, self.maxy)
+            xt = self.rng.uniform(self.minx, self.maxx)
+            yt = self.rng.uniform(self.miny, self.maxy)
 
             # Check if the point is inside the polygon
             # If it is, store the point in the array
@@ -58,6 +151,46 @@ class PointAllocationProcess:
                 count += 1
         return points
 
+    def _generate_points_profiled(self, n):
+        """
+        generate_points with the bounding box draws and the containment tests timed apart
+        (same random stream, so a profiled run places the same seeds).
+        """
+        prof = self.profiler
+        clock = time.perf_counter
+        points = np.zeros((n, 2))
+        count = 0
+        while count < n:
+            t0 = clock()
+            xt = self.rng.uniform(self.minx, self.maxx)
+            yt = self.rng.uniform(self.miny, self.maxy)
+            t1 = clock()
+            inside = self.in_polygon(xt, yt)
+            prof.add("draw", t1 - t0)
+            prof.add("containment", clock() - t1)
+            if inside:
+                points[count, 0] = xt
+                points[count, 1] = yt
+                count += 1
+        return points
+
+    def draw_candidates(self, n):
+        """
+        Draw n uniform points in the bounding box in one vectorized call and keep the ones
+        inside the polygon. Unlike generate_points, the number of returned points can be
+        smaller than n (the bounding box draws that fell outside the polygon are dropped).
+
+        Parameters:
+            n (int): Number of bounding box draws.
+
+        Returns:
+            np.ndarray: (m, 2) array of candidates inside the polygon, m <= n, in draw order.
+        """
+        # One Generator call per axis fills the whole block
+        pts = np.column_stack((self.rng.uniform(self.minx, self.maxx, n),
+                               self.rng.uniform(self.miny, self.maxy, n)))
+        return pts[self.domain.contains_points(pts)]
+
     def in_polygon(self, x, y):
         """
         Check if a point (x, y) is inside the polygon.
@@ -69,10 +202,7 @@ class PointAllocationProcess:
         Returns:
             bool: True if the point is inside the polygon, False otherwise.
         """
-        polygon = Path(np.column_stack((self.xp, self.yp)))
-
-        # Use the contains_point method to check if the point is inside the polygon
-        return polygon.contains_point((x, y))
+        return self.domain.contains(x, y)
     
     def getAreaQUAD(self):
         """
@@ -88,6 +218,28 @@ class PointAllocationProcess:
         Ydiff=np.max(self.yp)-np.min(self.yp)
         return Xdiff*Ydiff 
         
+    def getArea(self):
+        """
+        Get the exact area of the polygon (any xp, yp, holes removed), using the shoelace formula.
+        For rectangles and squares this is the same value as getAreaQUAD.
+
+        Returns:
+            float: Area of the polygon.
+        """
+        return self.domain.area
+
+    def numPForDensity(self, density):
+        """
+        Number of seeds giving a target seed density (seeds per unit area) on this polygon.
+
+        Parameters:
+            density (float): Seeds per unit area (e.g. 314 / 2500 for the 50x50 panels).
+
+        Returns:
+            int: Number of seeds, at least 1.
+        """
+        return max(1, int(round(density * self.getArea())))
+
     def SeedMaxDis(self,Area,numP):
         """
         Get the maximum distance between the seeds.
@@ -124,15 +276,20 @@ class PointAllocationProcess:
         self.method = "SSI"
 
         # Calculate area and distances
-        Area = self.getAreaQUAD()
+        Area = self.getArea()
         seedMaxDis = self.SeedMaxDis(Area, numP)
         inhibitionDis = ratio * seedMaxDis
 
         X = np.zeros((numP, 2))  # Container for seed points
 
+        # Cell grid with cell size = inhibition distance, only the 3x3 block around
+        # a candidate has to be checked instead of every placed seed
+        grid = SpatialHashGrid(self.minx, self.miny, inhibitionDis)
+
         # Generate the first point
         point = self.generate_points(1)[0]
         X[0, :] = point
+        grid.insert(point[0], point[1])
         i = 1
 
         # Start timing only after the first valid seed
@@ -146,34 +303,18 @@ class PointAllocationProcess:
             point = self.generate_points(1)[0]
             sx, sy = point[0], point[1]
 
-            xt = np.vstack(([sx, sy], X[:i, :]))
-            dist = pdist(xt)
-            ind = np.where(dist[:i] <= inhibitionDis)[0]
-
-            if len(ind) == 0:
+            if not grid.has_neighbour_within(sx, sy, inhibitionDis):
                 X[i, :] = [sx, sy]
+                grid.insert(sx, sy)
                 i += 1
         
         #Take the time after the last point is generated
         total_time = time.time() - start_time
 
-        # Determine size of the bounding quadrilateral
-        width = self.maxx - self.minx
-        height = self.maxy - self.miny
-
-        base_dir = os.path.join("assetss", "csvFile", f"{width}x{height}", f"numP_{numP}", f"ratio_{ratio:.2f}")
-        os.makedirs(base_dir, exist_ok=True)
-
-        # Count how many files already exist for this method
-        existing_files = [f for f in os.listdir(base_dir) if f.startswith(self.method) and f.endswith('.csv')]
-        next_index = len(existing_files)
-
-        # Save using method name + simple index (e.g. SSI_0.csv, SSI_1.csv, etc.)
-        filename = f"{self.method}_{next_index}.csv"
-        csv_path = os.path.join(base_dir, filename)
-
-        np.savetxt(csv_path, X, delimiter=",")
-        print(f"File saved as {csv_path}")
+        # Same folder layout (ratio_<r:.3f>) as the other samplers, the old ratio_<r:.2f>
+        # folders are merged with these by the SeedCatalog
+        self.lastRunStats = {"Status": "Completed", "Time_s": total_time, "Placed": numP}
+        self._store_run(X, numP, ratio)
 
         return "Completed", total_time  
     
@@ -184,26 +325,41 @@ class PointAllocationProcess:
         3) Returns (status, runtime, attempts, rejects for analysis.
   
         Returns: N   
-            status (str): "Completed" or "Timeout"
+            status (str): "Completed", "Timeout" or "Jammed" (only with enable_jamming_stop)
             run_time (float): seconds from first placement to finish/timeout
             attempts (int): how many random draws were made
             rejects  (int): how many of those draws were discarded
         """
         # precompute distances
-        A                 = self.getAreaQUAD() # Specific to rectangle or square
+        A                 = self.getArea() # Exact area of any polygon
         seedMax           = self.SeedMaxDis(A, numP) # Obtain maximum distance between seeds
         inhibitationDis   = ratio * seedMax # Calculate inhibition distance based on ratio and maximum distance
 
         # Main container to store points
         # Initialize with zeros, will be filled with points
         X       = np.zeros((numP, 2))
-        X[0]    = self.generate_points(1)[0] # Place the first point can be anywhere in the polygon
+
+        # Spatial hash of the placed seeds, cell size = inhibition distance
+        grid    = SpatialHashGrid(self.minx, self.miny, inhibitationDis)
 
         #Trackers to be reported
-        placed  = 1      # Number of points successfully placed
-        attempts= 1      # Number of attempts made to place points
+        # The first point can be anywhere in the polygon (or the run resumes from startSeeds)
+        placed, attempts = self._place_start_seeds(X, grid) # Points placed / attempts made so far
         rejects = 0      # Number of points rejected due to inhibition distance
 
+        monitor = self.jamming # Optional early stop, None costs one compare per attempt
+        if monitor is not None:
+            monitor.reset()
+
+        # Optional instrumentation, picked once here so the plain loop is unchanged without it
+        prof  = self.profiler
+        draw  = self.generate_points
+        check = grid.has_neighbour_within
+        if prof is not None:
+            prof.reset(numP)
+            draw  = self._generate_points_profiled
+            check = prof.wrap("distance", check)
+
         t0 = time.time()
         status = "Completed" # Default status, will change to "Timeout" if we exceed the time limit
 
@@ -215,34 +371,717 @@ class PointAllocationProcess:
                 status = "Timeout"
                 break # end of while loop
 
+            # Stop once the recent acceptance rate says numP is out of reach
+            if monitor is not None and attempts >= monitor.nextCheck:
+                monitor.nextCheck = attempts + monitor.checkEvery
+                if monitor.is_jammed(placed, attempts, numP):
+                    status = "Jammed"
+                    break
+
             # Generate a new point
             # This is the point that will be checked against existing points
             # and placed if it does not violate the inhibition distance
-            pt = self.generate_points(1)[0]
+            pt = draw(1)[0]
             attempts += 1
 
-            # check against existing
-            d = pdist(np.vstack([pt, X[:placed]]))[:placed]
-            if (d <= inhibitationDis).any():
+            # check against existing seeds in the neighbouring cells only
+            if check(pt[0], pt[1], inhibitationDis):
                 rejects += 1
                 continue  # jumps back to `while` top
 
             X[placed] = pt
+            grid.insert(pt[0], pt[1])
             placed   += 1
+            if monitor is not None:
+                monitor.accepted(attempts)
+            if prof is not None:
+                prof.accepted(placed, attempts)
 
         run_time = time.time() - t0
+        self._record_run_stats(status, run_time, placed, attempts, rejects, A, monitor)
+
+        # save the final configuration (CSV, or self.sink when one is set)
+        self._store_run(X, numP, ratio)
+
+        return status, run_time, attempts, rejects
+
+    def exampleRun_SSI_batched(self, numP, ratio, timeout, batchSize=4096):
+        """
+        Same process and return values as exampleRun_SSI_withRejects, but candidates are
+        drawn in blocks of `batchSize` instead of one generate_points(1) call per attempt.
+
+        For every block:
+            1) All bounding box draws are masked against the polygon domain in one vectorized call.
+            2) The block is tested in bulk against the seeds placed before the block (SeedGrid
+               gather over the 3x3 cells around every candidate, so the cost per block does
+               not grow with the number of placed seeds).
+            3) The survivors are then walked in draw order and checked against the seeds accepted
+               earlier in the same block, so two candidates of one block can never both be kept
+               if they are too close. This keeps the SSI rule: every candidate is accepted or
+               rejected against all the seeds accepted before it.
+
+        Parameters:
+            numP (int): Number of seeds to generate.
+            ratio (float): Ratio used to determine inhibition distance relative to theoretical spacing.
+            timeout (float): Seconds before the run is stopped with status "Timeout".
+            batchSize (int): Number of bounding box draws per block.
+
+        Returns:
+            status (str): "Completed", "Timeout" or "Jammed" (only with enable_jamming_stop)
+            run_time (float): seconds from first placement to finish/timeout
+            attempts (int): how many candidates inside the polygon were tested
+            rejects  (int): how many of those candidates were discarded
+        """
+        A                 = self.getArea() # Exact area of any polygon
+        seedMax           = self.SeedMaxDis(A, numP)
+        inhibitationDis   = ratio * seedMax
+
+        X       = np.zeros((numP, 2))
+        grid    = SpatialHashGrid(self.minx, self.miny, inhibitationDis)
+        placed, attempts = self._place_start_seeds(X, grid)
+        rejects = 0
+
+        # Bulk prefilter, filled as seeds are accepted instead of rebuilt for every block
+        boxArea = (self.maxx - self.minx) * (self.maxy - self.miny)
+        bulk = SeedGrid(self.minx, self.miny, self.maxx, self.maxy,
+                        max(inhibitationDis, math.sqrt(boxArea / numP)))
+        bulk.insert_block(0, X[:placed])
+
+        monitor = self.jamming
+        if monitor is not None:
+            monitor.reset()
+
+        t0 = time.time()
+        status = "Completed"
+
+        while placed < numP:
+            if time.time() - t0 >= timeout:
+                status = "Timeout"
+                break
+
+            if monitor is not None and attempts >= monitor.nextCheck:
+                monitor.nextCheck = attempts + monitor.checkEvery
+                if monitor.is_jammed(placed, attempts, numP):
+                    status = "Jammed"
+                    break
+
+            cand = self.draw_candidates(batchSize)
+            if len(cand) == 0:
+                continue
+
+            # Bulk test against the seeds placed before this block
+            free = ~bulk.conflicts(cand, X, inhibitationDis)
+
+            # Resolve conflicts inside the block in draw order
+            placedBefore = placed
+            used = len(cand)
+            for k in np.flatnonzero(free):
+                x, y = cand[k]
+                if grid.has_neighbour_within(x, y, inhibitationDis):
+                    continue
+                X[placed] = (x, y)
+                grid.insert(x, y)
+                bulk.insert(placed, x, y)
+                placed += 1
+                if monitor is not None:
+                    monitor.accepted(attempts + int(k) + 1)
+                if placed == numP:
+                    used = int(k) + 1 # candidates after this one were never needed
+                    break
+
+            attempts += used
+            rejects  += used - (placed - placedBefore)
+
+        run_time = time.time() - t0
+        self._record_run_stats(status, run_time, placed, attempts, rejects, A, monitor)
+
+        self._store_run(X, numP, ratio)
+
+        return status, run_time, attempts, rejects
+
+    def exampleRun_SSI_highN(self, numP, ratio, timeout, batchSize=16384, dtype=np.float64, inhibitionDis=None):
+        """
+        SSI for very large seed sets (100k - 1M seeds on a big panel), same process and return
+        values as exampleRun_SSI_batched.
+
+        The batched sampler keeps the seeds three times (array, SeedGrid prefilter and a grid
+        of Python tuples for the draw-order check), and walks every survivor of a block
+        through the tuple grid. Here:
+            - X is preallocated once as a (numP, 2) array of `dtype` (float32 halves it).
+            - The placed seeds are indexed by a SeedGrid: two int32 arrays, about one cell
+              per seed, cell side >= the inhibition distance.
+            - Every block of candidates is tested against the grid with a fixed 3x3 cell
+              gather, so the work per attempt stays bounded whatever numP is.
+            - Survivors of a block are walked in draw order against the seeds accepted
+              earlier in the same block only (a small SpatialHashGrid reset per block).
+        Candidates are rounded to `dtype` before they are tested, so the stored seeds respect
+        the inhibition distance exactly.
+
+        Parameters:
+            numP (int): Number of seeds to generate.
+            ratio (float): Ratio used to determine inhibition distance relative to theoretical spacing.
+            timeout (float): Seconds before the run is stopped with status "Timeout".
+            batchSize (int): Number of bounding box draws per block.
+            dtype (np.dtype): Storage type of the seeds, np.float64 or np.float32.
+            inhibitionDis (float, optional): Fixed inhibition distance used instead of
+                ratio * SeedMaxDis(area, numP), e.g. the panel-wide distance when only a part
+                of the panel is filled (tiledSSI).
+
+        Returns:
+            status (str): "Completed", "Timeout" or "Jammed" (only with enable_jamming_stop)
+            run_time (float): seconds from first placement to finish/timeout
+            attempts (int): how many candidates inside the polygon were tested
+            rejects  (int): how many of those candidates were discarded
+
+        lastRunStats also gets PeakMem_MB, the largest footprint of the sampler's arrays
+        (seeds, grid and one block of candidates) during the run.
+        """
+        A                 = self.getArea() # Exact area of any polygon
+        seedMax           = self.SeedMaxDis(A, numP)
+        inhibitationDis   = ratio * seedMax if inhibitionDis is None else inhibitionDis
+
+        # About one cell per seed, but never smaller than the inhibition distance
+        boxArea = (self.maxx - self.minx) * (self.maxy - self.miny)
+        cellSize = max(inhibitationDis, math.sqrt(boxArea / numP))
+        X    = np.zeros((numP, 2), dtype=dtype)
+        grid = SeedGrid(self.minx, self.miny, self.maxx, self.maxy, cellSize)
+
+        start = self.startSeeds
+        self.startSeeds = None
+        if start is None or len(start) == 0:
+            start = self.generate_points(1)
+            attempts = 1
+        else:
+            attempts = 0
+        start = np.asarray(start, dtype=dtype)[:numP]
+        X[:len(start)] = start
+        for i, (x, y) in enumerate(start.tolist()):
+            grid.insert(i, x, y)
+        placed = len(start)
+
+        monitor = self.jamming
+        if monitor is not None:
+            monitor.reset()
+
+        t0 = time.time()
+        status, placed, attempts, rejects, peakBytes = self.fill_blocks(
+            X, placed, grid, inhibitationDis, self.draw_candidates, timeout, batchSize, attempts, monitor)
+
+        run_time = time.time() - t0
+        self._record_run_stats(status, run_time, placed, attempts, rejects, A, monitor)
+        self.lastRunStats["PeakMem_MB"] = max(peakBytes, X.nbytes + grid.nbytes) / 2**20
+
+        self._store_run(X, numP, ratio)
+
+        return status, run_time, attempts, rejects
+
+    def fill_blocks(self, X, placed, grid, inhibitationDis, draw, timeout, batchSize=16384, attempts=0, monitor=None):
+        """
+        Block-wise SSI loop of exampleRun_SSI_highN, also used by tiledSSI to fill the tile
+        seams around seeds that are already placed.
+
+        Parameters:
+            X (np.ndarray): (numP, 2) seed array, rows [0, placed) are already set and in grid.
+            placed (int): Seeds already placed.
+            grid (SeedGrid): Index of the placed seeds, cell side >= inhibitationDis.
+            inhibitationDis (float): Inhibition distance.
+            draw (callable): draw(n) -> (m, 2) candidates in draw order, e.g. self.draw_candidates.
+            timeout (float): Seconds before the loop stops with status "Timeout".
+            batchSize (int): n passed to draw per block.
+            attempts (int): Attempts made before the loop (counted on in the result).
+            monitor (JammingMonitor, optional): Early "Jammed" stop, already reset by the caller.
+
+        Returns:
+            (status, placed, attempts, rejects, peakBytes): peakBytes is the largest footprint
+            of X, the grid and one block of candidates during the loop.
+        """
+        numP = len(X)
+        itemsize = X.dtype.itemsize
+        peakBytes = X.nbytes + grid.nbytes
+        rejects = 0
+
+        t0 = time.time()
+        status = "Completed"
 
-        # save CSV of the final configuration
+        while placed < numP:
+            if time.time() - t0 >= timeout:
+                status = "Timeout"
+                break
+
+            if monitor is not None and attempts >= monitor.nextCheck:
+                monitor.nextCheck = attempts + monitor.checkEvery
+                if monitor.is_jammed(placed, attempts, numP):
+                    status = "Jammed"
+                    break
+
+            cand = draw(batchSize).astype(X.dtype).astype(np.float64)
+            if len(cand) == 0:
+                continue
+            peakBytes = max(peakBytes, X.nbytes + grid.nbytes
+                            + len(cand) * (16 + grid.slots.shape[1] * (4 + 2 * itemsize + 17)))
+
+            # Bulk test against the seeds placed before this block
+            free = ~grid.conflicts(cand, X, inhibitationDis)
+
+            # Resolve conflicts inside the block in draw order
+            local = SpatialHashGrid(grid.minx, grid.miny, grid.cellSize)
+            placedBefore = placed
+            used = len(cand)
+            for k in np.flatnonzero(free).tolist():
+                x, y = cand[k]
+                if local.has_neighbour_within(x, y, inhibitationDis):
+                    continue
+                X[placed] = (x, y)
+                grid.insert(placed, x, y)
+                local.insert(x, y)
+                placed += 1
+                if monitor is not None:
+                    monitor.accepted(attempts + k + 1)
+                if placed == numP:
+                    used = k + 1 # candidates after this one were never needed
+                    break
+
+            attempts += used
+            rejects  += used - (placed - placedBefore)
+
+        return status, placed, attempts, rejects, peakBytes
+
+    def exampleRun_SSI_freeRegion(self, numP, ratio, timeout, batchSize=1024, minAcceptRate=0.25):
+        """
+        SSI run that only draws candidates where a seed can still be placed.
+
+        A FreeRegionTracker keeps square cells covering the uncovered part of the polygon.
+        Candidates are drawn uniformly over those cells in blocks of `batchSize` and each one
+        is accepted or rejected in draw order against the placed seeds (spatial hash), exactly
+        like exampleRun_SSI_withRejects. Whenever the acceptance rate of a block falls below
+        `minAcceptRate`, covered cells are dropped and, if that does not free enough, the cells
+        are refined. The attempts per accepted seed therefore stay bounded up to the jamming
+        limit, where the tracker runs out of cells and the run ends as "Jammed" with a maximal
+        (saturated) pattern.
+
+        Parameters:
+            numP (int): Number of seeds to generate.
+            ratio (float): Ratio used to determine inhibition distance relative to theoretical spacing.
+            timeout (float): Seconds before the run is stopped with status "Timeout".
+            batchSize (int): Candidates drawn per block.
+            minAcceptRate (float): Block acceptance rate that triggers pruning/refinement.
+
+        Returns:
+            status (str): "Completed", "Timeout" or "Jammed" (no free space left for numP seeds)
+            run_time (float): seconds from first placement to finish/timeout
+            attempts (int): how many candidates inside the polygon were tested
+            rejects  (int): how many of those candidates were discarded
+        """
+        A                 = self.getArea() # Exact area of any polygon
+        seedMax           = self.SeedMaxDis(A, numP)
+        inhibitationDis   = ratio * seedMax
+
+        X       = np.zeros((numP, 2))
+        grid    = SpatialHashGrid(self.minx, self.miny, inhibitationDis)
+        placed, attempts = self._place_start_seeds(X, grid)
+        rejects = 0
+
+        tracker = FreeRegionTracker(self.domain, inhibitationDis)
+        tracker.prune(X[:placed])
+
+        t0 = time.time()
+        status = "Completed"
+
+        while placed < numP:
+            if time.time() - t0 >= timeout:
+                status = "Timeout"
+                break
+
+            if len(tracker) == 0:
+                status = "Jammed" # every point of the polygon is inside an exclusion disk
+                break
+
+            cand = tracker.sample(self.rng, batchSize)
+            # always filter, the last row/column of cells overhangs maxx/maxy even on rectangles
+            cand = cand[self.domain.contains_points(cand)]
+
+            placedBefore = placed
+            used = len(cand)
+            for k in range(len(cand)):
+                x, y = cand[k]
+                if grid.has_neighbour_within(x, y, inhibitationDis):
+                    continue
+                X[placed] = (x, y)
+                grid.insert(x, y)
+                placed += 1
+                if placed == numP:
+                    used = k + 1
+                    break
+
+            attempts += used
+            rejects  += used - (placed - placedBefore)
+
+            # Shrink the sampling region when most draws are wasted
+            if used and (placed - placedBefore) < minAcceptRate * used:
+                before = tracker.area()
+                tracker.prune(X[:placed])
+                if tracker.area() > 0.5 * before:
+                    tracker.refine(X[:placed])
+
+        run_time = time.time() - t0
+        self._record_run_stats(status, run_time, placed, attempts, rejects, A, None)
+        self.lastRunStats["FreeArea"] = tracker.area() # upper bound of the uncovered area
+        if status == "Jammed":
+            self.lastRunStats["EstMaxSeeds"] = placed
+
+        self._store_run(X, numP, ratio)
+
+        return status, run_time, attempts, rejects
+
+    def exampleRun_Bridson(self, numP, ratio, timeout, k=16, eps=1e-3, batchSize=1024):
+        """
+        Runs one seed generation attempt using Bridson's Poisson-disk sampler and saves the
+        result in the same folder layout as the SSI runs (file prefix "Bridson").
+
+        The inhibition distance is computed exactly like SSI (ratio * SeedMaxDis), so the same
+        numP/ratio inputs can be swept. Bridson keeps an "active list" of seeds: k candidates
+        at distance r*(1+eps) around a random active seed (evenly spaced angles, random phase)
+        are tested, the first one inside the polygon and farther than r from every seed is
+        accepted and becomes active, and a seed with no valid candidate is retired. Placing
+        candidates right outside r packs the seeds tighter than the [r, 2r] annulus of the
+        original paper, so the panel holds more seeds than SSI can place before it jams.
+
+        The front is grown until the polygon is full, not until numP seeds exist: a front
+        stopped at numP only covers the part of the panel around its start seed. When every
+        front has died, a FreeRegionTracker looks for the spots the fronts could not reach
+        (narrow necks, gaps between fronts) and restarts a front there, so "Saturated" means
+        no free spot is left. numP seeds are then picked uniformly from the saturated set,
+        which keeps the minimum spacing and spreads them over the whole polygon.
+
+        A background grid with cell size r/sqrt(2) holds at most one seed per cell, so each
+        check only looks at a 5x5 block of cells. The work follows the saturated count
+        (about A/r^2), not numP, so at low ratios the SSI samplers are cheaper; Bridson is
+        for the high ratios where SSI slows down or jams.
+
+        Parameters:
+            numP (int): Number of seeds to generate.
+            ratio (float): Ratio used to determine inhibition distance relative to theoretical spacing.
+            timeout (float): Seconds before the run is stopped with status "Timeout".
+            k (int): Candidates tried around an active seed before it is retired.
+            eps (float): Relative gap between r and the candidate ring.
+            batchSize (int): Candidates drawn per block when looking for free spots.
+
+        Returns:
+            status (str): "Completed", "Saturated" (polygon is full before numP seeds fit) or "Timeout"
+            run_time (float): seconds from first placement to finish/timeout
+            attempts (int): how many candidates were drawn
+            rejects  (int): how many of those candidates were discarded
+        """
+        # Define the method to be used, this only define the name, not the algorithm
+        self.method = "Bridson"
+
+        A                 = self.getArea() # Exact area of any polygon
+        seedMax           = self.SeedMaxDis(A, numP)
+        r                 = ratio * seedMax
+        r2                = r * r
+
+        # Background grid, one seed index per cell (-1 = empty), padded by 2 cells on every
+        # side so the 5x5 block of any point of the bounding box is a plain index offset
+        cell = r / math.sqrt(2) if r > 0 else max(self.maxx - self.minx, self.maxy - self.miny)
+        nx = int(math.ceil((self.maxx - self.minx) / cell)) + 1
+        ny = int(math.ceil((self.maxy - self.miny) / cell)) + 1
+        grid = np.full((nx + 4, ny + 4), -1, dtype=np.int64)
+        offsets = np.array([(i, j) for i in range(-2, 3) for j in range(-2, 3)]).T
+
+        S        = np.zeros((nx * ny, 2)) # saturated set, at most one seed per cell
+        n        = 0
+        attempts = 0
+        active   = []
+        ring     = 2 * math.pi * np.arange(k) / k
+
+        def free(c):
+            ci = ((c[:, 0] - self.minx) / cell).astype(np.int64) + 2
+            cj = ((c[:, 1] - self.miny) / cell).astype(np.int64) + 2
+            idx = grid[ci[:, None] + offsets[0], cj[:, None] + offsets[1]]
+            d = S[idx] - c[:, None, :]
+            return ~(((d * d).sum(axis=2) <= r2) & (idx >= 0)).any(axis=1)
+
+        def add(x, y):
+            nonlocal n
+            S[n] = (x, y)
+            grid[int((x - self.minx) / cell) + 2, int((y - self.miny) / cell) + 2] = n
+            active.append(n)
+            n += 1
+
+        first = self.generate_points(1)[0]
+        add(first[0], first[1])
+        attempts = 1
+        tracker = None
+
+        t0 = time.time()
+        status = "Saturated"
+
+        while True:
+            if time.time() - t0 >= timeout:
+                status = "Timeout"
+                break
+
+            if not active:
+                # Every front died out, restart one in a spot they could not reach
+                if tracker is None:
+                    tracker = FreeRegionTracker(self.domain, r)
+                tracker.prune(S[:n])
+                if len(tracker) == 0:
+                    break
+                cand = tracker.sample(self.rng, batchSize)
+                cand = cand[self.domain.contains_points(cand)]
+                attempts += len(cand)
+                ok = np.flatnonzero(free(cand)) if len(cand) else []
+                if len(ok):
+                    add(cand[ok[0], 0], cand[ok[0], 1])
+                elif not tracker.refine(S[:n]):
+                    break # what is left is below the tracker resolution
+                continue
+
+            j = self.rng.integers(len(active))
+            a = active[j]
+            ang = ring + self.rng.uniform(0, 2 * math.pi)
+            cand = np.column_stack((S[a, 0] + r * (1 + eps) * np.cos(ang),
+                                    S[a, 1] + r * (1 + eps) * np.sin(ang)))
+            attempts += k
+            inside = np.flatnonzero(self.domain.contains_points(cand))
+            ok = inside[free(cand[inside])] if len(inside) else inside
+            if len(ok):
+                add(cand[ok[0], 0], cand[ok[0], 1])
+            else:
+                active[j] = active[-1] # retire the seed, swap with the last one, O(1)
+                active.pop()
+
+        X = np.zeros((numP, 2))
+        if n >= numP and status == "Saturated":
+            status = "Completed"
+            # Uniform thinning of the saturated set, keeps the spacing and the coverage
+            X[:] = S[np.sort(self.rng.choice(n, size=numP, replace=False))]
+        else:
+            X[:min(n, numP)] = S[:min(n, numP)]
+        placed = min(n, numP)
+        rejects = attempts - n
+
+        run_time = time.time() - t0
+        self._record_run_stats(status, run_time, placed, attempts, rejects, A, None)
+        if status != "Timeout":
+            self.lastRunStats["EstMaxSeeds"] = n # measured, the polygon holds no more seeds
+            self.lastRunStats["FreeArea"] = tracker.area() if tracker is not None else 0.0
+
+        self._store_run(X, numP, ratio)
+
+        return status, run_time, attempts, rejects
+
+    def _place_start_seeds(self, X, grid):
+        """
+        Fill the first rows of X (and the grid) at the start of an SSI run: one uniform seed,
+        or the seeds of self.startSeeds when a run is resumed (then cleared).
+
+        Returns:
+            (int, int): placed seeds and attempts made so far.
+        """
+        start = self.startSeeds
+        self.startSeeds = None
+        if start is None or len(start) == 0:
+            X[0] = self.generate_points(1)[0]
+            grid.insert(X[0, 0], X[0, 1])
+            return 1, 1
+
+        start = np.asarray(start, dtype=float)[:len(X)]
+        X[:len(start)] = start
+        for x, y in start:
+            grid.insert(x, y)
+        return len(start), 0
+
+    def _record_run_stats(self, status, run_time, placed, attempts, rejects, area, monitor):
+        """
+        Fill self.lastRunStats at the end of a run. The estimates are only available when the
+        run used a JammingMonitor, they are left empty otherwise.
+        """
+        self.lastRunStats = {"Status": status, "Time_s": run_time,
+                             "Attempts": attempts, "Rejects": rejects,
+                             "Placed": placed, "EstMaxSeeds": "", "FreeArea": ""}
+        if monitor is not None:
+            self.lastRunStats.update(monitor.stats(placed, attempts, area))
+
+    def exampleRun(self, numP, ratio, timeout):
+        """
+        Run one seed generation attempt with the sampler named by self.method.
+
+        Supported methods:
+            "SSI"         -> exampleRun_SSI_withRejects
+            "SSI_batched" -> exampleRun_SSI_batched
+            "SSI_freeRegion" -> exampleRun_SSI_freeRegion
+            "SSI_highN"   -> exampleRun_SSI_highN
+            "Bridson"     -> exampleRun_Bridson
+
+        With self.cache set, a run started right after reseed(int) (no profiler, no start seeds)
+        is looked up first: on a hit the cached seeds and run stats of the original run become
+        lastSeeds / lastRunStats and nothing is sampled or saved. lastRunStats["Cache"] is
+        "hit" or "miss", completed misses are added to the cache.
+
+        Returns:
+            (status, run_time, attempts, rejects), see the individual samplers.
+        """
+        samplers = {
+            "SSI": self.exampleRun_SSI_withRejects,
+            "SSI_batched": self.exampleRun_SSI_batched,
+            "SSI_freeRegion": self.exampleRun_SSI_freeRegion,
+            "SSI_highN": self.exampleRun_SSI_highN,
+            "Bridson": self.exampleRun_Bridson,
+        }
+        if self.method not in samplers:
+            raise ValueError(f"Unknown method '{self.method}', expected one of {list(samplers)}")
+        if self.profiler is not None:
+            self.profiler.reset(numP)
+
+        cache = self.cache
+        if cache is not None and not (self.freshStream and self.profiler is None and self.startSeeds is None):
+            cache = None # the result does not follow from the seed alone
+        if cache is not None:
+            key = cache.key_for(self, numP, ratio)
+            hit = cache.get(key)
+            if hit is not None:
+                self.lastSeeds, stats = hit
+                self.lastRunStats = dict(stats, Cache="hit")
+                self.freshStream = False
+                return stats["Status"], stats["Time_s"], stats["Attempts"], stats["Rejects"]
+
+        result = samplers[self.method](numP, ratio, timeout)
+        if cache is not None:
+            self.lastRunStats["Cache"] = "miss"
+            if result[0] == "Completed":
+                cache.put(key, self.lastSeeds, self.lastRunStats)
+        return result
+
+    def iterSeedSets(self, numP, ratio, timeout, samples=None, seeds=None, save=False):
+        """
+        Generator version of exampleRun: runs the sampler named by self.method again and again
+        and yields every finished seed set as soon as it is done, instead of only writing it to
+        disk. The caller decides what to do with it (analysis in memory, a SeedArchive, mesh
+        generation, ...).
+
+        Parameters:
+            numP (int): Number of seeds per set.
+            ratio (float): Ratio used to determine inhibition distance relative to theoretical spacing.
+            timeout (float): Seconds per run before it is stopped with status "Timeout".
+            samples (int, optional): Number of runs, None runs until the caller stops iterating.
+            seeds (list of int, optional): One seed per run (e.g. sweepRunner.spawn_seeds), the
+                                           run i is then replayable with reseed(seeds[i]).
+            save (bool): Also store every set with saveSeeds (CSV tree or self.sink). Sets
+                         served by self.cache were stored before and are not saved again.
+
+        Yields:
+            (X, info): X is the (numP, 2) seed array (unplaced rows of a timed-out run are zero),
+                       info the run info dict (Method, numP, Width, Height, Ratio, Seed, Sample,
+                       Status, Time_s, Attempts, Rejects, Placed, ... and Location when saved, None for a cache hit).
+        """
+        runs = itertools.count() if samples is None else range(samples)
+        for sample in runs:
+            if seeds is not None:
+                self.reseed(seeds[sample])
+
+            autosave = self.autosave
+            self.autosave = False
+            try:
+                self.exampleRun(numP, ratio, timeout)
+            finally:
+                self.autosave = autosave
+
+            X = self.lastSeeds
+            info = self._run_info(numP, ratio)
+            info["Sample"] = sample
+            if save:
+                cached = self.lastRunStats.get("Cache") == "hit"
+                info["Location"] = None if cached else self.saveSeeds(X, numP, ratio)
+            yield X, info
+
+    def _store_run(self, X, numP, ratio):
+        """
+        Keep the seeds of the run that just finished and save them unless autosave is off.
+        """
+        self.lastSeeds = X
+        self.freshStream = False
+        prof = self.profiler
+        if self.autosave:
+            if prof is None:
+                self.saveSeeds(X, numP, ratio)
+            else:
+                prof.wrap("io", self.saveSeeds)(X, numP, ratio)
+        if prof is not None:
+            self.lastRunStats["Profile"] = prof.stats(self.lastRunStats.get("Time_s", 0.0))
+
+    def _run_info(self, numP, ratio):
+        """
+        Parameters and stats of the last run, as handed to sinks and catalogs.
+        """
+        info = {"Method": self.method, "numP": numP,
+                "Width": self.maxx - self.minx, "Height": self.maxy - self.miny,
+                "Ratio": ratio, "Seed": self.seed}
+        info.update(self.lastRunStats)
+        return info
+
+    def saveSeeds(self, X, numP, ratio):
+        """
+        Store the seeds of the run that just finished.
+
+        Without a sink (self.sink is None) this is the legacy CSV tree (saveSeedsCSV). With a
+        sink, e.g. a SeedArchive, the seeds and the run info (method, size, ratio, seed and
+        self.lastRunStats) are handed to sink.save(X, info) instead. When self.catalog is set,
+        the stored set is also registered there.
+
+        Returns:
+            str: Location of the stored seeds (CSV path or sink reference).
+        """
+        info = self._run_info(numP, ratio)
+
+        if self.sink is None:
+            location = self.saveSeedsCSV(X, numP, ratio)
+        else:
+            location = self.sink.save(X, info)
+
+        if self.catalog is not None:
+            self.catalog.register(location, X, info)
+        return location
+
+    def saveSeedsCSV(self, X, numP, ratio):
+        """
+        Save a seed configuration to CSV in the structured folder system
+        assetss/csvFile/<width>x<height>/numP_<numP>/ratio_<ratio>/<method>_<index>.csv
+
+        Parameters:
+            X (np.ndarray): (numP, 2) seed coordinates.
+            numP (int): Number of seeds requested for the run.
+            ratio (float): Ratio used for the run.
+
+        Returns:
+            str: Path of the written CSV file.
+        """
         w,h = self.maxx - self.minx, self.maxy - self.miny
         base = os.path.join("assetss","csvFile",
                             f"{w}x{h}", f"numP_{numP}",
                             f"ratio_{ratio:.3f}")
         os.makedirs(base, exist_ok=True) #if not exists,create the directory
 
-
-        fn = f"{self.method}_{len(os.listdir(base))}.csv"
-        np.savetxt(os.path.join(base,fn), X, delimiter=",")
+        # The folder is only listed the first time it is used by this process, after that
+        # the next index is remembered. Exclusive create still guards against other
+        # processes writing to the same folder.
+        index = _nextCSVIndex.get(base)
+        if index is None:
+            index = len(os.listdir(base))
+        while True:
+            fn = f"{self.method}_{index}.csv"
+            path = os.path.join(base, fn)
+            try:
+                f = open(path, "x")
+            except FileExistsError:
+                index += 1
+                continue
+            with f:
+                np.savetxt(f, X, delimiter=",")
+            break
+        _nextCSVIndex[base] = index + 1
         print("Saved", fn , "to", base)
 
-        return status, run_time, attempts, rejects
+        return path
 
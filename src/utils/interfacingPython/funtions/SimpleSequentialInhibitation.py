@@ -1,14 +1,15 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.spatial.distance import pdist, squareform
-from matplotlib.path import Path
 import seedMaxDis as smd
-from scipy.spatial import KDTree
+from polygonDomain import PolygonDomain
+from functools import lru_cache
 import os
 from datetime import datetime
 import time
 
-def csbinproc(xp, yp, n):
+# Stream of the calls without an rng, seeded from OS entropy once per process
+_defaultRng = np.random.default_rng()
+
+def csbinproc(xp, yp, n, rng=None):
     """
     Generate homogeneous 2-D Poisson process within a polygon.
     
@@ -16,10 +17,16 @@ def csbinproc(xp, yp, n):
         xp (list or np.ndarray): x-coordinates of the polygon vertices.
         yp (list or np.ndarray): y-coordinates of the polygon vertices.
         n (int): Number of points to generate.
+        rng (np.random.Generator, optional): Random stream to draw from. Pass the same
+            Generator on every call of a run to make the run reproducible. Without one the
+            module-level default stream is used.
 
     Returns:
         x, y: Coordinates of the points generated inside the polygon.
     """
+    if rng is None:
+        rng = _defaultRng
+
     x = []
     y = []
     
@@ -30,14 +37,19 @@ def csbinproc(xp, yp, n):
     # Which only possible when in_polygon returns True    
     while len(x) < n:
         # Generate random points within the bounding box of the polygon
-        xt = np.random.uniform(minx, maxx)
-        yt = np.random.uniform(miny, maxy)
+        xt = rng.uniform(minx, maxx)
+        yt = rng.uniform(miny, maxy)
         if in_polygon(xt, yt, xp, yp) == True:
             x.append(xt)
             y.append(yt)
     
     return np.array(x), np.array(y)
 
+@lru_cache(maxsize=32)
+def _domain(xp, yp):
+    """PolygonDomain for a vertex list, built once and reused by every in_polygon call."""
+    return PolygonDomain(xp, yp)
+
 def in_polygon(x, y, xp, yp):
     """
     Check if a point (x, y) is inside a polygon defined by vertices (xp, yp).
@@ -53,37 +65,37 @@ def in_polygon(x, y, xp, yp):
     bool: True if the point is inside the polygon, False otherwise
     """
    
-    # Create a Path object from the vertices
-    # This function stacks the xp,and yp array into an array of shape (n, 2)
-    # Where n is the number of vertices (eg, 5 for polygon)
-    polygon = Path(np.column_stack((xp, yp)))
+    # The domain (rectangle check or Path) is cached per vertex list,
+    # so it is not rebuilt for every point that is tested
+    return _domain(tuple(xp), tuple(yp)).contains(x, y)
 
-    # Check if the point is inside the polygon (Boolean output)
-    return polygon.contains_point((x, y))
+def main(seed=None):
+    # Plotting and SciPy are imported by the examples only, importing this module stays headless
+    import matplotlib.pyplot as plt
+    from scipy.spatial.distance import pdist
 
-def main():
     # Parameters
     ratio = 0.1
     n = 314
-    A = 50 * 50  # Basal area
+    # Vertices of the region, any polygon works
+    rx = [0, 50, 50, 0, 0]
+    ry = [0, 0, 50, 50, 0]
+    A = _domain(tuple(rx), tuple(ry)).area  # Exact (shoelace) area of the region
     r=smd.seedMaxDis(A, n)
     print("Seed max dis", r)
       
     s = ratio * r
     print("Inhibitation Distance/Minimum dis between seeds", s)
 
-    # Generate the vertices for the regions
-    rx = [0, 50, 50, 0,0]
-    ry = [0, 0, 50, 50,0]
-
     # Generate the first event
+    rng = np.random.default_rng(seed) # Same seed -> same seed set
     X = np.zeros((n, 2))
-    X[0, :] = np.column_stack(csbinproc(rx, ry, 1))[0]
+    X[0, :] = np.column_stack(csbinproc(rx, ry, 1, rng))[0]
     i = 1 # Counter for the number of events
 
     # Generate other events
     while i < n:
-        sx, sy = csbinproc(rx, ry, 1)
+        sx, sy = csbinproc(rx, ry, 1, rng)
         xt = np.vstack(([sx[0], sy[0]], X[:i, :]))
         dist = pdist(xt)
         ind = np.where(dist[:i] <= s)[0]
@@ -110,23 +122,26 @@ def main():
     np.savetxt("test02.csv", np.hstack((X, np.zeros((X.shape[0], 1)))), delimiter=",")
     
 
-def main2():
+def main2(seed=None):
     #Implementation uisng KDTree for distance checking
+    import matplotlib.pyplot as plt
+    from scipy.spatial import KDTree
+
     # Parameters
     ratio = 0.5
     n = 314
-    A = 50 * 50  # Area of the bounding polygon
+    # Vertices of the region, any polygon works
+    rx = [0, 50, 50, 0, 0]
+    ry = [0, 0, 50, 50, 0]
+    A = _domain(tuple(rx), tuple(ry)).area  # Exact (shoelace) area of the region
     r = smd.seedMaxDis(A, n)
     print("Seed max distance:", r)
     s = ratio * r
 
-    # Define the vertices of the bounding polygon
-    rx = [0, 50, 50, 0, 0]
-    ry = [0, 0, 50, 50, 0]
-
     # Initialize storage for points
+    rng = np.random.default_rng(seed) # Same seed -> same seed set
     X = np.zeros((n, 2))
-    X[0, :] = np.column_stack(csbinproc(rx, ry, 1))[0]  # First point
+    X[0, :] = np.column_stack(csbinproc(rx, ry, 1, rng))[0]  # First point
     tree = KDTree(X[:1, :])  # Initialize KDTree with the first point
     i = 1
 
@@ -135,7 +150,7 @@ def main2():
     attempts = 0
 
     while i < n:
-        sx, sy = csbinproc(rx, ry, 1)  # Generate a random point inside the polygon
+        sx, sy = csbinproc(rx, ry, 1, rng)  # Generate a random point inside the polygon
         dist, _ = tree.query([sx[0], sy[0]])  # Query nearest point distance
         
         if dist > s:  # Check if the point satisfies the minimum distance
@@ -153,25 +168,28 @@ def main2():
     plt.grid(True)
     plt.show()
 
-def main3():
+def main3(seed=None):
     # Example for plotting the points as they are generated, hence "Interactive"
+    import matplotlib.pyplot as plt
+    from scipy.spatial.distance import pdist
 
     # Parameters
     ratio = 0.1
     n = 314
-    A = 50 * 50  # Basal area
+    # Vertices of the region, any polygon works
+    rx = [0, 50, 50, 0, 0]
+    ry = [0, 0, 50, 50, 0]
+    A = _domain(tuple(rx), tuple(ry)).area  # Exact (shoelace) area of the region
     r = smd.seedMaxDis(A, n)
     print("Seed max dis", r)
       
     s = ratio * r
     print("Inhibitation Distance/Minimum dis betwwen seeds", s)
-    # Generate the vertices for the regions
-    rx = [0, 50, 50, 0, 0]
-    ry = [0, 0, 50, 50, 0]
 
     # Generate the first event
+    rng = np.random.default_rng(seed) # Same seed -> same seed set
     X = np.zeros((n, 2))
-    X[0, :] = np.column_stack(csbinproc(rx, ry, 1))[0]
+    X[0, :] = np.column_stack(csbinproc(rx, ry, 1, rng))[0]
     i = 1  # Counter for the number of events
 
     # Set up the plot
@@ -190,7 +208,7 @@ def main3():
     while i < n:
 
         # Generate a random point inside the rx,ry region
-        sx, sy = csbinproc(rx, ry, 1)
+        sx, sy = csbinproc(rx, ry, 1, rng)
 
         #Prepare input for pdist() for checking pairwise distances
         xt = np.vstack(([sx[0], sy[0]], X[:i, :]))
@@ -224,24 +242,26 @@ def main3():
     plt.show()
 
 
-def main4(ratio):
+def main4(ratio, seed=None):
     #Example run for multiple ratios
+    from scipy.spatial.distance import pdist
 
     # Parameters
     n = 314
-    A = 50 * 50  # Basal area
+    # Vertices of the region, any polygon works
+    rx = [0, 50, 50, 0, 0]
+    ry = [0, 0, 50, 50, 0]
+    A = _domain(tuple(rx), tuple(ry)).area  # Exact (shoelace) area of the region
     r = smd.seedMaxDis(A, n)
    
       
     s = ratio * r
    
-    # Generate the vertices for the regions
-    rx = [0, 50, 50, 0, 0]
-    ry = [0, 0, 50, 50, 0]
 
     # Generate the first event
+    rng = np.random.default_rng(seed) # Same seed -> same seed set
     X = np.zeros((n, 2))
-    X[0, :] = np.column_stack(csbinproc(rx, ry, 1))[0]
+    X[0, :] = np.column_stack(csbinproc(rx, ry, 1, rng))[0]
     i = 1  # Counter for the number of events
 
     
@@ -250,7 +270,7 @@ def main4(ratio):
     while i < n:
 
         # Generate a random point inside the rx,ry region
-        sx, sy = csbinproc(rx, ry, 1)
+        sx, sy = csbinproc(rx, ry, 1, rng)
 
         #Prepare input for pdist() for checking pairwise distances
         xt = np.vstack(([sx[0], sy[0]], X[:i, :]))
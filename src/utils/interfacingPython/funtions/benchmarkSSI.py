@@ -0,0 +1,253 @@
+"""
+Benchmark and regression suite of the seed-generation hot path.
+
+    python benchmarkSSI.py                  # run, save assetss/benchmarks/bench_<ts>.json, compare to the baseline
+    python benchmarkSSI.py --save-baseline  # run and make the result the new baseline
+    python benchmarkSSI.py --quick          # n = 314 only, short timeout
+
+Every benchmark uses a fixed seed, so attempts and placed seeds of the full runs are
+deterministic: a change in those numbers means the sampler behaves differently, a drop in the
+rates means it got slower.
+"""
+import numpy as np
+import os, sys, json, time, math, platform, argparse, tracemalloc, subprocess
+from datetime import datetime
+import PointAllocationProcess as Process
+from spatialHashGrid import SpatialHashGrid
+
+BASE_DIR      = os.path.join("assetss", "benchmarks")
+BASELINE_PATH = os.path.join(BASE_DIR, "baseline.json")
+
+RATIOS = (0.1, 0.2, 0.3, 0.4, 0.5)
+SIZES  = (314, 1000, 10000)
+SEED   = 12345
+
+# Modules a headless pool worker imports, they must not pull in SciPy or matplotlib
+WORKER_MODULES = ("PointAllocationProcess", "sweepRunner", "tiledSSI")
+
+SQUARE = ([0,50,50,0,0], [0,0,50,50,0])
+LSHAPE = ([0,50,50,25,25,0], [0,0,25,25,50,50])
+
+
+def _panel(numP):
+    """Square panel with the seed density of the 50x50 / 314 runs, so ratios mean the same for every n."""
+    side = 50 * math.sqrt(numP / 314)
+    return [0, side, side, 0, 0], [0, 0, side, side, 0]
+
+
+def _timed(fn, minTime=0.1, rounds=3):
+    """
+    Call fn until minTime has passed, `rounds` times, and keep the fastest round
+    (the least disturbed by other load on the machine). Returns (calls, seconds).
+    """
+    best = None
+    for _ in range(rounds):
+        calls = 0
+        t0 = time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            dt = time.perf_counter() - t0
+            if dt >= minTime:
+                break
+        if best is None or calls / dt > best[0] / best[1]:
+            best = (calls, dt)
+    return best
+
+
+def bench_generate_points(n=10_000):
+    runner = Process.PointAllocationProcess(*SQUARE, rng=SEED)
+    calls, dt = _timed(lambda: runner.generate_points(n))
+    return {"points_per_s": calls * n / dt}
+
+
+def bench_draw_candidates(n=10_000):
+    runner = Process.PointAllocationProcess(*LSHAPE, rng=SEED)
+    calls, dt = _timed(lambda: runner.draw_candidates(n))
+    return {"draws_per_s": calls * n / dt}
+
+
+def bench_in_polygon(polygon, n=10_000):
+    runner = Process.PointAllocationProcess(*polygon, rng=SEED)
+    pts = runner.rng.uniform(-5, 55, (n, 2)).tolist()
+    calls, dt = _timed(lambda: [runner.in_polygon(x, y) for x, y in pts])
+    return {"tests_per_s": calls * n / dt}
+
+
+def bench_inhibition_check(numP=314, ratio=0.4, n=10_000):
+    """has_neighbour_within against a grid holding a complete seed set."""
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI_batched", rng=SEED)
+    runner.autosave = False
+    runner.exampleRun(numP, ratio, 60)
+    r = ratio * runner.SeedMaxDis(runner.getArea(), numP)
+    grid = SpatialHashGrid(runner.minx, runner.miny, r)
+    for x, y in runner.lastSeeds:
+        grid.insert(x, y)
+    pts = runner.rng.uniform(0, 50, (n, 2)).tolist()
+    calls, dt = _timed(lambda: [grid.has_neighbour_within(x, y, r) for x, y in pts])
+    return {"checks_per_s": calls * n / dt}
+
+
+def bench_full_run(method, numP, ratio, timeout, memory=True):
+    """
+    One complete run (no file output). Rates are taken from runs without tracemalloc (short
+    runs are repeated, up to 5 times or 0.5 s, and the fastest counts), the peak memory from
+    one more identical run with it.
+    """
+    def run():
+        runner = Process.PointAllocationProcess(*_panel(numP), method, rng=SEED)
+        runner.autosave = False
+        return runner.exampleRun(numP, ratio, timeout), runner.lastRunStats
+
+    total = 0.0
+    for _ in range(5):
+        (status, t, attempts, rejects), stats = run()
+        rt = t if total == 0.0 else min(rt, t)
+        total += t
+        if total >= 0.5:
+            break
+    result = {"status": status, "time_s": rt, "attempts": attempts, "placed": stats["Placed"],
+              "attempts_per_s": attempts / rt if rt > 0 else float("inf"),
+              "seeds_per_s": stats["Placed"] / rt if rt > 0 else float("inf")}
+    if memory:
+        tracemalloc.start()
+        run()
+        result["peak_mem_MB"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result
+
+
+def bench_startup(module, rounds=5):
+    """
+    Start-up cost of a fresh interpreter importing `module`, as paid by every pool worker.
+    Best of `rounds` separate processes: wall time of the whole process and time of the
+    import alone, plus whether SciPy / matplotlib got loaded on the way.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (here, os.environ.get("PYTHONPATH")))))
+    code = (f"import time, sys, json; t = time.perf_counter(); import {module}; "
+            "print(json.dumps([time.perf_counter() - t, 'scipy' in sys.modules, 'matplotlib' in sys.modules]))")
+    best = None
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - t0
+        importTime, scipy, matplotlib = json.loads(out.stdout)
+        if best is None or wall < best["startup_s"]:
+            best = {"startup_s": wall, "import_s": importTime, "scipy": scipy, "matplotlib": matplotlib}
+    return best
+
+
+def run_suite(method="SSI", sizes=SIZES, ratios=RATIOS, timeout=20.0, memory=True):
+    """
+    Run every benchmark.
+
+    Returns:
+        dict: {"meta": {...}, "results": {benchmark name: {metric: value}}}
+    """
+    results = {
+        "generate_points":      bench_generate_points(),
+        "draw_candidates_L":    bench_draw_candidates(),
+        "in_polygon_square":    bench_in_polygon(SQUARE),
+        "in_polygon_L":         bench_in_polygon(LSHAPE),
+        "inhibition_check":     bench_inhibition_check(),
+    }
+    for module in WORKER_MODULES:
+        results[f"startup_{module}"] = bench_startup(module)
+    for numP in sizes:
+        for ratio in ratios:
+            name = f"run_{method}_n{numP}_r{ratio:.2f}"
+            results[name] = bench_full_run(method, numP, ratio, timeout, memory)
+            print(f"{name}: {results[name]['status']} {results[name]['time_s']:.3f}s "
+                  f"{results[name]['attempts_per_s']:.0f} attempts/s")
+
+    meta = {"date": datetime.now().isoformat(timespec="seconds"), "method": method, "seed": SEED,
+            "timeout": timeout, "python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.platform()}
+    return {"meta": meta, "results": results}
+
+
+# Rates (higher is better) and costs (lower is better) compared against the baseline
+_RATES = ("points_per_s", "draws_per_s", "tests_per_s", "checks_per_s", "attempts_per_s", "seeds_per_s")
+_COSTS = ("peak_mem_MB", "startup_s", "import_s")
+# Heavy imports that must stay off the headless start-up path once they are
+_LAZY = ("scipy", "matplotlib")
+# Must match exactly with fixed seeds, unless the run timed out (then they depend on speed)
+_EXACT = ("attempts", "placed")
+
+
+def compare(current, baseline, tolerance=0.2):
+    """
+    Flag regressions of current against baseline.
+
+    Parameters:
+        tolerance (float): Allowed relative slowdown / memory growth before a metric is flagged.
+
+    Returns:
+        list of str: One line per flagged metric, empty if nothing regressed.
+    """
+    flags = []
+    for name, base in baseline["results"].items():
+        cur = current["results"].get(name)
+        if cur is None:
+            continue
+        for m in _RATES:
+            if m in base and m in cur and cur[m] < base[m] * (1 - tolerance):
+                flags.append(f"SLOWER   {name}.{m}: {cur[m]:.4g} vs {base[m]:.4g} ({cur[m] / base[m] - 1:+.0%})")
+        for m in _COSTS:
+            if m in base and m in cur and cur[m] > base[m] * (1 + tolerance):
+                kind = "MEMORY  " if m == "peak_mem_MB" else "STARTUP "
+                flags.append(f"{kind} {name}.{m}: {cur[m]:.4g} vs {base[m]:.4g} ({cur[m] / base[m] - 1:+.0%})")
+        for m in _LAZY:
+            if base.get(m) is False and cur.get(m):
+                flags.append(f"IMPORT   {name}: {m} is imported at start-up again")
+        if base.get("status") == "Completed" and cur.get("status") == "Completed":
+            for m in _EXACT:
+                if m in base and cur.get(m) != base[m]:
+                    flags.append(f"CHANGED  {name}.{m}: {cur.get(m)} vs {base[m]} (same seed, different result)")
+        elif "status" in base and cur.get("status") != base["status"]:
+            flags.append(f"STATUS   {name}: {cur.get('status')} vs {base['status']}")
+    return flags
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed-generation benchmarks with baseline comparison.")
+    parser.add_argument("--method", default="SSI", help="sampler of the full runs (see PointAllocationProcess.exampleRun)")
+    parser.add_argument("--timeout", type=float, default=20.0, help="per-run timeout in seconds")
+    parser.add_argument("--quick", action="store_true", help="n = 314 only and a 5 s timeout")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="relative slowdown that counts as a regression")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    sizes = (314,) if args.quick else SIZES
+    timeout = 5.0 if args.quick else args.timeout
+    current = run_suite(args.method, sizes, RATIOS, timeout, memory=not args.no_memory)
+
+    os.makedirs(BASE_DIR, exist_ok=True)
+    path = os.path.join(BASE_DIR, f"bench_{args.method}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w") as f:
+        json.dump(current, f, indent=1)
+    print(f"✅ Benchmark saved to {path}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=1)
+        print(f"✅ Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline yet, run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    flags = compare(current, baseline, args.tolerance)
+    for line in flags:
+        print("⚠", line)
+    print(f"{len(flags)} regression(s) against {args.baseline}")
+    return 1 if flags else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import numpy as np
+import os, csv
+from concurrent.futures import ProcessPoolExecutor
+from polygonDomain import PolygonDomain
+from voronoiLattice import content_hash, voronoi_cells, LatticeCache
+from seedStatistics import boundary_distance
+from seedCatalog import SeedCatalog
+
+# Columns of the per-set summary table
+METRICS_HEADER = ("Source","Cells","BoundaryCells",
+                  "Area_mean","Area_cv","Perimeter_mean",
+                  "Sides_mean","Sides_min","Sides_max",
+                  "Ligaments","Ligament_mean","Ligament_cv","Ligament_min","Ligament_p05")
+
+
+def cell_metrics(cells, domain):
+    """
+    Geometry of clipped Voronoi cells, computed on one flat vertex array with segment
+    reductions (np.add.reduceat) instead of a loop over the cells.
+
+    Ligaments are the cell edges shared by two cells: every cell edge whose midpoint is not on
+    the panel outline, counted once (the two copies of an edge have the same midpoint).
+
+    Parameters:
+        cells (list of np.ndarray): Counter-clockwise cells (voronoiLattice.voronoi_cells).
+        domain (PolygonDomain): Panel outline.
+
+    Returns:
+        dict: per cell "area", "perimeter", "sides" and "boundary" (cell touches the
+              outline), and "ligaments", the lengths of all ligaments of the panel.
+    """
+    n = len(cells)
+    sizes = np.array([len(c) for c in cells], dtype=np.int64)
+    out = {"area": np.zeros(n), "perimeter": np.zeros(n), "sides": sizes,
+           "boundary": np.zeros(n, dtype=bool), "ligaments": np.zeros(0)}
+    full = np.flatnonzero(sizes >= 3)
+    if len(full) == 0:
+        return out
+
+    V = np.concatenate([cells[k] for k in full])
+    starts = np.concatenate(([0], np.cumsum(sizes[full])[:-1]))
+    nxt = np.arange(1, len(V) + 1)
+    nxt[starts[1:] - 1] = starts[:-1] # last vertex of a cell closes onto its first
+    nxt[-1] = starts[-1]
+    Q = V[nxt]
+
+    cross = V[:, 0] * Q[:, 1] - V[:, 1] * Q[:, 0]
+    length = np.hypot(Q[:, 0] - V[:, 0], Q[:, 1] - V[:, 1])
+    mid = (V + Q) / 2
+    tol = 1e-9 * max(domain.maxx - domain.minx, domain.maxy - domain.miny)
+    onOutline = boundary_distance(mid, domain) <= tol
+
+    out["area"][full] = 0.5 * np.add.reduceat(cross, starts)
+    out["perimeter"][full] = np.add.reduceat(length, starts)
+    out["boundary"][full] = np.add.reduceat(onOutline.astype(np.int64), starts) > 0
+
+    inner = ~onOutline
+    keys = np.round(mid[inner] / (1e3 * tol)).astype(np.int64)
+    _, first = np.unique(keys, axis=0, return_index=True)
+    out["ligaments"] = length[inner][np.sort(first)]
+    return out
+
+
+class MetricsCache(LatticeCache):
+    """
+    LatticeCache layout (<root>/<key[:2]>/<key>.npz, atomic writes) for plain arrays, used
+    to keep the cell metrics of every seed set by content hash.
+    """
+    def __init__(self, root=os.path.join("assetss", "cellMetricsCache")):
+        super().__init__(root)
+
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+
+    def put(self, key, **arrays):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + f".{os.getpid()}.tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path) # readers never see a half-written file
+
+
+def analyze_cells(X, xp, yp, cache=None):
+    """
+    cell_metrics of the clipped Voronoi diagram of one seed set.
+
+    Parameters:
+        X (np.ndarray): (numP, 2) seeds, all-zero rows are ignored.
+        xp, yp (list): Polygon vertices of the panel.
+        cache (MetricsCache, optional): Reuse / store the result by seed content.
+
+    Returns:
+        dict: see cell_metrics.
+    """
+    key = None
+    if cache is not None:
+        key = content_hash(X, np.asarray(xp, dtype=float), np.asarray(yp, dtype=float), "cellMetrics")
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    domain = PolygonDomain(xp, yp)
+    metrics = cell_metrics(voronoi_cells(X, domain), domain)
+    if cache is not None:
+        cache.put(key, **metrics)
+    return metrics
+
+
+def summarize_cells(metrics):
+    """
+    Scalar summary of one set's cell metrics (a METRICS_HEADER row without "Source").
+    """
+    area, sides, lig = metrics["area"], metrics["sides"], metrics["ligaments"]
+    full = sides >= 3
+    row = {"Cells": int(full.sum()), "BoundaryCells": int(metrics["boundary"].sum()),
+           "Area_mean": "", "Area_cv": "", "Perimeter_mean": "",
+           "Sides_mean": "", "Sides_min": "", "Sides_max": "",
+           "Ligaments": len(lig), "Ligament_mean": "", "Ligament_cv": "",
+           "Ligament_min": "", "Ligament_p05": ""}
+    if full.any():
+        a = area[full]
+        row.update({"Area_mean": float(a.mean()), "Area_cv": float(a.std() / a.mean()),
+                    "Perimeter_mean": float(metrics["perimeter"][full].mean()),
+                    "Sides_mean": float(sides[full].mean()), "Sides_min": int(sides[full].min()),
+                    "Sides_max": int(sides[full].max())})
+    if len(lig):
+        row.update({"Ligament_mean": float(lig.mean()), "Ligament_cv": float(lig.std() / lig.mean()),
+                    "Ligament_min": float(lig.min()), "Ligament_p05": float(np.percentile(lig, 5))})
+    return row
+
+
+def _metrics_job(job):
+    source, xp, yp, cacheRoot = job
+    if isinstance(source, dict): # catalog row
+        X = SeedCatalog.load(source)
+    elif isinstance(source, str):
+        X = np.loadtxt(source, delimiter=",", ndmin=2)[:, :2]
+    else:
+        X = source
+    cache = MetricsCache(cacheRoot) if cacheRoot is not None else None
+    return analyze_cells(X, xp, yp, cache)
+
+
+def cell_metrics_batch(sources, xp, yp, cacheRoot=os.path.join("assetss", "cellMetricsCache"), workers=None):
+    """
+    analyze_cells over many seed sets on a process pool (results in input order).
+
+    Parameters:
+        sources (list): CSV paths, (numP, 2) seed arrays or SeedCatalog rows (dicts). The
+                        sets are read inside the workers.
+        cacheRoot (str or None): MetricsCache folder, None disables caching.
+        workers (int): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        list of dict: One cell_metrics result per seed set.
+    """
+    jobs = [(src, xp, yp, cacheRoot) for src in sources]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_metrics_job, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def writeMetricsCSV(sources, results, path):
+    """
+    One summarize_cells row per set, "Source" is the CSV path / catalog location (or the
+    position in the batch for bare arrays).
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=METRICS_HEADER)
+        w.writeheader()
+        for k, (src, metrics) in enumerate(zip(sources, results)):
+            name = src["location"] if isinstance(src, dict) else src if isinstance(src, str) else k
+            w.writerow({"Source": name, **summarize_cells(metrics)})
+    return path
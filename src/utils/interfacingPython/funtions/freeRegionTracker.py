@@ -0,0 +1,119 @@
+import math
+import numpy as np
+
+
+class FreeRegionTracker:
+    def __init__(self, domain, r, minCellSize=None):
+        """
+        Keeps a set of equal-sized square cells that together cover all the space where an SSI
+        seed could still be placed, so candidates are only drawn where they can be accepted.
+
+        The cells start at side r/sqrt(2) over the polygon's bounding box (a seed anywhere in
+        such a cell covers the whole cell). Cells are dropped once they are fully inside one
+        exclusion disk or fully outside the polygon, and all remaining cells are split in 4
+        (adaptive refinement, like one quadtree level at a time) when too few draws land in
+        free space. Since the remaining cells always contain the whole free region and are
+        sampled uniformly by area, an accepted candidate is uniform over the free region,
+        exactly as with plain rejection sampling over the polygon.
+
+        Parameters:
+            domain (PolygonDomain): Sampling domain.
+            r (float): Inhibition distance.
+            minCellSize (float, optional): Cells are not split below this size.
+                                           Defaults to r * 1e-4.
+
+        After initialization, these instance attributes are set:
+            self.x0, self.y0: Lower-left corners of the remaining cells.
+            self.size: Current side length of every cell.
+        """
+        self.domain = domain
+        self.r = r
+        self.r2 = r * r
+
+        w = domain.maxx - domain.minx
+        h = domain.maxy - domain.miny
+        size = r / math.sqrt(2) if r > 0 else max(w, h)
+        self.minCellSize = minCellSize if minCellSize is not None else size * 1e-4
+
+        nx = max(1, int(math.ceil(w / size)))
+        ny = max(1, int(math.ceil(h / size)))
+        gx, gy = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+        self.x0 = domain.minx + gx.ravel() * size
+        self.y0 = domain.miny + gy.ravel() * size
+        self.size = size
+
+        keep = ~domain.cells_outside(self.x0, self.y0, size)
+        self.x0 = self.x0[keep]
+        self.y0 = self.y0[keep]
+
+    def __len__(self):
+        return len(self.x0)
+
+    def area(self):
+        """
+        Total area of the remaining cells (an upper bound of the free area).
+        """
+        return len(self.x0) * self.size * self.size
+
+    def sample(self, rng, n):
+        """
+        Draw n points uniformly over the remaining cells.
+
+        Returns:
+            np.ndarray: (n, 2) array of candidates (some may be outside the polygon
+                        in cells that straddle its boundary).
+        """
+        idx = rng.integers(len(self.x0), size=n)
+        off = rng.uniform(0.0, self.size, size=(n, 2))
+        return np.column_stack((self.x0[idx] + off[:, 0], self.y0[idx] + off[:, 1]))
+
+    def prune(self, seeds):
+        """
+        Drop the cells that lie completely inside the exclusion disk of one seed.
+
+        A seed covering a cell is within r of the cell centre, and with seeds more than r
+        apart at most 7 of them can be that close, so the 7 nearest seeds are enough.
+
+        Parameters:
+            seeds (np.ndarray): (n, 2) placed seeds.
+        """
+        if len(self.x0) == 0 or len(seeds) == 0:
+            return
+        k = min(7, len(seeds))
+        h = self.size
+        from scipy.spatial import KDTree # imported on first refinement, not with the module
+        tree = KDTree(seeds)
+        _, idx = tree.query(np.column_stack((self.x0 + h / 2, self.y0 + h / 2)),
+                            k=k, distance_upper_bound=self.r * (1 + 1e-9))
+        idx = idx.reshape(len(self.x0), k)
+        valid = idx < len(seeds)
+        s = seeds[np.minimum(idx, len(seeds) - 1)]
+
+        # Farthest corner from the seed, per axis
+        dx = np.maximum(np.abs(self.x0[:, None] - s[..., 0]), np.abs(self.x0[:, None] + h - s[..., 0]))
+        dy = np.maximum(np.abs(self.y0[:, None] - s[..., 1]), np.abs(self.y0[:, None] + h - s[..., 1]))
+        covered = (valid & (dx * dx + dy * dy <= self.r2)).any(axis=1)
+
+        self.x0 = self.x0[~covered]
+        self.y0 = self.y0[~covered]
+
+    def refine(self, seeds):
+        """
+        Split every remaining cell in 4, then drop the children that are covered by a seed
+        or outside the polygon.
+
+        Returns:
+            bool: False if the cells are already at minCellSize (nothing was split).
+        """
+        if self.size / 2 < self.minCellSize:
+            return False
+        h = self.size / 2
+        self.x0 = np.concatenate((self.x0, self.x0 + h, self.x0, self.x0 + h))
+        self.y0 = np.concatenate((self.y0, self.y0, self.y0 + h, self.y0 + h))
+        self.size = h
+
+        keep = ~self.domain.cells_outside(self.x0, self.y0, h)
+        self.x0 = self.x0[keep]
+        self.y0 = self.y0[keep]
+        self.prune(seeds)
+        return True
@@ -0,0 +1,82 @@
+from collections import deque
+
+
+class JammingMonitor:
+    def __init__(self, mode="estimate", window=100_000, minAcceptRate=1e-5, checkEvery=5_000):
+        """
+        Decide when an SSI run is jammed (cannot realistically reach numP) from its recent
+        acceptance rate, instead of waiting for the wall-clock timeout.
+
+        The acceptance rate over the last `window` attempts is the fraction of uniform draws that
+        land in still-free space, so rate * Area estimates the remaining free area. Near jamming,
+        random sequential addition of disks follows Feder's law n(inf) - n(t) ~ t^(-1/2), which
+        gives n(inf) ~ placed + 2 * attempts * rate for the maximum achievable count.
+
+        Parameters:
+            mode (str): "rate"     -> jammed when the window acceptance rate drops below minAcceptRate.
+                        "estimate" -> jammed when the estimated maximum count is below numP.
+            window (int): Number of most recent attempts the rate is measured over. Nothing is
+                          judged before one full window, 1e5 attempts take about 1 s with SSI.
+                          On 50 x 50 / 314 seeds a saturated run is flagged after ~1 s, runs
+                          that still complete (ratio <= 0.46) were not flagged, a 5e4 window
+                          already flagged one of those.
+            minAcceptRate (float): Threshold of the "rate" mode.
+            checkEvery (int): Attempts between two checks, keeps the per-attempt cost at one compare.
+        """
+        if mode not in ("rate", "estimate"):
+            raise ValueError(f"Unknown jamming mode '{mode}', expected 'rate' or 'estimate'")
+        self.mode = mode
+        self.window = window
+        self.minAcceptRate = minAcceptRate
+        self.checkEvery = checkEvery
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the history, call at the start of every run.
+        """
+        self.acceptedAt = deque() # attempt numbers of the recent acceptances
+        self.nextCheck = self.checkEvery
+
+    def accepted(self, attempt):
+        """
+        Record that the draw number `attempt` was accepted.
+        """
+        self.acceptedAt.append(attempt)
+
+    def window_rate(self, attempts):
+        """
+        Acceptance rate over the last `window` attempts (or all of them for a young run).
+        """
+        start = attempts - self.window
+        q = self.acceptedAt
+        while q and q[0] <= start:
+            q.popleft()
+        return len(q) / max(1, min(self.window, attempts))
+
+    def estimated_max(self, placed, attempts):
+        """
+        Estimated maximum number of seeds the run can reach (Feder's law extrapolation).
+        """
+        return placed + 2.0 * attempts * self.window_rate(attempts)
+
+    def is_jammed(self, placed, attempts, numP):
+        """
+        Check the stopping rule. Only judges once a full window of attempts has been made.
+
+        Returns:
+            bool: True if the run should stop with status "Jammed".
+        """
+        if attempts < self.window:
+            return False
+        if self.mode == "rate":
+            return self.window_rate(attempts) < self.minAcceptRate
+        return self.estimated_max(placed, attempts) < numP
+
+    def stats(self, placed, attempts, area):
+        """
+        Summary written to the run stats (est. maximum count and est. remaining free area).
+        """
+        rate = self.window_rate(attempts)
+        return {"EstMaxSeeds": placed + 2.0 * attempts * rate,
+                "FreeArea": float(rate * area)}
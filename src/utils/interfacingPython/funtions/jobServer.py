@@ -0,0 +1,462 @@
+import asyncio
+import json
+import os
+import socket
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import PointAllocationProcess as Process
+from jammingMonitor import JammingMonitor
+from seedArchive import SeedArchive
+from seedCatalog import SeedCatalog, normalize_ratio
+
+# Only loopback addresses, the service is for the design tools on the same machine
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+DEFAULT_PORT = 8765
+
+
+class ProgressMonitor(JammingMonitor):
+    def __init__(self, report, jamming=None, interval=0.25):
+        """
+        JammingMonitor that also reports the progress of the run. The SSI samplers call
+        is_jammed(placed, attempts, numP) every checkEvery attempts, every call is forwarded to
+        `report` (at most once per `interval` seconds).
+
+        Parameters:
+            report (callable): report(placed, attempts), called from inside the sampler loop.
+            jamming (dict, optional): JammingMonitor arguments, None never stops a run early.
+            interval (float): Minimum seconds between two reports.
+        """
+        super().__init__(**(jamming or {}))
+        self.report = report
+        self.stopEarly = jamming is not None
+        self.interval = interval
+        self.lastReport = 0.0
+
+    def accepted(self, attempt):
+        if self.stopEarly: # the rate history is only needed to judge jamming
+            super().accepted(attempt)
+
+    def is_jammed(self, placed, attempts, numP):
+        now = time.time()
+        if now - self.lastReport >= self.interval:
+            self.lastReport = now
+            self.report(placed, attempts)
+        return self.stopEarly and super().is_jammed(placed, attempts, numP)
+
+    def stats(self, placed, attempts, area):
+        return super().stats(placed, attempts, area) if self.stopEarly else {}
+
+
+def normalize_request(req):
+    """
+    Check a client request and fill in the defaults.
+
+    Parameters:
+        req (dict): "numP" and "ratio" are required. Optional: "xp"/"yp" (polygon, default
+                    the 50 x 50 square), "holes", "method" (default "SSI"), "timeout" (s,
+                    default 180), "seed" (int, reproducible run), "jamming" (JammingMonitor
+                    arguments), "fresh" (true = never serve from the archive), "includeSeeds"
+                    (default true, false returns only the archive location).
+
+    Returns:
+        dict: The normalized request.
+    """
+    if "numP" not in req or "ratio" not in req:
+        raise ValueError("numP and ratio are required")
+    out = {"xp": [float(v) for v in req.get("xp", [0, 50, 50, 0, 0])],
+           "yp": [float(v) for v in req.get("yp", [0, 0, 50, 50, 0])],
+           "holes": [([float(v) for v in hx], [float(v) for v in hy]) for hx, hy in req.get("holes") or []],
+           "numP": int(req["numP"]), "ratio": normalize_ratio(req["ratio"]),
+           "method": str(req.get("method", "SSI")), "timeout": float(req.get("timeout", 180)),
+           "seed": None if req.get("seed") is None else int(req["seed"]),
+           "jamming": req.get("jamming"), "fresh": bool(req.get("fresh", False)),
+           "includeSeeds": bool(req.get("includeSeeds", True))}
+    if len(out["xp"]) != len(out["yp"]) or len(out["xp"]) < 3:
+        raise ValueError("xp and yp must have the same length (at least 3 vertices)")
+    if out["numP"] <= 0 or out["ratio"] < 0:
+        raise ValueError("numP must be positive and ratio not negative")
+    return out
+
+
+def request_key(req):
+    """
+    Identity of a request for deduplication: everything that changes the result, not the
+    delivery options (includeSeeds) or the timeout.
+    """
+    return json.dumps([req["xp"], req["yp"], req["holes"], req["numP"], req["ratio"],
+                       req["method"], req["seed"], req["jamming"], req["fresh"]], sort_keys=True)
+
+
+def archive_size(req):
+    """
+    (width, height) of the archive group a request can be stored in and served from, None
+    for panels the archive cannot tell apart: its groups are keyed by the bounding box only,
+    so only rectangles at the origin without holes are archived.
+    """
+    if req["holes"]:
+        return None
+    xs, ys = req["xp"], req["yp"]
+    w, h = max(xs), max(ys)
+    corners = {(0.0, 0.0), (w, 0.0), (w, h), (0.0, h)}
+    if min(xs) != 0 or min(ys) != 0 or set(zip(xs, ys)) != corners:
+        return None
+    return (int(w) if w.is_integer() else w), (int(h) if h.is_integer() else h)
+
+
+def _generate_job(job):
+    """
+    Worker entry point, runs one request and stores a completed set in the archive.
+    Must stay at module level so it can be pickled by ProcessPoolExecutor.
+
+    Returns:
+        (np.ndarray, dict, str or None): seeds, run info and archive location (None when
+        the set was not archived).
+    """
+    jobId, req, archiveRoot, progress = job
+
+    def report(placed, attempts):
+        progress.put((jobId, placed, attempts))
+
+    runner = Process.PointAllocationProcess(req["xp"], req["yp"], req["method"], rng=req["seed"],
+                                            holes=req["holes"] or None)
+    runner.jamming = ProgressMonitor(report, req["jamming"])
+    runner.autosave = False
+    runner.exampleRun(req["numP"], req["ratio"], req["timeout"])
+
+    X = runner.lastSeeds
+    info = runner._run_info(req["numP"], req["ratio"])
+    location = None
+    size = archive_size(req)
+    if size is not None and info["Status"] == "Completed":
+        info["Width"], info["Height"] = size
+        runner.sink = SeedArchive(archiveRoot)
+        location = runner.sink.save(X, info)
+    return np.asarray(X, dtype=float), info, location
+
+
+class _Job:
+    def __init__(self, jobId, key, req):
+        self.id = jobId
+        self.key = key
+        self.req = req
+        self.subscribers = [] # asyncio.Queue per waiting client
+
+    def publish(self, event):
+        for q in self.subscribers:
+            q.put_nowait(event)
+
+
+class JobServer:
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, workers=None, maxQueue=64,
+                 archiveRoot=os.path.join("assetss", "seedArchive"),
+                 catalogPath=os.path.join("assetss", "seedCatalog.sqlite")):
+        """
+        Local asyncio job service for on-demand seed sets.
+
+        Clients connect over TCP on localhost and send one JSON request per line (see
+        normalize_request). The server answers with JSON event lines for that request:
+            {"event": "queued", "job": id, "position": n, "shared": bool}
+            {"event": "started", "job": id}
+            {"event": "progress", "job": id, "placed": n, "attempts": n}
+            {"event": "done", "job": id, "status": ..., "fromArchive": bool, "location": ...,
+             "info": {...}, "seeds": [[x, y], ...]}
+            {"event": "error", "message": ...}
+        Requests wait in a bounded queue and are run by at most `workers` processes.
+        Identical requests (request_key) that arrive while one is queued or running share
+        that job instead of starting another. A completed set is stored in the SeedArchive
+        and registered in the SeedCatalog, later requests for the same rectangle, numP, ratio
+        and method are served from there without running a sampler:
+            - with a seed, the set of that seed (the same set on every request),
+            - without a seed, an archived set no client got yet, so repeated requests get
+              independent sets. Once all are used a new one is generated.
+        The handed-out sets are appended to <archiveRoot>/served.txt, so they stay used
+        across restarts (for every server sharing that archive). A set only counts as handed
+        out once its seeds were read, a set that fails to load stays available.
+        Unseeded requests that arrive while an identical one is still queued or running share
+        its set, clients that need independent sets at the same time pass different seeds.
+        The catalog (SQLite) and the seed files are only touched from one I/O thread, so the
+        event loop never waits on disk.
+
+        Parameters:
+            host (str): Loopback address to bind, one of LOCAL_HOSTS.
+            port (int): TCP port, 0 picks a free one (see self.port after start).
+            workers (int): Worker processes, defaults to the CPU count.
+            maxQueue (int): Jobs that may wait, further requests get an error event.
+            archiveRoot (str): SeedArchive the sets are stored in and served from.
+            catalogPath (str): SeedCatalog used to find archived sets.
+        """
+        if host not in LOCAL_HOSTS:
+            raise ValueError(f"The job server only binds to localhost, got '{host}'")
+        self.host, self.port = host, port
+        self.workers = workers or os.cpu_count() or 1
+        self.maxQueue = maxQueue
+        self.archiveRoot = archiveRoot
+        self.catalogPath = catalogPath
+        self.served = set()   # archive locations already handed to a client (served.txt)
+        self.reserved = set() # unseeded hits being loaded, not offered to another request
+        self.servedPath = os.path.join(archiveRoot, "served.txt")
+        self.jobs = {}        # request_key -> _Job while queued or running
+        self.running = {}     # job id -> _Job, for the progress messages
+        self.clients = {}     # writer -> handler task of every open connection
+        self.nextId = 0
+        self.counts = {"requests": 0, "shared": 0, "fromArchive": 0, "generated": 0, "rejected": 0}
+
+    async def _io(self, fn, *args):
+        # Catalog and file access, on the single I/O thread that owns the SQLite connection
+        return await self.loop.run_in_executor(self.io, fn, *args)
+
+    def _load_served(self):
+        if not os.path.exists(self.servedPath):
+            return set()
+        with open(self.servedPath) as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+
+    def _append_served(self, location):
+        os.makedirs(os.path.dirname(self.servedPath) or ".", exist_ok=True)
+        with open(self.servedPath, "a") as f:
+            f.write(location + "\n")
+
+    async def mark_served(self, location):
+        """
+        Record that a set was handed to a client, in memory and in served.txt.
+        """
+        self.served.add(location)
+        await self._io(self._append_served, location)
+
+    async def lookup(self, req):
+        """
+        An archived, completed set matching the request (see the class docstring), or None.
+        An unseeded hit is reserved until submit has loaded it (see mark_served).
+        """
+        size = archive_size(req)
+        if size is None or req["fresh"]:
+            return None
+        rows = await self._io(lambda: self.catalog.query(
+            width=size[0], height=size[1], numP=req["numP"], ratio=req["ratio"],
+            method=req["method"], status="Completed"))
+        if req["seed"] is not None:
+            rows = [r for r in rows if r["seed"] == str(req["seed"])]
+            return rows[-1] if rows else None
+        for row in rows:
+            if row["location"] not in self.served and row["location"] not in self.reserved:
+                self.reserved.add(row["location"])
+                return row
+        return None
+
+    async def start(self):
+        """
+        Start the pool, the worker tasks and the listening socket.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.io = ThreadPoolExecutor(max_workers=1)
+        self.catalog = await self._io(SeedCatalog, self.catalogPath)
+        self.served = await self._io(self._load_served)
+        self.manager = multiprocessing.Manager()
+        self.progress = self.manager.Queue() # worker processes -> server
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.queue = asyncio.Queue(maxsize=self.maxQueue)
+        self.tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self.tasks.append(asyncio.create_task(self._forward_progress()))
+        self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        self.server.close()
+        handlers = list(self.clients.values())
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self.server.wait_closed()
+        self.progress.put(None) # ends _forward_progress
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.manager.shutdown()
+        await self._io(self.catalog.close)
+        self.io.shutdown()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"🚀 Job server on {self.host}:{self.port} with {self.workers} workers")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _forward_progress(self):
+        # Manager queue reads block, so they run in a thread of the default executor
+        while True:
+            item = await self.loop.run_in_executor(None, self.progress.get)
+            if item is None:
+                return
+            jobId, placed, attempts = item
+            job = self.running.get(jobId)
+            if job is not None:
+                job.publish({"event": "progress", "job": jobId, "placed": placed, "attempts": attempts})
+
+    async def _worker(self):
+        while True:
+            job = await self.queue.get()
+            self.running[job.id] = job
+            job.publish({"event": "started", "job": job.id})
+            try:
+                X, info, location = await self.loop.run_in_executor(
+                    self.executor, _generate_job, (job.id, job.req, self.archiveRoot, self.progress))
+                if location is not None:
+                    await self.mark_served(location) # handed out below, not served again
+                    await self._io(self.catalog.register, location, X, info)
+                self.counts["generated"] += 1
+                job.publish(self._done_event(job.id, X, info, location, fromArchive=False))
+            except Exception as e:
+                job.publish({"event": "error", "job": job.id, "message": f"{type(e).__name__}: {e}"})
+            finally:
+                self.running.pop(job.id, None)
+                self.jobs.pop(job.key, None)
+                self.queue.task_done()
+
+    @staticmethod
+    def _done_event(jobId, X, info, location, fromArchive):
+        info = {k: v for k, v in info.items() if k != "Profile"}
+        return {"event": "done", "job": jobId, "status": info.get("Status", "Completed"),
+                "fromArchive": fromArchive, "location": location, "info": info,
+                "seeds": None if X is None else X.tolist()}
+
+    async def submit(self, req):
+        """
+        Queue a normalized request, or attach to the identical job already waiting / running.
+
+        Returns:
+            (_Job, dict): the job and the first event for the client. The job is None when the
+            request was answered from the archive (the event is then the "done" event).
+        """
+        self.counts["requests"] += 1
+        hit = await self.lookup(req)
+        if hit is not None:
+            try:
+                X = await self._io(SeedCatalog.load, hit)
+            except Exception as e:
+                X = None # unreadable set, generate one instead
+                print(f"⚠ Could not load {hit['location']}: {e!r}")
+            finally:
+                self.reserved.discard(hit["location"])
+            if X is not None:
+                if req["seed"] is None:
+                    await self.mark_served(hit["location"])
+                self.counts["fromArchive"] += 1
+                info = {"Method": hit["method"], "numP": hit["numP"], "Width": hit["width"], "Height": hit["height"],
+                        "Ratio": hit["ratio"], "Seed": hit["seed"], "Status": hit["status"],
+                        "Time_s": hit["time_s"], "Attempts": hit["attempts"], "Rejects": hit["rejects"],
+                        "Placed": hit["placed"]}
+                return None, self._done_event(None, X, info, hit["location"], fromArchive=True)
+
+        key = request_key(req)
+        job = self.jobs.get(key)
+        if job is not None:
+            self.counts["shared"] += 1
+            return job, {"event": "queued", "job": job.id, "position": 0, "shared": True}
+
+        if self.queue.full():
+            self.counts["rejected"] += 1
+            raise RuntimeError(f"queue full ({self.maxQueue} jobs waiting), try again later")
+        job = _Job(self.nextId, key, req)
+        self.nextId += 1
+        self.jobs[key] = job
+        self.queue.put_nowait(job)
+        return job, {"event": "queued", "job": job.id, "position": self.queue.qsize(), "shared": False}
+
+    async def _send(self, writer, event, req=None):
+        if req is not None and not req["includeSeeds"] and event.get("seeds") is not None:
+            event = dict(event, seeds=None)
+        writer.write((json.dumps(event) + "\n").encode())
+        await writer.drain()
+
+    async def _handle_client(self, reader, writer):
+        # One request at a time per connection, the events of a request end with done / error
+        self.clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    req = normalize_request(json.loads(line))
+                    job, first = await self.submit(req)
+                except (ValueError, TypeError, KeyError, RuntimeError) as e:
+                    await self._send(writer, {"event": "error", "message": str(e)})
+                    continue
+
+                if job is None:
+                    await self._send(writer, first, req)
+                    continue
+                events = asyncio.Queue()
+                job.subscribers.append(events)
+                await self._send(writer, first, req)
+                if job.id in self.running: # joined a job that already started
+                    await self._send(writer, {"event": "started", "job": job.id})
+                while True:
+                    event = await events.get()
+                    await self._send(writer, event, req)
+                    if event["event"] in ("done", "error"):
+                        break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass # client went away, its job keeps running for the others
+        except asyncio.CancelledError:
+            pass # server shutting down, end the connection quietly
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+
+def serve(host="127.0.0.1", port=DEFAULT_PORT, workers=None, maxQueue=64,
+          archiveRoot=os.path.join("assetss", "seedArchive"),
+          catalogPath=os.path.join("assetss", "seedCatalog.sqlite")):
+    """
+    Run a JobServer until interrupted (Ctrl+C).
+    """
+    server = JobServer(host, port, workers, maxQueue, archiveRoot, catalogPath)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n🛑 Job server stopped.")
+
+
+def request_seeds(numP, ratio, xp=None, yp=None, host="127.0.0.1", port=DEFAULT_PORT,
+                  onEvent=None, socketTimeout=None, **options):
+    """
+    Blocking client for scripts and design tools (plain sockets, no asyncio needed).
+
+    Parameters:
+        numP, ratio: Request parameters, xp / yp default to the 50 x 50 square.
+        onEvent (callable, optional): Called with every event dict (queued, started, progress).
+        socketTimeout (float, optional): Socket timeout in seconds, None waits for the result.
+        **options: Further request fields (method, timeout, seed, holes, jamming, fresh, ...).
+
+    Returns:
+        (np.ndarray or None, dict): the seeds and the final "done" event.
+    """
+    req = {"numP": numP, "ratio": ratio, **options}
+    if xp is not None:
+        req["xp"], req["yp"] = list(xp), list(yp)
+    with socket.create_connection((host, port), timeout=socketTimeout) as sock:
+        sock.sendall((json.dumps(req) + "\n").encode())
+        with sock.makefile("r") as stream:
+            for line in stream:
+                event = json.loads(line)
+                if event["event"] == "error":
+                    raise RuntimeError(event["message"])
+                if event["event"] == "done":
+                    seeds = None if event["seeds"] is None else np.array(event["seeds"])
+                    return seeds, event
+                if onEvent is not None:
+                    onEvent(event)
+    raise ConnectionError("job server closed the connection before the result")
+
+
+if __name__ == "__main__":
+    serve()
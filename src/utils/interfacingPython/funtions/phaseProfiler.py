@@ -0,0 +1,93 @@
+import math
+import time
+
+# Fill fractions (placed / numP) at which the acceptance curve is sampled by default
+DEFAULT_FILL_FRACTIONS = (0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 1.0)
+
+
+class PhaseProfiler:
+    def __init__(self, fillFractions=DEFAULT_FILL_FRACTIONS):
+        """
+        Per-phase timers and counters of one SSI run, plus its acceptance-rate-vs-fill curve.
+
+        Only used when a profiler is set (PointAllocationProcess.enable_profiling), the samplers
+        pick timed versions of their draw / distance-check functions once per run, so a run
+        without profiler executes exactly the same code as before.
+
+        Phases:
+            draw        : uniform bounding box draws
+            containment : point-in-polygon tests of those draws
+            distance    : inhibition checks against the placed seeds
+            io          : saving the finished seed set (CSV, sink, catalog)
+
+        Parameters:
+            fillFractions (tuple of float): Fill levels (placed / numP) where the curve is sampled.
+                At each level the acceptance rate since the previous level is recorded, i.e. the
+                fraction of candidates accepted in that stretch of the run.
+        """
+        self.fillFractions = tuple(sorted(fillFractions))
+        self.reset(1)
+
+    def reset(self, numP):
+        """
+        Clear all timers and counters, call at the start of every run.
+        """
+        self.times = {"draw": 0.0, "containment": 0.0, "distance": 0.0, "io": 0.0}
+        self.calls = {"draw": 0, "containment": 0, "distance": 0, "io": 0}
+        self.thresholds = [max(1, math.ceil(f * numP)) for f in self.fillFractions]
+        self.nextLevel = 0
+        self.last = (0, 0) # (placed, attempts) at the previous curve sample
+        self.curve = {}    # fill fraction -> (attempts so far, acceptance rate since previous sample)
+
+    def add(self, phase, seconds):
+        self.times[phase] += seconds
+        self.calls[phase] += 1
+
+    def wrap(self, phase, fn):
+        """
+        Timed version of fn, every call is added to `phase`.
+        """
+        times, calls, clock = self.times, self.calls, time.perf_counter
+
+        def timed(*args):
+            t0 = clock()
+            out = fn(*args)
+            times[phase] += clock() - t0
+            calls[phase] += 1
+            return out
+        return timed
+
+    def accepted(self, placed, attempts):
+        """
+        Record an accepted seed, samples the curve when a fill level is crossed.
+        """
+        while self.nextLevel < len(self.thresholds) and placed >= self.thresholds[self.nextLevel]:
+            p0, a0 = self.last
+            rate = (placed - p0) / (attempts - a0) if attempts > a0 else 1.0
+            self.curve[self.fillFractions[self.nextLevel]] = (attempts, rate)
+            self.last = (placed, attempts)
+            self.nextLevel += 1
+
+    def stats(self, run_time):
+        """
+        Flat dict of the run profile, ready to be written as extra log columns.
+
+        Parameters:
+            run_time (float): Run time of the sampler, the part not spent in a timed phase
+                              (loop overhead and bookkeeping) is reported as T_other_s.
+
+        Returns:
+            dict: T_<phase>_s and N_<phase> per phase, T_other_s, and for every fill fraction
+                  f: Attempts@f and Rate@f ("" if the run never reached that fill level).
+        """
+        out = {}
+        for phase in self.times:
+            out[f"T_{phase}_s"] = self.times[phase]
+            out[f"N_{phase}"] = self.calls[phase]
+        out["T_other_s"] = max(0.0, run_time - self.times["draw"] - self.times["containment"]
+                               - self.times["distance"])
+        for f in self.fillFractions:
+            attempts, rate = self.curve.get(f, ("", ""))
+            out[f"Attempts@{f:g}"] = attempts
+            out[f"Rate@{f:g}"] = rate
+        return out
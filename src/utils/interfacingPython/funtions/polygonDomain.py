@@ -0,0 +1,169 @@
+import numpy as np
+
+
+def _closed_path(pts):
+    """
+    matplotlib Path of a vertex ring. matplotlib is imported here, on first use, so
+    rectangle-only runs (and headless workers) never load it.
+    """
+    from matplotlib.path import Path
+    return Path(np.vstack((pts, pts[:1])), closed=True)
+
+
+class PolygonDomain:
+    def __init__(self, xp, yp, holes=None):
+        """
+        Sampling domain built once per run from the polygon vertices.
+
+        Axis-aligned rectangles (all our 50x50 / 70x50 panels) are detected and tested with
+        plain comparisons, any other polygon gets one matplotlib Path that is reused for every
+        test instead of being rebuilt per point.
+
+        Parameters:
+            xp (list or np.ndarray): x-coordinates of the polygon vertices (in order).
+            yp (list or np.ndarray): y-coordinates of the polygon vertices (matching xp).
+                                     The closing vertex may be repeated or not.
+            holes (list of (hx, hy), optional): Vertex lists of openings inside the polygon
+                                     (e.g. bolt holes of a panel). Points inside a hole are
+                                     outside the domain and the hole area is not counted.
+
+        After initialization, these instance attributes are set:
+            self.vertices: (m, 2) array of the vertices, without the repeated closing vertex.
+            self.minx, self.maxx, self.miny, self.maxy: Bounding box of the polygon.
+            self.isRectangle: True if the polygon is an axis-aligned rectangle.
+            self.path: matplotlib Path of the polygon (None for rectangles).
+            self.holes: One (k, 2) vertex array per hole.
+            self.holePaths: One matplotlib Path per hole.
+            self.area: Exact area of the polygon minus its holes (shoelace formula).
+        """
+        pts = np.column_stack((np.asarray(xp, dtype=float), np.asarray(yp, dtype=float)))
+        if len(pts) > 1 and np.array_equal(pts[0], pts[-1]):
+            pts = pts[:-1] # Drop the closing vertex, it is implied
+        self.vertices = pts
+
+        self.minx, self.maxx = pts[:, 0].min(), pts[:, 0].max()
+        self.miny, self.maxy = pts[:, 1].min(), pts[:, 1].max()
+
+        self.isRectangle = self._is_rectangle()
+        self.path = None if self.isRectangle else _closed_path(pts)
+
+        self.holes = []
+        self.holePaths = []
+        holeArea = 0.0
+        for hx, hy in (holes or []):
+            h = np.column_stack((np.asarray(hx, dtype=float), np.asarray(hy, dtype=float)))
+            if len(h) > 1 and np.array_equal(h[0], h[-1]):
+                h = h[:-1]
+            self.holes.append(h)
+            self.holePaths.append(_closed_path(h))
+            holeArea += self.shoelace(h[:, 0], h[:, 1])
+
+        self.area = self.shoelace(pts[:, 0], pts[:, 1]) - holeArea
+
+    @staticmethod
+    def shoelace(x, y):
+        """
+        Area of a simple polygon from its vertices (shoelace formula), independent of orientation.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+    def _is_rectangle(self):
+        """
+        True if the vertices are the 4 corners of the bounding box joined by axis-aligned edges.
+        """
+        pts = self.vertices
+        if len(pts) != 4:
+            return False
+        if not (np.isin(pts[:, 0], (self.minx, self.maxx)).all() and
+                np.isin(pts[:, 1], (self.miny, self.maxy)).all()):
+            return False
+        if len(np.unique(pts, axis=0)) != 4:
+            return False
+        # Every edge must change only x or only y (rules out the crossed "bow-tie" order)
+        edges = np.roll(pts, -1, axis=0) - pts
+        return bool(((edges[:, 0] == 0) ^ (edges[:, 1] == 0)).all())
+
+    def contains(self, x, y):
+        """
+        Check if a single point (x, y) is inside the polygon.
+        """
+        if self.isRectangle:
+            inside = self.minx <= x <= self.maxx and self.miny <= y <= self.maxy
+        else:
+            inside = self.path.contains_point((x, y))
+        if inside and self.holePaths:
+            return not any(h.contains_point((x, y)) for h in self.holePaths)
+        return inside
+
+    def contains_points(self, pts):
+        """
+        Vectorized containment test.
+
+        Parameters:
+            pts (np.ndarray): (n, 2) array of points.
+
+        Returns:
+            np.ndarray: (n,) boolean mask, True for the points inside the polygon.
+        """
+        pts = np.asarray(pts, dtype=float)
+        if self.isRectangle:
+            x = pts[:, 0]
+            y = pts[:, 1]
+            inside = (x >= self.minx) & (x <= self.maxx) & (y >= self.miny) & (y <= self.maxy)
+        else:
+            inside = self.path.contains_points(pts)
+        for h in self.holePaths:
+            inside &= ~h.contains_points(pts)
+        return inside
+
+    def boundary_edges(self):
+        """
+        All boundary segments (outline and holes).
+
+        Returns:
+            np.ndarray: (E, 2, 2) array, edges[e] = [[x0, y0], [x1, y1]].
+        """
+        rings = [self.vertices] + self.holes
+        return np.concatenate([np.stack((r, np.roll(r, -1, axis=0)), axis=1) for r in rings])
+
+    def cells_outside(self, x0, y0, size):
+        """
+        Vectorized test of square cells that lie completely outside the domain.
+
+        A cell is completely outside when its 4 corners are outside and no boundary edge
+        crosses it (then the whole cell sits in one region, the one its corners are in).
+
+        Parameters:
+            x0, y0 (np.ndarray): Lower-left corners of the cells.
+            size (float): Side length of the cells.
+
+        Returns:
+            np.ndarray: Boolean mask, True for cells that cannot contain a point of the domain.
+        """
+        x0 = np.asarray(x0, dtype=float)
+        y0 = np.asarray(y0, dtype=float)
+        x1 = x0 + size
+        y1 = y0 + size
+        if self.isRectangle and not self.holes:
+            return (x1 < self.minx) | (x0 > self.maxx) | (y1 < self.miny) | (y0 > self.maxy)
+
+        outside = np.ones(len(x0), dtype=bool)
+        for cx, cy in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+            outside &= ~self.contains_points(np.column_stack((cx, cy)))
+
+        for (ax, ay), (bx, by) in self.boundary_edges():
+            # Bounding boxes of edge and cell overlap ...
+            overlap = ((min(ax, bx) <= x1) & (max(ax, bx) >= x0) &
+                       (min(ay, by) <= y1) & (max(ay, by) >= y0))
+            # ... and the edge's line does not leave all 4 corners on the same side
+            ex, ey = bx - ax, by - ay
+            s00 = ex * (y0 - ay) - ey * (x0 - ax)
+            s10 = ex * (y0 - ay) - ey * (x1 - ax)
+            s11 = ex * (y1 - ay) - ey * (x1 - ax)
+            s01 = ex * (y1 - ay) - ey * (x0 - ax)
+            allPos = (s00 > 0) & (s10 > 0) & (s11 > 0) & (s01 > 0)
+            allNeg = (s00 < 0) & (s10 < 0) & (s11 < 0) & (s01 < 0)
+            outside &= ~(overlap & ~allPos & ~allNeg)
+        return outside
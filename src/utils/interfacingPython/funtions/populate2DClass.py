@@ -1,31 +1,34 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.spatial.distance import pdist, squareform
-from matplotlib.path import Path
 import seedMaxDis as smd
+from polygonDomain import PolygonDomain
 
 
 class populate2DClass:
-    def __init__(self,xp,yp,n):
+    def __init__(self,xp,yp,n,rng=None):
         self.xp_=xp
         self.yp_=yp
         self.n_=n
         self.x_=[]#list to store GENERATED x coordinates
         self.y_=[] #list to store GENERATED y coordinates
+        self.rng_=np.random.default_rng(rng) #Seed or Generator, same seed -> same points
+        self.domain_=PolygonDomain(xp,yp) #Built once, reused by every in_polygon call
         
         pass
 
-    def populator(self):
+    def populator(self, n=None):
         """
         Generate homogeneous 2-D Poisson process within a polygon(eg. triangle, quadrilateral, pentagon, hexagon, octagon).
         
         Parameters:
             xp, yp: Lists for Coordinates of the polygon vertices.
-            n: Number of points to generate.
+            n: Number of points to generate, defaults to the n given at initialization.
 
         Returns:
             x, y: Coordinates of the points generated inside the polygon.
         """
+        if n is None:
+            n = self.n_
+
         #Clear to prevent lists from being reused in next iteration
         self.x_.clear() #clear the list of x coordinates
         self.y_.clear() #clear the list of y coordinates
@@ -33,30 +36,33 @@ class populate2DClass:
         minx, maxx = min(self.xp_), max(self.xp_) #minimum and maximum x coordinates of the list
         miny, maxy = min(self.yp_), max(self.yp_) #minimum and maximum y coordinates of the list
         
-        while len(self.x) < self.n_:
-            xt = np.random.uniform(minx, maxx)
-            yt = np.random.uniform(miny, maxy)
-            if self.in_polygon(xt, yt, self.xp_, self.yp_):
+        while len(self.x_) < n:
+            xt = self.rng_.uniform(minx, maxx)
+            yt = self.rng_.uniform(miny, maxy)
+            if self.in_polygon(xt, yt):
                 self.x_.append(xt)
                 self.y_.append(yt)
+
+        return np.array(self.x_), np.array(self.y_)
         
 
-    def in_polygon(self):
+    def in_polygon(self, x, y):
         """
         Check if a point (x, y) is inside a polygon defined by vertices (xp, yp).
         Param used x,y, xp, yp
         """
-    
-        polygon = Path(np.column_stack((self.xp_, self.yp_)))
-        return polygon.contains_point((x, y))
+        return self.domain_.contains(x, y)
 
     def main(self):
         #Example of how to contruct a function of the class
+        # Plotting and SciPy are only imported here, so the class itself stays headless
+        import matplotlib.pyplot as plt
+        from scipy.spatial.distance import pdist
 
         # Parameters
         ratio = 0.1
         n = 314
-        A = 50 * 50  # Basal area
+        A = self.domain_.area  # Exact (shoelace) area of the polygon
         r=smd.seedMaxDis(A, n)
         
         s = ratio * r
@@ -68,12 +74,12 @@ class populate2DClass:
 
         # Generate the first event
         X = np.zeros((n, 2))
-        X[0, :] = np.column_stack(self.populator(rx, ry, 1))[0]
+        X[0, :] = np.column_stack(self.populator(1))[0]
         i = 1
 
         # Generate other events
         while i < n:
-            sx, sy = self.csbinproc(rx, ry, 1)
+            sx, sy = self.populator(1)
             xt = np.vstack(([sx[0], sy[0]], X[:i, :]))
             dist = pdist(xt)
             ind = np.where(dist[:i] <= s)[0]
@@ -98,9 +104,9 @@ class populate2DClass:
         # Optional: Write to CSV
         np.savetxt("XTRAWIDE_50x50_n314_0.1_NEW.csv", np.hstack((X, np.zeros((X.shape[0], 1)))), delimiter=",")
 
-    if __name__ == "__main__":
+if __name__ == "__main__":
     
-    mainRun=populate2DClass()
+    mainRun=populate2DClass([0, 50, 50, 0, 0], [0, 0, 50, 50, 0], 314)
 
     for i in range(5):
         mainRun.main()
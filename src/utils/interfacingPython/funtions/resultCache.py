@@ -0,0 +1,140 @@
+import numpy as np
+import os, json, time, sqlite3
+from voronoiLattice import content_hash
+from seedCatalog import normalize_ratio
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    lastUsed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entriesByUse ON entries (lastUsed);
+"""
+
+
+def _plain(value):
+    """JSON fallback for the numpy scalars in lastRunStats."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+class ResultCache:
+    def __init__(self, root=os.path.join("assetss", "resultCache"), maxBytes=2 * 2**30):
+        """
+        Content-addressed cache of finished seed sets, in front of the samplers
+        (PointAllocationProcess.cache).
+
+        A run is identified by a hash of everything that decides its seeds: polygon and hole
+        vertices, sampling box, method, numP, ratio, RNG seed and the JammingMonitor settings.
+        The same request with the same seed then returns the stored seeds and run stats
+        instead of running (and saving) the sampler again. Only completed runs are stored.
+
+        Entries are <root>/<key[:2]>/<key>.npz files. Their sizes and last use times are kept
+        in <root>/index.sqlite, so choosing what to evict never lists the folders: after every
+        put the least recently used entries are removed until the cache is below maxBytes.
+        The index is shared by all processes using the same root (pool workers).
+
+        Parameters:
+            root (str): Cache folder.
+            maxBytes (int): Size limit of the stored entries in bytes.
+
+        After initialization, these instance attributes are set:
+            self.hits, self.misses: Lookups of this instance that found / did not find an entry.
+        """
+        self.root = root
+        self.maxBytes = maxBytes
+        os.makedirs(root, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(root, "index.sqlite"), timeout=30.0)
+        self.db.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.db.close()
+
+    def __getstate__(self):
+        # Pool workers get the settings and open their own connection
+        return {"root": self.root, "maxBytes": self.maxBytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["root"], state["maxBytes"])
+
+    @staticmethod
+    def key_for(runner, numP, ratio):
+        """
+        Cache key of the next run of `runner` (PointAllocationProcess) for numP and ratio.
+        """
+        d = runner.domain
+        monitor = runner.jamming
+        jamming = None if monitor is None else (monitor.mode, monitor.window, monitor.minAcceptRate, monitor.checkEvery)
+        return content_hash(d.vertices, *[np.asarray(h, dtype=float) for h in d.holes],
+                            (runner.minx, runner.miny, runner.maxx, runner.maxy),
+                            runner.method, int(numP), normalize_ratio(ratio), runner.seed, jamming)
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".npz")
+
+    def get(self, key):
+        """
+        Returns:
+            (np.ndarray, dict) or None: seeds and run stats stored under key, None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                X, stats = data["X"], json.loads(str(data["stats"]))
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            self.misses += 1
+            return None
+        with self.db:
+            self.db.execute("UPDATE entries SET lastUsed = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return X, stats
+
+    def put(self, key, X, stats):
+        """
+        Store the seeds and run stats of a completed run, then evict down to maxBytes.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        stats = {k: v for k, v in stats.items() if k not in ("Profile", "Cache")}
+        tmp = path + f".{os.getpid()}.tmp.npz"
+        np.savez(tmp, X=np.asarray(X), stats=np.array(json.dumps(stats, default=_plain)))
+        os.replace(tmp, path) # readers never see a half-written file
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO entries (key, size, lastUsed) VALUES (?, ?, ?)",
+                            (key, os.path.getsize(path), time.time()))
+        self.evict()
+
+    def evict(self, maxBytes=None):
+        """
+        Remove least recently used entries until the stored size is at most maxBytes
+        (defaults to self.maxBytes).
+
+        Returns:
+            int: Number of removed entries.
+        """
+        limit = self.maxBytes if maxBytes is None else maxBytes
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        removed = 0
+        if total <= limit:
+            return removed
+        with self.db:
+            for key, size in self.db.execute("SELECT key, size FROM entries ORDER BY lastUsed").fetchall():
+                if total <= limit:
+                    break
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass # removed by another process already
+                self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                removed += 1
+        return removed
+
+    def stats(self):
+        """
+        Entries and bytes on disk, plus the hit / miss counters of this instance.
+        """
+        entries, size = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"Entries": entries, "Bytes": size, "Hits": self.hits, "Misses": self.misses}
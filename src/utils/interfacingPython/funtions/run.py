@@ -1,37 +1,105 @@
 import PointAllocationProcess as Process
-import os, csv
+import sweepRunner
+import os
 from datetime import datetime
 
-def run_example_50x50():
+def run_example_50x50(method="SSI", baseSeed=None, jamming=None, resume=None, profile=False, cache=None,
+                      policy="stop_sweep"):
+    """Sweep ratios 0.10 to 0.59 with 100 samples each. `method` picks the sampler (see PointAllocationProcess.exampleRun).
+    Pass baseSeed to repeat a whole sweep, every row also records the seed of its own run.
+    Pass jamming (e.g. {"mode": "estimate"}) to end hopeless runs early with status "Jammed".
+    Pass resume=<runtime log path> to continue a sweep that was interrupted or crashed.
+    Pass profile=True to write per-phase timings and acceptance curves to <log>_profile.csv.
+    Pass cache=resultCache.ResultCache() to reuse seed sets already generated with the same seeds.
+    `policy` (sweepRunner.POLICIES) decides what a timeout stops, by default the whole sweep."""
     typeNumb = 100 # Number of samples to run for each ratio
     timeout  = 60*3           # 3 minutes timeout
     ratios   = [0.1 + .01*i for i in range(50)]    # Starting from 0.10 to 0.59
     numP     = 314 # Number of points to allocate
     xp, yp   = [0,50,50,0,0],[0,0,50,50,0] # Polygon coordinates for a square
 
+    return _sequential_sweep(xp, yp, numP, ratios, typeNumb, timeout,
+                             method, baseSeed, jamming, resume, profile, cache, policy)
+
+def run_example_50x50_for_long_iteration(method="SSI", baseSeed=None, jamming=None, resume=None, profile=False, cache=None,
+                                         policy="stop_sweep"):
+    """This run is for long iterations, lower iteration per ratio, and longer timeout.
+    With jamming={"mode": "estimate"} a jammed ratio is reported in about a second instead of after the 1 hour timeout.
+    Every run is logged as soon as it ends, resume=<runtime log path> skips the runs already in that log.
+    The default policy "stop_sweep" ends the sweep at the first timeout, so the higher ratios
+    do not each spend another hour timing out."""
+    typeNumb = 5 # Number of samples to run for each ratio
+    timeout  = 60*60         # 1 hour timeout
+    ratios   = [0.50 + .01*i for i in range(50)] # Starting from 0.50 to 0.99
+    numP     = 314
+    xp, yp   = [0,50,50,0,0],[0,0,50,50,0]
+
+    return _sequential_sweep(xp, yp, numP, ratios, typeNumb, timeout,
+                             method, baseSeed, jamming, resume, profile, cache, policy)
+
+def _sequential_sweep(xp, yp, numP, ratios, typeNumb, timeout, method, baseSeed, jamming, resume, profile=False, cache=None,
+                      policy="stop_sweep"):
+    """Ratio x sample loop shared by the sequential sweeps.
+    A "Timeout" or "Jammed" run is handled by `policy`, one of sweepRunner.POLICIES (same meaning as
+    in run_sweep_parallel): "stop_sweep" ends the sweep, "skip_ratio" moves on to the next ratio,
+    "continue" runs every sample.
+    The runtime log is a sweepRunner.SweepLog: each row is written when its run ends, and a resumed
+    sweep skips the (ratio, sample) pairs already logged and applies the policy to the timeouts
+    already in the log.
+    The placed seeds of a timed-out or jammed run are kept in <log>_partial/.
+    With profile=True every run's PhaseProfiler stats go to the sidecar <log>_profile.csv.
+    With a cache (resultCache.ResultCache) a run whose seeds are cached is not sampled or saved
+    again, the "Cache" column logs hit / miss (a profiled run always samples).
+    Returns the path of the runtime log."""
+    if policy not in sweepRunner.POLICIES:
+        raise ValueError(f"Unknown policy '{policy}', expected one of {sweepRunner.POLICIES}")
     # Create a PointAllocationProcess instance
     # The example run will output 1 cvs file, and return a tuple with the following values:
     # (status, runtime, attempts, rejects)
     runner = Process.PointAllocationProcess(xp, yp) 
-    runner.method = "SSI" 
+    runner.method = method
+    if jamming is not None:
+        runner.enable_jamming_stop(**jamming)
+    if profile:
+        runner.enable_profiling()
+    runner.cache = cache
 
     # Calculate the width and height of the rectangle
     w = runner.maxx - runner.minx
     h = runner.maxy - runner.miny
 
-    # Log header
-    log = [("Method","numP","Width","Height",
-            "Ratio","Sample","Time_s","Status",
-            "Attempts","Rejects")]
-    
-    # Flag to indicate if a timeout occurred
-    timeouted = False #Flag
+    if resume is None:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S") # Timestamp for the filename
+        fn = f"runtime_log_{runner.method}_{numP}_{w}x{h}_{ts}.csv" # Filename with method, numP, width, height, and timestamp
+        # A fresh sweep never resumes, a log from the same second gets a _1, _2, ... suffix
+        log = sweepRunner.SweepLog(os.path.join("assetss","csvFile", fn), baseSeed, new=True)
+    else:
+        log = sweepRunner.SweepLog(resume, baseSeed)
+
+    # One independent stream per run, same job order on every restart
+    seeds = sweepRunner.spawn_seeds(log.baseSeed, len(ratios) * typeNumb)
+
+    stop = False
     try:
-        for r in ratios:
+        for ri, r in enumerate(ratios):
+            if stop:
+                break
+            # A timeout logged before the restart counts like one in this run
+            if f"{r:.3f}" in log.stopped:
+                if policy == "stop_sweep":
+                    break
+                if policy == "skip_ratio":
+                    continue
             for i in range(typeNumb):
+                if log.is_done(r, i):
+                    continue
+
+                # Fresh, recorded seed for every run so any single sample can be replayed
+                runner.reseed(seeds[ri * typeNumb + i])
+
                 #The example run will output 1 cvs file, and return a tuple with the following values:
                 #Blocking call
-                status, rt, at, rj = runner.exampleRun_SSI_withRejects(numP, r, timeout)
+                status, rt, at, rj = runner.exampleRun(numP, r, timeout)
 
                 # Append the results to the log in a structured way
                 # The log will contain the method, number of points, width, height,
@@ -39,84 +107,47 @@ def run_example_50x50():
                 log.append((runner.method, numP, w, h,
                             f"{r:.3f}", i,
                             f"{rt:.3f}", status,
-                            at, rj))
-                
-                # Print a message if the status is "Timeout"
-                if status == "Timeout":
-                    print(f"⏱ Timeout @ ratio={r:.3f}, sample={i}")
-                    timeouted= True
-                    break # break the inner loop
+                            at, rj, runner.seed,
+                            runner.lastRunStats["Placed"],
+                            sweepRunner.format_estimate(runner.lastRunStats["EstMaxSeeds"]),
+                            runner.lastRunStats.get("Cache", "")))
+                if profile:
+                    log.append_profile(r, i, runner.lastRunStats["Profile"])
                 
-                # If timeouted is True, break the outer loop
-                # This is to prevent further iterations after a timeout
-                if timeouted:
-                    break # break the outer loop
+                # Print a message if the status is "Timeout" (or "Jammed")
+                if status in ("Timeout", "Jammed"):
+                    partial = log.save_partial(runner.lastSeeds, runner.lastRunStats["Placed"], r, i)
+                    print(f"⏱ {status} @ ratio={r:.3f}, sample={i}, placed seeds kept in {partial}")
+                    if policy == "stop_sweep":
+                        stop = True # also ends the ratio loop
+                        break
+                    if policy == "skip_ratio":
+                        break # skip the rest of this ratio
     
     except KeyboardInterrupt:
-        print("\n🛑 Interrupted — partial log will be saved.")
-
-    # always write one runtime_log CSV
-    base = os.path.join("assetss","csvFile")
-    os.makedirs(base, exist_ok=True) # Ensure the directory exists
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S") # Timestamp for the filename
-    fn = f"runtime_log_{runner.method}_{numP}_{w}x{h}_{ts}.csv" # Filename with method, numP, width, height, and timestamp
-    path = os.path.join(base, fn)
-    with open(path,"w",newline="") as f:
-        csv.writer(f).writerows(log) # Write the log to the CSV file
-
-    print(f"✅ Runtime log saved to {path}")
-
-def run_example_50x50_for_long_iteration():
-    """This run is for long iterations, lower iteration per ratio, and longer timeout. """
-    typeNumb = 5 # Number of samples to run for each ratio
-    timeout  = 60*60         # 1 hour timeout
-    ratios   = [0.50 + .01*i for i in range(50)] # Starting from 0.50 to 0.99
+        print("\n🛑 Interrupted — finished runs are in the log, pass resume= to continue.")
+
+    if cache is not None:
+        print(f"♻ Result cache: {cache.hits} hits, {cache.misses} misses")
+    print(f"✅ Runtime log saved to {log.path}")
+    return log.path
+
+def run_example_50x50_parallel(method="SSI", workers=None, baseSeed=None, policy="stop_sweep", jamming=None, cache=None):
+    """Same sweep as run_example_50x50, spread over a process pool.
+    Each (ratio, sample) job gets a reproducible seed from baseSeed, see sweepRunner.run_sweep_parallel."""
+    typeNumb = 100
+    timeout  = 60*3
+    ratios   = [0.1 + .01*i for i in range(50)]
     numP     = 314
     xp, yp   = [0,50,50,0,0],[0,0,50,50,0]
 
-    runner = Process.PointAllocationProcess(xp, yp)
-    runner.method = "SSI" 
-    w = runner.maxx - runner.minx
-    h = runner.maxy - runner.miny
-
-    # Log header
-    log = [("Method","numP","Width","Height",
-            "Ratio","Sample","Time_s","Status",
-            "Attempts","Rejects")]
-    timeouted = False #Flag
-    try:
-        for r in ratios:
-            for i in range(typeNumb):
-                #The example run will output 1 cvs file, and return a tuple with the following values:
-                #Blocking call
-                status, rt, at, rj = runner.exampleRun_SSI_withRejects(numP, r, timeout)
-
-                log.append((runner.method, numP, w, h,
-                            f"{r:.3f}", i,
-                            f"{rt:.3f}", status,
-                            at, rj))
-                
-                if status == "Timeout":
-                    print(f"⏱ Timeout @ ratio={r:.3f}, sample={i}")
-                    timeouted= True
-                    break # break the inner loop
+    log = sweepRunner.run_sweep_parallel(xp, yp, numP, ratios, typeNumb, timeout,
+                                         method=method, workers=workers,
+                                         baseSeed=baseSeed, policy=policy,
+                                         jamming=jamming, cache=cache)
 
-                if timeouted:
-                    break # break the outer loop
-    
-    except KeyboardInterrupt:
-        print("\n🛑 Interrupted — partial log will be saved.")
-
-    # always write one runtime_log CSV
-    base = os.path.join("assetss","csvFile")
-    os.makedirs(base, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    fn = f"runtime_log_{runner.method}_{numP}_{w}x{h}_{ts}.csv"
-    path = os.path.join(base, fn)
-    with open(path,"w",newline="") as f:
-        csv.writer(f).writerows(log)
-
-    print(f"✅ Runtime log saved to {path}")
+    w, h = max(xp) - min(xp), max(yp) - min(yp)
+    sweepRunner.writeRuntimeLog(log, method, numP, w, h)
 
 if __name__=="__main__":
     run_example_50x50_for_long_iteration()
@@ -0,0 +1,235 @@
+import numpy as np
+import os, csv, json, time
+
+# Columns of the per-group index, one row per stored seed set
+INDEX_HEADER = ("Sample","Method","Status","Placed","Seed",
+                "Time_s","Attempts","Rejects")
+
+
+class _GroupLock:
+    """
+    Cross-process lock on one archive group, a lock file created with O_EXCL
+    (works the same on Windows and Linux, no extra dependency).
+    """
+    def __init__(self, directory, wait=30.0):
+        self.path = os.path.join(directory, ".lock")
+        self.wait = wait
+
+    def __enter__(self):
+        t0 = time.time()
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return self
+            except FileExistsError:
+                if time.time() - t0 > self.wait:
+                    raise TimeoutError(f"Archive group is locked, delete {self.path} if no writer is running")
+                time.sleep(0.001)
+
+    def __exit__(self, *exc):
+        os.remove(self.path)
+
+
+class SeedArchive:
+    def __init__(self, root=os.path.join("assetss", "seedArchive"), dtype="float64"):
+        """
+        Append-only binary store for seed sets, one container per (size, numP, ratio).
+
+        Every group folder <root>/<w>x<h>/numP_<n>/ratio_<r>/ holds:
+            seeds.bin : all seed sets of the group back to back, raw little-endian floats,
+                        one (numP, 2) record per set, readable as a memory map.
+            index.csv : one row per record (INDEX_HEADER), the row number is the sample id.
+            meta.json : numP and dtype of the records.
+
+        Appending is a single write at the end of seeds.bin plus one index row, done under a
+        lock file, so parallel workers never race on file names and nothing has to list the
+        folder. The raw record file is used instead of .npy/.npz because those cannot be grown
+        in place without rewriting the header or the whole archive.
+
+        Parameters:
+            root (str): Folder of the archive.
+            dtype (str): "float64" (default, same precision as the CSVs) or "float32" for
+                         half the size. Fixed per group once the group exists.
+        """
+        self.root = root
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+
+    def group_dir(self, width, height, numP, ratio):
+        """
+        Folder of one (size, numP, ratio) group.
+        """
+        return os.path.join(self.root, f"{width}x{height}", f"numP_{numP}", f"ratio_{ratio:.3f}")
+
+    @staticmethod
+    def _meta(directory):
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+        return meta["numP"], np.dtype(meta["dtype"])
+
+    def append(self, X, width, height, ratio, info=None):
+        """
+        Store one seed set.
+
+        Parameters:
+            X (np.ndarray): (numP, 2) seeds, unplaced rows of a timed-out run stay zero.
+            width, height (float): Bounding box size of the domain.
+            ratio (float): Ratio of the run.
+            info (dict, optional): Values for the index columns (Method, Status, Placed, Seed,
+                                   Time_s, Attempts, Rejects), missing ones are left empty.
+
+        Returns:
+            int: Sample id of the stored set inside its group.
+        """
+        X = np.asarray(X)
+        numP = X.shape[0]
+        directory = self.group_dir(width, height, numP, ratio)
+        os.makedirs(directory, exist_ok=True)
+        info = info or {}
+
+        with _GroupLock(directory):
+            metaPath = os.path.join(directory, "meta.json")
+            if os.path.exists(metaPath):
+                _, dtype = self._meta(directory)
+            else:
+                dtype = self.dtype
+                with open(metaPath, "w") as f:
+                    json.dump({"numP": numP, "dtype": dtype.str}, f)
+                with open(os.path.join(directory, "index.csv"), "w", newline="") as f:
+                    csv.writer(f).writerow(INDEX_HEADER)
+
+            binPath = os.path.join(directory, "seeds.bin")
+            record = np.ascontiguousarray(X, dtype=dtype)
+            sample = os.path.getsize(binPath) // record.nbytes if os.path.exists(binPath) else 0
+            with open(binPath, "ab") as f:
+                f.write(record.tobytes())
+
+            row = [sample] + [info.get(c, "") for c in INDEX_HEADER[1:]]
+            if row[5] != "":
+                row[5] = f"{row[5]:.3f}" # Time_s, same rounding as the runtime logs
+            with open(os.path.join(directory, "index.csv"), "a", newline="") as f:
+                csv.writer(f).writerow(row)
+
+        return sample
+
+    def save(self, X, info):
+        """
+        Sink interface used by PointAllocationProcess: info holds Width, Height, Ratio and the
+        index columns.
+
+        Returns:
+            str: "<group folder>#<sample id>" reference of the stored set.
+        """
+        sample = self.append(X, info["Width"], info["Height"], info["Ratio"], info)
+        return f"{self.group_dir(info['Width'], info['Height'], X.shape[0], info['Ratio'])}#{sample}"
+
+    def count(self, width, height, numP, ratio):
+        """
+        Number of seed sets stored in a group.
+        """
+        directory = self.group_dir(width, height, numP, ratio)
+        binPath = os.path.join(directory, "seeds.bin")
+        if not os.path.exists(binPath):
+            return 0
+        _, dtype = self._meta(directory)
+        return os.path.getsize(binPath) // (numP * 2 * dtype.itemsize)
+
+    def load(self, width, height, numP, ratio):
+        """
+        Memory-mapped, read-only view of every seed set of a group.
+
+        Returns:
+            np.ndarray: (n, numP, 2) array backed by seeds.bin (no data is read until used),
+                        or an empty array if the group does not exist.
+        """
+        if self.count(width, height, numP, ratio) == 0:
+            return np.zeros((0, numP, 2))
+        return self.open_group(self.group_dir(width, height, numP, ratio))
+
+    @classmethod
+    def open_group(cls, directory):
+        """
+        Memory map of a group folder given by its path (as stored in "<folder>#<sample>"
+        references), without knowing the archive root or the group parameters.
+
+        Returns:
+            np.ndarray: (n, numP, 2) read-only array backed by seeds.bin.
+        """
+        numP, dtype = cls._meta(directory)
+        n = os.path.getsize(os.path.join(directory, "seeds.bin")) // (numP * 2 * dtype.itemsize)
+        return np.memmap(os.path.join(directory, "seeds.bin"), dtype=dtype, mode="r",
+                         shape=(n, numP, 2))
+
+    def get(self, width, height, numP, ratio, sample):
+        """
+        One seed set as a regular (numP, 2) float64 array.
+        """
+        return np.array(self.load(width, height, numP, ratio)[sample], dtype=float)
+
+    def index(self, width, height, numP, ratio):
+        """
+        Index rows of a group as a list of dicts (sample id order).
+        """
+        path = os.path.join(self.group_dir(width, height, numP, ratio), "index.csv")
+        if not os.path.exists(path):
+            return []
+        with open(path, newline="") as f:
+            return list(csv.DictReader(f))
+
+    def exportCSV(self, width, height, numP, ratio, sample, path=None):
+        """
+        Write one stored set as a CSV in the same format as the legacy assetss/csvFile files,
+        which is what the Grasshopper definition reads.
+
+        Parameters:
+            path (str, optional): Output file. Defaults to
+                assetss/csvExport/<w>x<h>/numP_<n>/ratio_<r>/<method>_<sample>.csv
+                (a separate tree, so legacy CSVs with the same name are never overwritten)
+
+        Returns:
+            str: Path of the written CSV.
+        """
+        if path is None:
+            rows = self.index(width, height, numP, ratio)
+            method = rows[sample]["Method"] or "seeds"
+            base = os.path.join("assetss", "csvExport", f"{width}x{height}", f"numP_{numP}", f"ratio_{ratio:.3f}")
+            os.makedirs(base, exist_ok=True)
+            path = os.path.join(base, f"{method}_{sample}.csv")
+        np.savetxt(path, self.get(width, height, numP, ratio, sample), delimiter=",")
+        return path
+
+    def import_csv_tree(self, csvRoot=os.path.join("assetss", "csvFile")):
+        """
+        Copy the legacy CSV tree (<w>x<h>/numP_<n>/ratio_<r>/<method>_<i>.csv) into the archive.
+        ratio_0.10 and ratio_0.100 folders land in the same group.
+
+        Returns:
+            int: Number of imported seed sets.
+        """
+        imported = 0
+        for sizeDir in sorted(os.listdir(csvRoot)):
+            if "x" not in sizeDir or not os.path.isdir(os.path.join(csvRoot, sizeDir)):
+                continue
+            try:
+                width, height = (float(v) for v in sizeDir.split("x"))
+            except ValueError:
+                continue
+            width = int(width) if width.is_integer() else width
+            height = int(height) if height.is_integer() else height
+            for numDir in sorted(os.listdir(os.path.join(csvRoot, sizeDir))):
+                if not numDir.startswith("numP_"):
+                    continue
+                for ratioDir in sorted(os.listdir(os.path.join(csvRoot, sizeDir, numDir))):
+                    if not ratioDir.startswith("ratio_"):
+                        continue
+                    ratio = float(ratioDir[len("ratio_"):])
+                    folder = os.path.join(csvRoot, sizeDir, numDir, ratioDir)
+                    for fn in sorted(os.listdir(folder)):
+                        if not fn.endswith(".csv"):
+                            continue
+                        X = np.loadtxt(os.path.join(folder, fn), delimiter=",", ndmin=2)[:, :2]
+                        placed = int((X != 0).any(axis=1).sum())
+                        self.append(X, width, height, ratio,
+                                    {"Method": fn.rsplit("_", 1)[0], "Placed": placed})
+                        imported += 1
+        return imported
@@ -0,0 +1,298 @@
+import numpy as np
+import os, csv, sqlite3
+from seedArchive import SeedArchive
+
+# One row per stored seed set, CSV file or archive record
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seedSets (
+    location   TEXT PRIMARY KEY, -- CSV path or "<archive group folder>#<sample>"
+    kind       TEXT NOT NULL,    -- "csv" or "archive"
+    container  TEXT NOT NULL,    -- folder holding the set
+    sample     INTEGER,          -- file index (<method>_<i>.csv) or archive sample id
+    width      REAL, height REAL, numP INTEGER,
+    ratio      REAL,             -- rounded to 3 decimals, ratio_0.10 == ratio_0.100
+    method     TEXT,
+    seed       TEXT,             -- 64-bit seeds do not fit a signed INTEGER
+    status     TEXT,
+    time_s     REAL,
+    attempts   INTEGER,
+    rejects    INTEGER,
+    placed     INTEGER,
+    minSpacing REAL,             -- smallest distance between two placed seeds
+    mtime      REAL,             -- file stamp of the last scan, for the incremental rescan
+    size       INTEGER
+);
+CREATE INDEX IF NOT EXISTS seedSetsParams ON seedSets (width, height, numP, ratio, method, status);
+CREATE INDEX IF NOT EXISTS seedSetsContainer ON seedSets (container);
+"""
+
+# Columns filled from the run info (sink info / archive index), never overwritten by a rescan
+_RUN_COLUMNS = {"Seed": "seed", "Status": "status", "Time_s": "time_s",
+                "Attempts": "attempts", "Rejects": "rejects"}
+
+
+def normalize_ratio(ratio):
+    """
+    Ratio key of the catalog, so the "ratio_0.10" and "ratio_0.100" folders are one group.
+    """
+    return round(float(ratio), 3)
+
+
+def seed_spacing(X):
+    """
+    Placed count and minimum spacing of a seed set. Unplaced rows of a timed-out run are
+    all zero and are left out.
+
+    Returns:
+        (int, float or None): placed seeds, smallest distance between two of them
+                              (None with fewer than 2 seeds).
+    """
+    X = np.asarray(X, dtype=float)
+    X = X[(X != 0).any(axis=1)]
+    if len(X) < 2:
+        return len(X), None
+    from scipy.spatial import KDTree
+    d, _ = KDTree(X).query(X, k=2)
+    return len(X), float(d[:, 1].min())
+
+
+def _parse_size(name):
+    """'50x50' -> (50.0, 50.0), None for any other folder name."""
+    try:
+        w, h = (float(v) for v in name.split("x"))
+    except ValueError:
+        return None
+    return w, h
+
+
+class SeedCatalog:
+    def __init__(self, path=os.path.join("assetss", "seedCatalog.sqlite")):
+        """
+        Persistent SQLite index of every generated seed set (legacy CSV tree and SeedArchive
+        groups), so batch jobs can pick sets by size, numP and ratio without walking the
+        folders and reading thousands of files.
+
+        Every set is stored with its parameters, file location, placed count and minimum
+        spacing. The run info (seed, status, runtime, attempts, rejects) is known for sets
+        registered at save time (PointAllocationProcess.catalog) and for archive records;
+        old CSVs only get "Completed" / "Incomplete" from their placed count.
+
+        Parameters:
+            path (str): SQLite database file, created if it does not exist.
+        """
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30.0)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _upsert(self, row):
+        """
+        Insert or refresh one set. On a refresh only the file-derived columns change, the run
+        info recorded at save time is kept unless the new row carries a value.
+        """
+        cols = list(row)
+        updates = ", ".join(
+            f"{c} = COALESCE(excluded.{c}, {c})" if c in _RUN_COLUMNS.values() else f"{c} = excluded.{c}"
+            for c in cols if c != "location")
+        self.db.execute(
+            f"INSERT INTO seedSets ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))}) "
+            f"ON CONFLICT(location) DO UPDATE SET {updates}",
+            [row[c] for c in cols])
+
+    def register(self, location, X, info):
+        """
+        Add a set right after it was saved (called by PointAllocationProcess.saveSeeds).
+
+        Parameters:
+            location (str): CSV path or "<folder>#<sample>" archive reference returned by the save.
+            X (np.ndarray): (numP, 2) seeds.
+            info (dict): Run info (Method, numP, Width, Height, Ratio, Seed, Status, Time_s, ...).
+        """
+        placed, spacing = seed_spacing(X)
+        if "#" in location:
+            container, sample = location.rsplit("#", 1)
+            kind, mtime, size = "archive", None, None
+        else:
+            container = os.path.dirname(location)
+            sample = location[:-len(".csv")].rsplit("_", 1)[-1]
+            kind = "csv"
+            st = os.stat(location)
+            mtime, size = st.st_mtime, st.st_size
+        row = {"location": location, "kind": kind, "container": container,
+               "sample": int(sample) if str(sample).isdigit() else None,
+               "width": float(info["Width"]), "height": float(info["Height"]),
+               "numP": int(info["numP"]), "ratio": normalize_ratio(info["Ratio"]),
+               "method": info.get("Method"), "placed": placed, "minSpacing": spacing,
+               "mtime": mtime, "size": size}
+        for key, col in _RUN_COLUMNS.items():
+            value = info.get(key, "")
+            row[col] = None if value in ("", None) else (str(value) if col == "seed" else value)
+        self._upsert(row)
+        self.db.commit()
+
+    def scan(self, csvRoot=os.path.join("assetss", "csvFile"), archiveRoot=os.path.join("assetss", "seedArchive")):
+        """
+        Incremental rescan of the CSV tree and the archive.
+
+        CSV files whose modification time and size are unchanged are skipped, entries of
+        deleted files are dropped. Archive groups are append-only, so only the records past
+        the last catalogued sample id are read (through the memory map).
+
+        Returns:
+            dict: {"added": n, "updated": n, "removed": n} counts of this scan.
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        if csvRoot and os.path.isdir(csvRoot):
+            self._scan_csv(csvRoot, counts)
+        if archiveRoot and os.path.isdir(archiveRoot):
+            self._scan_archive(archiveRoot, counts)
+        self.db.commit()
+        return counts
+
+    def _scan_csv(self, csvRoot, counts):
+        prefix = os.path.join(csvRoot, "")
+        known = {r["location"]: (r["mtime"], r["size"]) for r in self.db.execute(
+            "SELECT location, mtime, size FROM seedSets WHERE kind = 'csv'")
+            if r["location"].startswith(prefix)}
+        seen = set()
+
+        for sizeEntry in os.scandir(csvRoot):
+            wh = _parse_size(sizeEntry.name) if sizeEntry.is_dir() else None
+            if wh is None:
+                continue
+            for numEntry in os.scandir(sizeEntry.path):
+                if not (numEntry.is_dir() and numEntry.name.startswith("numP_")):
+                    continue
+                numP = int(numEntry.name[len("numP_"):])
+                for ratioEntry in os.scandir(numEntry.path):
+                    if not (ratioEntry.is_dir() and ratioEntry.name.startswith("ratio_")):
+                        continue
+                    ratio = normalize_ratio(ratioEntry.name[len("ratio_"):])
+                    for f in os.scandir(ratioEntry.path):
+                        if not f.name.endswith(".csv"):
+                            continue
+                        seen.add(f.path)
+                        st = f.stat()
+                        if known.get(f.path) == (st.st_mtime, st.st_size):
+                            continue
+                        counts["updated" if f.path in known else "added"] += 1
+
+                        X = np.loadtxt(f.path, delimiter=",", ndmin=2)[:, :2]
+                        placed, spacing = seed_spacing(X)
+                        method, _, sample = f.name[:-len(".csv")].rpartition("_")
+                        self._upsert({"location": f.path, "kind": "csv", "container": ratioEntry.path,
+                                      "sample": int(sample) if sample.isdigit() else None,
+                                      "width": wh[0], "height": wh[1], "numP": numP, "ratio": ratio,
+                                      "method": method or None,
+                                      "placed": placed, "minSpacing": spacing,
+                                      "mtime": st.st_mtime, "size": st.st_size})
+                        # A file found by the scan keeps its registered status
+                        self.db.execute("UPDATE seedSets SET status = ? WHERE location = ? AND status IS NULL",
+                                        ("Completed" if placed == numP else "Incomplete", f.path))
+
+        gone = [loc for loc in known if loc not in seen]
+        self.db.executemany("DELETE FROM seedSets WHERE location = ?", [(loc,) for loc in gone])
+        counts["removed"] += len(gone)
+
+    def _scan_archive(self, archiveRoot, counts):
+        for directory, _, files in os.walk(archiveRoot):
+            if "index.csv" not in files or "seeds.bin" not in files:
+                continue
+            last = self.db.execute("SELECT MAX(sample) FROM seedSets WHERE kind = 'archive' AND container = ?",
+                                   (directory,)).fetchone()[0]
+            start = -1 if last is None else last
+            with open(os.path.join(directory, "index.csv"), newline="") as f:
+                rows = [r for r in csv.DictReader(f) if int(r["Sample"]) > start]
+            if not rows:
+                continue
+
+            parts = os.path.normpath(directory).split(os.sep)
+            wh = _parse_size(parts[-3])
+            numP = int(parts[-2][len("numP_"):])
+            ratio = normalize_ratio(parts[-1][len("ratio_"):])
+            records = SeedArchive.open_group(directory)
+            for r in rows:
+                sample = int(r["Sample"])
+                if sample >= len(records):
+                    continue # index row written, record not flushed yet
+                placed, spacing = seed_spacing(records[sample])
+                row = {"location": f"{directory}#{sample}", "kind": "archive", "container": directory,
+                       "sample": sample, "width": wh[0], "height": wh[1], "numP": numP, "ratio": ratio,
+                       "method": r["Method"] or None, "placed": placed, "minSpacing": spacing,
+                       "mtime": None, "size": None}
+                for key, col in _RUN_COLUMNS.items():
+                    row[col] = r.get(key) or None
+                self._upsert(row)
+                counts["added"] += 1
+
+    def query(self, width=None, height=None, numP=None, ratio=None, method=None, status=None,
+              minSpacing=None, limit=None, shuffle=False):
+        """
+        Select catalogued sets, every argument left as None is not filtered on.
+
+        Parameters:
+            ratio (float): Matched on the normalized ratio (0.1, 0.10 and 0.100 are the same).
+            status (str or tuple of str): e.g. "Completed".
+            minSpacing (float): Only sets whose minimum spacing is at least this value.
+            limit (int): At most this many sets.
+            shuffle (bool): Random order instead of (ratio, location) order, to pick N
+                            independent sets.
+
+        Returns:
+            list of dict: Catalog rows (location, kind, width, height, numP, ratio, method,
+                          seed, status, time_s, attempts, rejects, placed, minSpacing, ...).
+        """
+        where, args = [], []
+        for col, value in (("width", width), ("height", height), ("numP", numP), ("method", method)):
+            if value is not None:
+                where.append(f"{col} = ?")
+                args.append(value)
+        if ratio is not None:
+            where.append("ratio = ?")
+            args.append(normalize_ratio(ratio))
+        if status is not None:
+            status = (status,) if isinstance(status, str) else tuple(status)
+            where.append(f"status IN ({', '.join('?' * len(status))})")
+            args.extend(status)
+        if minSpacing is not None:
+            where.append("minSpacing >= ?")
+            args.append(minSpacing)
+
+        sql = "SELECT * FROM seedSets"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY RANDOM()" if shuffle else " ORDER BY ratio, location"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        return [dict(r) for r in self.db.execute(sql, args)]
+
+    def summary(self):
+        """
+        Number of sets per (width, height, numP, ratio, method, status).
+
+        Returns:
+            list of dict
+        """
+        return [dict(r) for r in self.db.execute(
+            "SELECT width, height, numP, ratio, method, status, COUNT(*) AS sets, "
+            "MIN(minSpacing) AS minSpacing FROM seedSets "
+            "GROUP BY width, height, numP, ratio, method, status "
+            "ORDER BY width, height, numP, ratio, method, status")]
+
+    @staticmethod
+    def load(row):
+        """
+        Read the seeds of one catalog row (a dict returned by query).
+
+        Returns:
+            np.ndarray: (numP, 2) float64 seeds.
+        """
+        if row["kind"] == "archive":
+            return np.array(SeedArchive.open_group(row["container"])[row["sample"]], dtype=float)
+        return np.loadtxt(row["location"], delimiter=",", ndmin=2)[:, :2]
@@ -0,0 +1,115 @@
+import math
+import numpy as np
+
+# The 3x3 block of cells around a cell
+_OFFSETS = tuple((di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1))
+
+
+class SeedGrid:
+    def __init__(self, minx, miny, maxx, maxy, cellSize, capacity=4):
+        """
+        Dense array version of SpatialHashGrid for very large seed sets.
+
+        Every cell stores the indices (into the caller's seed array) of the seeds inside it in
+        a fixed-size slot row, so the whole grid is two int32 arrays instead of a dict of
+        Python lists, and a whole block of candidates can be tested in a few vectorized
+        gathers. The slot rows grow (doubling) if a cell ever overflows.
+
+        Parameters:
+            minx, miny, maxx, maxy (float): Area covered by the grid.
+            cellSize (float): Cell side, must be >= the inhibition distance (3x3 block check).
+            capacity (int): Initial number of slots per cell.
+
+        After initialization, these instance attributes are set:
+            self.nx, self.ny: Number of cells per axis.
+            self.slots: (nx * ny + 1, capacity) int32 seed indices, -1 = empty. The extra
+                        last row is always empty and stands for cells outside the grid.
+            self.counts: (nx * ny + 1,) int32 number of seeds per cell.
+        """
+        self.minx, self.miny = minx, miny
+        self.cellSize = cellSize if cellSize > 0 else 1.0
+        self.nx = max(1, int(math.ceil((maxx - minx) / self.cellSize)))
+        self.ny = max(1, int(math.ceil((maxy - miny) / self.cellSize)))
+        self.outside = self.nx * self.ny
+        self.slots = np.full((self.outside + 1, capacity), -1, dtype=np.int32)
+        self.counts = np.zeros(self.outside + 1, dtype=np.int32)
+
+    @property
+    def nbytes(self):
+        return self.slots.nbytes + self.counts.nbytes
+
+    def cells_of(self, pts):
+        """(ci, cj) cell coordinates of an (m, 2) array of points (clipped to the grid)."""
+        ci = np.clip(((pts[:, 0] - self.minx) / self.cellSize).astype(np.int64), 0, self.nx - 1)
+        cj = np.clip(((pts[:, 1] - self.miny) / self.cellSize).astype(np.int64), 0, self.ny - 1)
+        return ci, cj
+
+    def insert(self, index, x, y):
+        """
+        Add seed number `index` located at (x, y).
+        """
+        ci = min(max(int((x - self.minx) / self.cellSize), 0), self.nx - 1)
+        cj = min(max(int((y - self.miny) / self.cellSize), 0), self.ny - 1)
+        cell = ci * self.ny + cj
+        k = self.counts[cell]
+        if k == self.slots.shape[1]:
+            grown = np.full((self.slots.shape[0], 2 * k), -1, dtype=np.int32)
+            grown[:, :k] = self.slots
+            self.slots = grown
+        self.slots[cell, k] = index
+        self.counts[cell] = k + 1
+
+    def insert_block(self, start, pts):
+        """
+        Add the seeds pts (m, 2) as numbers start, start + 1, ... in one vectorized step
+        (e.g. all seeds of a finished tile).
+        """
+        if len(pts) == 0:
+            return
+        ci, cj = self.cells_of(np.asarray(pts, dtype=np.float64))
+        cell = ci * self.ny + cj
+        order = np.argsort(cell, kind="stable")
+        sortedCells = cell[order]
+        first = np.searchsorted(sortedCells, sortedCells) # first position of every cell run
+        slot = self.counts[sortedCells] + (np.arange(len(order)) - first)
+
+        need = int(slot.max()) + 1
+        if need > self.slots.shape[1]:
+            cap = self.slots.shape[1]
+            while cap < need:
+                cap *= 2
+            grown = np.full((self.slots.shape[0], cap), -1, dtype=np.int32)
+            grown[:, :self.slots.shape[1]] = self.slots
+            self.slots = grown
+        self.slots[sortedCells, slot] = start + order
+        self.counts += np.bincount(cell, minlength=len(self.counts)).astype(np.int32)
+
+    def conflicts(self, pts, X, dis):
+        """
+        Vectorized inhibition test of a block of candidates against the stored seeds.
+
+        Parameters:
+            pts (np.ndarray): (m, 2) candidates.
+            X (np.ndarray): Seed array the stored indices refer to.
+            dis (float): Inhibition distance (<= cellSize).
+
+        Returns:
+            np.ndarray: (m,) boolean mask, True where a seed is within dis (same <= rule as
+                        SpatialHashGrid.has_neighbour_within).
+        """
+        ci, cj = self.cells_of(pts)
+        d2max = dis * dis
+        hit = np.zeros(len(pts), dtype=bool)
+        for di, dj in _OFFSETS:
+            ni, nj = ci + di, cj + dj
+            cell = np.where((ni >= 0) & (ni < self.nx) & (nj >= 0) & (nj < self.ny),
+                            ni * self.ny + nj, self.outside)
+            idx = self.slots[cell]                 # (m, capacity)
+            valid = idx >= 0
+            if not valid.any():
+                continue
+            s = X[np.maximum(idx, 0)]              # (m, capacity, 2)
+            dx = s[..., 0] - pts[:, None, 0]
+            dy = s[..., 1] - pts[:, None, 1]
+            hit |= (valid & (dx * dx + dy * dy <= d2max)).any(axis=1)
+        return hit
@@ -0,0 +1,286 @@
+import numpy as np
+import os, csv, warnings
+from datetime import datetime
+from scipy.spatial import KDTree
+from concurrent.futures import ProcessPoolExecutor
+from polygonDomain import PolygonDomain
+from seedArchive import SeedArchive
+from seedCatalog import SeedCatalog, normalize_ratio, _parse_size
+from seedMaxDis import seedMaxDis
+
+# Radii of K, L and g, and bin edges of the nearest-neighbour histograms, in units of r_max
+DEFAULT_RADII   = np.linspace(0.0, 3.0, 61)
+DEFAULT_NN_BINS = np.linspace(0.0, 2.0, 41)
+
+SUMMARY_HEADER = ("Width","Height","numP","Ratio","Sets","MeanPlaced",
+                  "MinSpacing","Delta_mean","Delta_std","Delta_min",
+                  "NN_mean","NN_cv","g_peak","r_gpeak")
+
+
+def boundary_distance(pts, domain):
+    """
+    Distance of every point to the nearest boundary edge of the domain (outline and holes),
+    used for the border edge correction of K.
+    """
+    edges = domain.boundary_edges()
+    a = edges[:, 0]
+    ab = edges[:, 1] - a
+    ap = pts[:, None, :] - a[None]
+    t = np.clip((ap * ab).sum(axis=2) / np.maximum((ab * ab).sum(axis=1), 1e-300), 0.0, 1.0)
+    d = ap - t[..., None] * ab
+    return np.sqrt((d * d).sum(axis=2)).min(axis=1)
+
+
+def _per_set(values, setId, m, R, keys):
+    """Cumulative counts per set: out[s, k] = number of values of set s with key <= k."""
+    counts = np.bincount(setId * (R + 1) + keys, minlength=m * (R + 1)).reshape(m, R + 1)
+    return counts.cumsum(axis=1)[:, :R]
+
+
+def analyze_sets(sets, domain, radii=DEFAULT_RADII, bins=DEFAULT_NN_BINS):
+    """
+    Spatial statistics of many seed sets of one group (same domain and numP) at once.
+
+    All sets are shifted apart along x and put in one KDTree, so the nearest-neighbour
+    queries and the pair search of every set run as a single vectorized call instead of a
+    pdist (O(n^2) memory) per set. The shift is larger than the domain diagonal plus the
+    largest radius, so no set ever sees a neighbour of another set.
+
+    Per set:
+        placed      : placed seeds (all-zero rows of timed-out runs are left out)
+        minSpacing  : smallest nearest-neighbour distance
+        meanNN, stdNN : mean and standard deviation of the nearest-neighbour distances
+        delta       : regularity, minSpacing / r_max (r_max = seedMaxDis(area, numP))
+        nnHist      : nearest-neighbour distance histogram on `bins`, fraction of the seeds
+        K, L        : Ripley's K and L = sqrt(K / pi) at `radii`, border edge correction
+                      (only seeds at least r away from the boundary are centres for radius r)
+        g           : pair correlation g(r) per radius bin, from the increments of K
+
+    Parameters:
+        sets (np.ndarray): (m, numP, 2) seed sets, e.g. a slice of SeedArchive.open_group.
+        domain (PolygonDomain): Panel the sets were generated in.
+        radii (np.ndarray): Increasing radii in units of r_max (K, L, g).
+        bins (np.ndarray): Histogram bin edges in units of r_max (nnHist).
+
+    Returns:
+        dict: rMax, radii, bins (scaled back to lengths) and one array per statistic above,
+              first axis = set (g has len(radii) - 1 columns, nnHist len(bins) - 1).
+    """
+    sets = np.asarray(sets, dtype=float)
+    m, numP = sets.shape[:2]
+    rMax = seedMaxDis(domain.area, numP)
+    r = np.asarray(radii, dtype=float) * rMax
+    edges = np.asarray(bins, dtype=float) * rMax
+    R = len(r)
+
+    mask = (sets != 0).any(axis=2)
+    placed = mask.sum(axis=1)
+    setId = np.repeat(np.arange(m), placed) # row-major order, same as sets[mask]
+    P = sets[mask]
+    b = boundary_distance(P, domain)
+
+    diag = np.hypot(domain.maxx - domain.minx, domain.maxy - domain.miny)
+    shifted = P.copy()
+    shifted[:, 0] += setId * (diag + 2 * r[-1] + 1.0)
+    tree = KDTree(shifted)
+
+    # Nearest neighbours, inf for a seed alone in its set
+    d, _ = tree.query(shifted, k=2, distance_upper_bound=diag * (1 + 1e-9))
+    nn = d[:, 1]
+    finite = np.isfinite(nn)
+    nnCount = np.bincount(setId[finite], minlength=m)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        meanNN = np.bincount(setId[finite], nn[finite], minlength=m) / nnCount
+        stdNN = np.sqrt(np.maximum(np.bincount(setId[finite], nn[finite] ** 2, minlength=m) / nnCount - meanNN ** 2, 0.0))
+    minSpacing = np.full(m, np.inf)
+    np.minimum.at(minSpacing, setId, nn)
+    minSpacing[~np.isfinite(minSpacing)] = np.nan
+
+    B = len(edges) - 1
+    k = np.searchsorted(edges, nn[finite], side="right") - 1
+    inside = (k >= 0) & (k < B)
+    nnHist = np.bincount(setId[finite][inside] * B + k[inside], minlength=m * B).reshape(m, B).astype(float)
+    nnHist /= np.maximum(placed, 1)[:, None]
+
+    # Ordered pairs (i, j) with d_ij <= r[-1]; pair counts up to every radius, for centres
+    # i far enough from the boundary (d_ij <= r <= b_i)
+    pairs = tree.query_pairs(r[-1], output_type="ndarray")
+    dij = np.hypot(*(shifted[pairs[:, 0]] - shifted[pairs[:, 1]]).T)
+    i = pairs.T.ravel() # centre of each ordered pair, (i, j) then (j, i)
+    dij = np.concatenate((dij, dij))
+    bi = b[i]
+    keep = dij <= bi
+    sPair, dPair, bPair = setId[i[keep]], dij[keep], bi[keep]
+    pairCount = (_per_set(dPair, sPair, m, R, np.searchsorted(r, dPair, side="left"))
+                 - _per_set(bPair, sPair, m, R, np.searchsorted(r, bPair, side="right")))
+    centres = placed[:, None] - _per_set(b, setId, m, R, np.searchsorted(r, b, side="right"))
+
+    lam = placed / domain.area
+    with np.errstate(invalid="ignore", divide="ignore"):
+        K = np.where(centres > 0, pairCount / (lam[:, None] * centres), np.nan)
+        g = np.diff(K, axis=1) / (np.pi * np.diff(r ** 2))
+    L = np.sqrt(K / np.pi)
+
+    return {"rMax": rMax, "radii": r, "bins": edges, "placed": placed,
+            "minSpacing": minSpacing, "meanNN": meanNN, "stdNN": stdNN,
+            "delta": minSpacing / rMax, "nnHist": nnHist, "K": K, "L": L, "g": g}
+
+
+def _group_domain(width, height, xp, yp):
+    """The panel polygon if given, else the width x height rectangle at the origin (the runs' panels)."""
+    if xp is None:
+        xp, yp = [0, width, width, 0, 0], [0, 0, height, height, 0]
+    return PolygonDomain(xp, yp)
+
+
+def _analyze_job(job):
+    """
+    Worker entry point, analyses one chunk of sets of one group.
+    Must stay at module level so it can be pickled by ProcessPoolExecutor.
+
+    Parameters:
+        job (tuple): (key, source, xp, yp, radii, bins), key = (width, height, numP, ratio),
+                     source = ("archive", directory, start, stop) or ("catalog", rows).
+    """
+    key, source, xp, yp, radii, bins = job
+    if source[0] == "archive":
+        _, directory, start, stop = source
+        sets = np.array(SeedArchive.open_group(directory)[start:stop], dtype=float)
+    else:
+        sets = np.stack([SeedCatalog.load(row) for row in source[1]])
+    return key, analyze_sets(sets, _group_domain(key[0], key[1], xp, yp), radii, bins)
+
+
+def _run_jobs(jobs, workers):
+    """Run the jobs on a process pool and concatenate the per-set results of every group."""
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for key, part in executor.map(_analyze_job, jobs):
+            if key not in results:
+                results[key] = part
+                continue
+            merged = results[key]
+            for name, value in part.items():
+                if name not in ("rMax", "radii", "bins"):
+                    merged[name] = np.concatenate((merged[name], value))
+    return results
+
+
+def analyze_archive(root=os.path.join("assetss", "seedArchive"), width=None, height=None, numP=None,
+                    ratio=None, xp=None, yp=None, radii=DEFAULT_RADII, bins=DEFAULT_NN_BINS,
+                    chunk=128, workers=None):
+    """
+    analyze_sets over every group of a SeedArchive, streamed `chunk` sets at a time from the
+    memory-mapped seeds.bin files and spread over a process pool.
+
+    Parameters:
+        root (str): Archive folder.
+        width, height, numP, ratio: Only groups matching the given values (None = all).
+        xp, yp (list, optional): Panel polygon, defaults to the width x height rectangle at
+                                 the origin of each group.
+        chunk (int): Sets per job.
+        workers (int): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        dict: (width, height, numP, ratio) -> analyze_sets result over all sets of the group.
+    """
+    jobs = []
+    for dirpath, _, files in sorted(os.walk(root)):
+        if "meta.json" not in files or "seeds.bin" not in files:
+            continue
+        ratioDir = os.path.basename(dirpath)
+        numDir = os.path.basename(os.path.dirname(dirpath))
+        size = _parse_size(os.path.basename(os.path.dirname(os.path.dirname(dirpath))))
+        if size is None or not numDir.startswith("numP_") or not ratioDir.startswith("ratio_"):
+            continue
+        key = (size[0], size[1], int(numDir[len("numP_"):]), normalize_ratio(ratioDir[len("ratio_"):]))
+        if ((width is not None and key[0] != width) or (height is not None and key[1] != height) or
+                (numP is not None and key[2] != numP) or (ratio is not None and key[3] != normalize_ratio(ratio))):
+            continue
+        n = len(SeedArchive.open_group(dirpath))
+        for start in range(0, n, chunk):
+            jobs.append((key, ("archive", dirpath, start, min(start + chunk, n)), xp, yp, radii, bins))
+    return _run_jobs(jobs, workers)
+
+
+def analyze_catalog(catalog, xp=None, yp=None, radii=DEFAULT_RADII, bins=DEFAULT_NN_BINS,
+                    chunk=128, workers=None, **query):
+    """
+    analyze_sets over the sets selected by catalog.query(**query) (CSV files and archive
+    records alike), grouped by (width, height, numP, ratio).
+
+    Returns:
+        dict: (width, height, numP, ratio) -> analyze_sets result, see analyze_archive.
+    """
+    groups = {}
+    for row in catalog.query(**query):
+        groups.setdefault((row["width"], row["height"], row["numP"], row["ratio"]), []).append(row)
+    jobs = [(key, ("catalog", rows[s:s + chunk]), xp, yp, radii, bins)
+            for key, rows in sorted(groups.items()) for s in range(0, len(rows), chunk)]
+    return _run_jobs(jobs, workers)
+
+
+def _mean_curve(values):
+    """Mean over the sets ignoring NaN (radii without any centre stay NaN, without a warning)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(values, axis=0)
+
+
+def summary_table(results):
+    """
+    One row per group (SUMMARY_HEADER): regularity delta, nearest-neighbour mean and
+    coefficient of variation (in units of r_max) and the first peak of the mean g(r).
+    """
+    rows = []
+    for (w, h, numP, ratio), res in sorted(results.items()):
+        rMax = res["rMax"]
+        delta = res["delta"][np.isfinite(res["delta"])]
+        gMean = _mean_curve(res["g"]) if len(res["g"]) else np.full(len(res["radii"]) - 1, np.nan)
+        mids = (res["radii"][1:] + res["radii"][:-1]) / 2 / rMax
+        peak = int(np.nanargmax(gMean)) if np.isfinite(gMean).any() else None
+        rows.append({"Width": w, "Height": h, "numP": numP, "Ratio": ratio,
+                     "Sets": len(res["placed"]), "MeanPlaced": float(np.mean(res["placed"])),
+                     "MinSpacing": float(np.nanmin(res["minSpacing"])) if len(delta) else "",
+                     "Delta_mean": float(delta.mean()) if len(delta) else "",
+                     "Delta_std": float(delta.std()) if len(delta) else "",
+                     "Delta_min": float(delta.min()) if len(delta) else "",
+                     "NN_mean": float(np.nanmean(res["meanNN"]) / rMax),
+                     "NN_cv": float(np.nanmean(res["stdNN"] / res["meanNN"])),
+                     "g_peak": float(gMean[peak]) if peak is not None else "",
+                     "r_gpeak": float(mids[peak]) if peak is not None else ""})
+    return rows
+
+
+def writeSummaryCSV(rows, path=None):
+    """
+    Write summary_table rows, by default to assetss/statistics/summary_<timestamp>.csv.
+
+    Returns:
+        str: Path of the written CSV.
+    """
+    if path is None:
+        path = os.path.join("assetss", "statistics", f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=SUMMARY_HEADER)
+        w.writeheader()
+        w.writerows(rows)
+    return path
+
+
+def writeCurves(results, path):
+    """
+    Store the mean K, L, g and nearest-neighbour histogram of every group in one .npz,
+    arrays named "<w>x<h>_n<numP>_r<ratio>_<stat>" plus "<...>_radii" / "<...>_bins".
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    arrays = {}
+    for (w, h, numP, ratio), res in results.items():
+        name = f"{w:g}x{h:g}_n{numP}_r{ratio:.3f}"
+        arrays[name + "_radii"] = res["radii"]
+        arrays[name + "_bins"] = res["bins"]
+        for stat in ("K", "L", "g", "nnHist"):
+            arrays[f"{name}_{stat}"] = _mean_curve(res[stat]) if len(res[stat]) else res[stat]
+    np.savez(path, **arrays)
+    return path
@@ -0,0 +1,71 @@
+import math
+
+
+class SpatialHashGrid:
+    def __init__(self, minx, miny, cellSize):
+        """
+        Uniform cell grid used to answer "is there a seed within the inhibition distance?"
+        without comparing the candidate against every placed seed.
+
+        Parameters:
+            minx, miny (float): Origin of the grid (usually the polygon's bounding-box corner).
+            cellSize (float): Side length of one cell. Using the inhibition distance here means
+                              a conflicting seed can only be in the candidate's cell or one of
+                              its 8 neighbours (3x3 block).
+
+        After initialization, these instance attributes are set:
+            self.cells: dict mapping (i, j) cell index -> list of (x, y) seeds stored in that cell.
+            self.count: Number of seeds inserted so far.
+        """
+        self.minx = minx
+        self.miny = miny
+        # A zero inhibition distance (ratio = 0) would give a zero cell size,
+        # any positive size is still correct, so fall back to 1.0
+        self.cellSize = cellSize if cellSize > 0 else 1.0
+        self.cells = {}
+        self.count = 0
+
+    def cell_of(self, x, y):
+        """
+        Get the (i, j) index of the cell containing the point (x, y).
+        """
+        return (int(math.floor((x - self.minx) / self.cellSize)),
+                int(math.floor((y - self.miny) / self.cellSize)))
+
+    def insert(self, x, y):
+        """
+        Store an accepted seed. O(1), no arrays are reallocated.
+        """
+        key = self.cell_of(x, y)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [(x, y)]
+        else:
+            bucket.append((x, y))
+        self.count += 1
+
+    def has_neighbour_within(self, x, y, dis):
+        """
+        Check whether any stored seed lies within `dis` of the point (x, y).
+
+        The comparison is `distance <= dis`, the same rule the pdist based SSI loop uses,
+        so swapping this in does not change which candidates are rejected.
+        `dis` must not be larger than the cell size, otherwise the 3x3 block is not enough.
+
+        Returns:
+            bool: True if the candidate violates the inhibition distance.
+        """
+        ci, cj = self.cell_of(x, y)
+        dis2 = dis * dis
+        cells = self.cells
+        for i in (ci - 1, ci, ci + 1):
+            for j in (cj - 1, cj, cj + 1):
+                bucket = cells.get((i, j))
+                if bucket is None:
+                    continue
+                for sx, sy in bucket:
+                    dx = sx - x
+                    dy = sy - y
+                    if dx * dx + dy * dy <= dis2:
+                        return True
+        return False
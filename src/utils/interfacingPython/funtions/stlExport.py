@@ -0,0 +1,198 @@
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from polygonDomain import PolygonDomain
+import voronoiLattice
+from seedCatalog import SeedCatalog
+from stlWriter import write_binary_stl
+
+
+def _ring_triangles(outer, inner):
+    """
+    Triangulate the ring between a cell (outer) and its void (inner), both counter-clockwise.
+
+    Both loops are walked by their angle around the void centroid and stitched together,
+    which is valid as long as both are star-shaped from that point (always true for the
+    convex cells of a convex panel).
+
+    Returns:
+        np.ndarray: (T, 3, 2) counter-clockwise triangles.
+    """
+    c = inner.mean(axis=0)
+    thA = np.arctan2(outer[:, 1] - c[1], outer[:, 0] - c[0])
+    thB = np.arctan2(inner[:, 1] - c[1], inner[:, 0] - c[0])
+    thA = np.mod(thA - thB[0], 2 * np.pi)
+    thB = np.mod(thB - thB[0], 2 * np.pi)
+
+    A = np.roll(outer, -int(np.argmin(thA)), axis=0)
+    thA = np.roll(thA, -int(np.argmin(thA)))
+    nA, nB = len(A), len(inner)
+    # Close both loops, the closing vertex is one full turn further
+    A = np.vstack((A, A[:1]))
+    B = np.vstack((inner, inner[:1]))
+    thA = np.append(thA, thA[0] + 2 * np.pi)
+    thB = np.append(thB, 2 * np.pi)
+
+    tris = []
+    i = j = 0
+    while i < nA or j < nB:
+        if j == nB or (i < nA and thA[i + 1] <= thB[j + 1]):
+            tris.append((A[i], A[i + 1], B[j]))
+            i += 1
+        else:
+            tris.append((A[i], B[j + 1], B[j]))
+            j += 1
+    return np.array(tris)
+
+
+def _fan_triangles(poly):
+    """Fan triangulation of a convex counter-clockwise polygon, (T, 3, 2)."""
+    k = np.arange(1, len(poly) - 1)
+    return np.stack((np.repeat(poly[:1], len(k), axis=0), poly[k], poly[k + 1]), axis=1)
+
+
+def _walls(p, q, depth):
+    """
+    Vertical quads from z=0 to z=depth over the segments p->q, split in 2 triangles each,
+    facing to the right of p->q.
+
+    Returns:
+        np.ndarray: (2 * n, 3, 3) triangles.
+    """
+    z0 = np.zeros((len(p), 1))
+    z1 = np.full((len(p), 1), float(depth))
+    p0, q0 = np.hstack((p, z0)), np.hstack((q, z0))
+    p1, q1 = np.hstack((p, z1)), np.hstack((q, z1))
+    return np.concatenate((np.stack((p0, q0, q1), axis=1), np.stack((p0, q1, p1), axis=1)))
+
+
+def extrude_lattice(cells, voids, domain, depth):
+    """
+    Closed triangle mesh of a lattice panel: the material between every cell and its void,
+    extruded from z=0 to z=depth.
+
+    Top and bottom faces are the per-cell rings (a full cell where the void vanished), the
+    walls are the void outlines plus the cell edges lying on the panel outline. Cell edges
+    shared by two cells are inside the material and produce no wall.
+
+    Parameters:
+        cells (list of np.ndarray): Clipped Voronoi cells (voronoiLattice.voronoi_cells).
+        voids (list of np.ndarray): Matching voids (voronoiLattice.lattice_voids).
+        domain (PolygonDomain): Panel outline.
+        depth (float): Extrusion depth.
+
+    Returns:
+        np.ndarray: (T, 3, 3) triangles, counter-clockwise seen from outside.
+    """
+    top = []
+    voidWalls = []
+    outerP, outerQ = [], []
+    edges = domain.boundary_edges()
+    ea, eb = edges[:, 0], edges[:, 1]
+    ed = eb - ea
+    el2 = (ed * ed).sum(axis=1)
+    tol = 1e-9 * max(domain.maxx - domain.minx, domain.maxy - domain.miny)
+
+    for cell, void in zip(cells, voids):
+        if len(cell) < 3:
+            continue
+        if len(void) >= 3:
+            top.append(_ring_triangles(cell, void))
+            # Void walls face into the void, i.e. to the left of the CCW void outline
+            voidWalls.append(_walls(np.roll(void, -1, axis=0), void, depth))
+        else:
+            top.append(_fan_triangles(cell))
+
+        # Cell edges on the panel outline: midpoint within tol of a boundary segment
+        q = np.roll(cell, -1, axis=0)
+        mid = (cell + q) / 2
+        t = np.clip(((mid[:, None, :] - ea[None]) * ed[None]).sum(axis=2) / el2[None], 0.0, 1.0)
+        closest = ea[None] + t[..., None] * ed[None]
+        dist = np.hypot(*(mid[:, None, :] - closest).transpose(2, 0, 1)).min(axis=1)
+        onOutline = dist <= tol
+        outerP.append(cell[onOutline])
+        outerQ.append(q[onOutline])
+
+    top = np.concatenate(top)
+    n = len(top)
+    up = np.concatenate((top, np.full((n, 3, 1), float(depth))), axis=2)
+    down = np.concatenate((top[:, ::-1], np.zeros((n, 3, 1))), axis=2) # reversed, faces -z
+    # Outline walls face outwards, to the right of the CCW cell edges
+    outer = _walls(np.concatenate(outerP), np.concatenate(outerQ), depth)
+    return np.concatenate([up, down, outer] + voidWalls)
+
+
+def export_lattice_stl(X, xp, yp, thickness, depth, path, frame=None, cache=None):
+    """
+    Seeds -> Voronoi lattice -> extruded mesh -> binary STL, without Rhino.
+
+    Parameters:
+        X (np.ndarray): (numP, 2) seeds.
+        xp, yp (list): Panel polygon vertices.
+        thickness (float): Ligament thickness.
+        depth (float): Extrusion depth.
+        path (str): Output .stl file.
+        frame (float, optional): Frame width along the outline, see voronoiLattice.lattice_voids.
+        cache (voronoiLattice.LatticeCache, optional): Reuse the tessellation of known seed sets.
+
+    Returns:
+        str: path
+    """
+    lattice = voronoiLattice.build_lattice(X, xp, yp, thickness, frame, cache)
+    tris = extrude_lattice(lattice["cells"], lattice["voids"], PolygonDomain(xp, yp), depth)
+    return write_binary_stl(path, tris, name=os.path.splitext(os.path.basename(path))[0])
+
+
+def stl_path(location, root=os.path.join("assetss", "printFiles")):
+    """
+    Output path mirroring the seed set location:
+    assetss/csvFile/<w>x<h>/numP_<n>/ratio_<r>/SSI_3.csv -> <root>/<w>x<h>/numP_<n>/ratio_<r>/SSI_3.stl
+    archive references "<group>#<sample>" -> <root>/<w>x<h>/numP_<n>/ratio_<r>/archive_<sample>.stl
+    """
+    if "#" in location:
+        group, sample = location.rsplit("#", 1)
+        name = f"archive_{sample}"
+    else:
+        group, name = os.path.split(os.path.splitext(location)[0])
+    parts = os.path.normpath(group).split(os.sep)[-3:]
+    return os.path.join(root, *parts, name + ".stl")
+
+
+def _export_job(job):
+    source, xp, yp, thickness, depth, path, frame, cacheRoot = job
+    X = np.loadtxt(source, delimiter=",", ndmin=2)[:, :2] if isinstance(source, str) else source
+    cache = voronoiLattice.LatticeCache(cacheRoot) if cacheRoot is not None else None
+    return export_lattice_stl(X, xp, yp, thickness, depth, path, frame, cache)
+
+
+def export_stl_batch(sources, xp, yp, thickness, depth, paths=None, frame=None,
+                     cacheRoot=os.path.join("assetss", "voronoiCache"), workers=None):
+    """
+    Export many lattices on a process pool, one STL per seed set.
+
+    Parameters:
+        sources (list): CSV paths, (numP, 2) seed arrays or SeedCatalog rows (dicts).
+        paths (list of str, optional): Output files, defaults to stl_path of every CSV path /
+                                       catalog location (required for bare arrays).
+        workers (int): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        list of str: Written STL paths, in input order.
+    """
+    jobs = []
+    for k, src in enumerate(sources):
+        if isinstance(src, dict): # catalog row
+            location = src["location"]
+            src = src["location"] if src["kind"] == "csv" else SeedCatalog.load(src)
+        else:
+            location = src if isinstance(src, str) else None
+        if paths is not None:
+            out = paths[k]
+        elif location is not None:
+            out = stl_path(location)
+        else:
+            raise ValueError("paths is required when seed arrays are passed directly")
+        jobs.append((src, xp, yp, thickness, depth, out, frame, cacheRoot))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_export_job, jobs, chunksize=max(1, len(jobs) // 64)))
@@ -0,0 +1,90 @@
+import numpy as np
+import os
+
+# One binary STL facet, 50 bytes, little-endian, no padding
+STL_DTYPE = np.dtype([("normal", "<f4", (3,)),
+                      ("vertices", "<f4", (3, 3)),
+                      ("attr", "<u2")])
+
+_HEADER_BYTES = 80
+
+
+def facet_normals(tris):
+    """Unit normals of (T, 3, 3) triangles, computed in bulk (zero for degenerate ones)."""
+    n = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = np.linalg.norm(n, axis=1, keepdims=True)
+    return np.divide(n, length, out=np.zeros_like(n), where=length > 0)
+
+
+def stl_facets(tris, out=None):
+    """
+    Assemble triangles into STL facet records.
+
+    Parameters:
+        tris (np.ndarray): (T, 3, 3) triangles.
+        out (np.ndarray, optional): (T,) STL_DTYPE array (e.g. a memory map) to fill in place.
+
+    Returns:
+        np.ndarray: (T,) STL_DTYPE array.
+    """
+    tris = np.asarray(tris)
+    if out is None:
+        out = np.empty(len(tris), dtype=STL_DTYPE)
+    out["normal"] = facet_normals(tris.astype(np.float64, copy=False))
+    out["vertices"] = tris
+    out["attr"] = 0
+    return out
+
+
+def _header(name, count):
+    return name.encode()[:_HEADER_BYTES].ljust(_HEADER_BYTES, b" ") + np.uint32(count).astype("<u4").tobytes()
+
+
+def write_binary_stl(path, tris, name="lattice", memmapAbove=1 << 22, chunk=1 << 20):
+    """
+    Write triangles as a binary STL file.
+
+    Small meshes are assembled into one STL_DTYPE array and written with a single buffer
+    write. Above `memmapAbove` facets the file is sized up front and filled through a memory
+    map, `chunk` facets at a time, so no second full-size copy of the mesh is held in memory.
+
+    Parameters:
+        path (str): Output .stl file.
+        tris (np.ndarray): (T, 3, 3) triangles.
+        name (str): Text of the 80 byte header.
+        memmapAbove (int): Facet count from which the memory-mapped path is used.
+        chunk (int): Facets per block on the memory-mapped path.
+
+    Returns:
+        str: path
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    n = len(tris)
+    if n < memmapAbove:
+        with open(path, "wb") as f:
+            f.write(_header(name, n))
+            stl_facets(tris).tofile(f) # straight from the facet buffer, no bytes copy
+        return path
+
+    with open(path, "wb") as f:
+        f.write(_header(name, n))
+        f.truncate(_HEADER_BYTES + 4 + n * STL_DTYPE.itemsize)
+    mm = np.memmap(path, dtype=STL_DTYPE, mode="r+", offset=_HEADER_BYTES + 4, shape=(n,))
+    for start in range(0, n, chunk):
+        stl_facets(tris[start:start + chunk], out=mm[start:start + chunk])
+    mm.flush()
+    del mm
+    return path
+
+
+def read_binary_stl(path):
+    """
+    Memory-mapped view of the facets of a binary STL file (nothing is read until used).
+
+    Returns:
+        np.ndarray: (T,) STL_DTYPE array, tris are in ["vertices"], normals in ["normal"].
+    """
+    with open(path, "rb") as f:
+        f.seek(_HEADER_BYTES)
+        n = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+    return np.memmap(path, dtype=STL_DTYPE, mode="r", offset=_HEADER_BYTES + 4, shape=(n,))
@@ -0,0 +1,349 @@
+import PointAllocationProcess as Process
+import numpy as np
+import os, csv, json
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Same columns as the runtime logs written by run.py
+LOG_HEADER = ("Method","numP","Width","Height",
+              "Ratio","Sample","Time_s","Status",
+              "Attempts","Rejects","Seed",
+              "Placed","EstMaxSeeds","Cache")
+
+# What to do when a job reports "Timeout" (or "Jammed")
+#   "stop_sweep" : nothing after the timed-out job (in ratio, sample order) is run or logged.
+#                  This is what the original run.py loops meant to do with their `timeouted`
+#                  flag, but their outer check sat after the inner break, so they went on
+#                  with one sample of every later ratio (a broken stop_sweep, not a policy).
+#   "skip_ratio" : the remaining samples of the same ratio are skipped, the next ratio still runs
+#   "continue"   : every job runs
+POLICIES = ("stop_sweep", "skip_ratio", "continue")
+
+
+def spawn_seeds(baseSeed, n):
+    """
+    Independent, reproducible seeds for n runs.
+
+    The streams come from SeedSequence(baseSeed).spawn(n), so parallel workers never share or
+    overlap a stream. Each child is reduced to one 64-bit int, which is what gets written to
+    the "Seed" log column: PointAllocationProcess(xp, yp, rng=seed) replays that single run.
+
+    Parameters:
+        baseSeed (int or None): Root seed of the sweep, None draws fresh OS entropy.
+        n (int): Number of seeds.
+
+    Returns:
+        list of int: One seed per run, in job order.
+    """
+    children = np.random.SeedSequence(baseSeed).spawn(n)
+    return [int(c.generate_state(1, np.uint64)[0]) for c in children]
+
+
+def format_estimate(value):
+    """Log cell for an optional estimate ("" when the run had no JammingMonitor)."""
+    return f"{value:.1f}" if value != "" else ""
+
+
+def _run_job(job):
+    """
+    Worker entry point, runs one (ratio, sample) job in a pool process.
+    Must stay at module level so it can be pickled by ProcessPoolExecutor.
+
+    Parameters:
+        job (tuple): (jobIndex, xp, yp, holes, method, numP, ratio, sample, timeout, seed, jamming, cache)
+
+    Returns:
+        tuple: (jobIndex, status, run_time, attempts, rejects, lastRunStats)
+    """
+    jobIndex, xp, yp, holes, method, numP, ratio, sample, timeout, seed, jamming, cache = job
+
+    runner = Process.PointAllocationProcess(xp, yp, method, rng=seed, holes=holes)
+    if jamming is not None:
+        runner.enable_jamming_stop(**jamming)
+    runner.cache = cache
+    # The sampler checks the timeout itself, this is the per-job time limit
+    status, rt, at, rj = runner.exampleRun(numP, ratio, timeout)
+    return jobIndex, status, rt, at, rj, runner.lastRunStats
+
+
+def run_sweep_parallel(xp, yp, numP, ratios, typeNumb, timeout,
+                       method="SSI", workers=None, baseSeed=None, policy="stop_sweep",
+                       holes=None, density=None, jamming=None, cache=None):
+    """
+    Run a ratio x sample sweep over a process pool.
+
+    Every (ratio, sample) pair is one job with its own seed (see spawn_seeds), so a sweep can be
+    rerun with the same baseSeed and give the same seed sets. Results are merged back in
+    (ratio, sample) order, so the log does not depend on which worker finished first.
+
+    A job that raises (bad input, a pickling error, a worker killed by the OS which breaks the
+    pool for every job still pending) is logged as an "Error" row and the sweep goes on; the
+    policy only reacts to "Timeout" and "Jammed". The per-job timeout is the sampler's own
+    wall-clock check, a worker stuck outside the sampler loop is not interrupted and the sweep
+    waits for it.
+
+    Parameters:
+        xp, yp (list): Polygon vertices.
+        numP (int): Number of seeds per run, ignored when density is given.
+        ratios (list of float): Ratios to sweep.
+        typeNumb (int): Number of samples per ratio.
+        timeout (float): Per-job time limit in seconds.
+        method (str): Sampler name, see PointAllocationProcess.exampleRun.
+        workers (int): Number of worker processes, defaults to the CPU count.
+        baseSeed (int or None): Seed the per-job seeds are derived from.
+        policy (str): What to do after a timeout, one of POLICIES.
+        holes (list of (hx, hy), optional): Openings inside the polygon.
+        density (float, optional): Target seeds per unit area. numP is then taken from the
+                                   exact polygon area, so non-rectangular panels get the
+                                   intended density without trial runs.
+        jamming (dict, optional): Enables the "Jammed" early stop, e.g. {"mode": "estimate"},
+                                  see PointAllocationProcess.enable_jamming_stop. A jammed
+                                  job is handled by the policy like a timeout.
+        cache (resultCache.ResultCache, optional): Jobs whose seed set is cached return it
+                                  without sampling, the "Cache" column logs hit / miss.
+
+    Returns:
+        list: Runtime log rows (header first), same schema as the run.py logs.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}', expected one of {POLICIES}")
+
+    runner = Process.PointAllocationProcess(xp, yp, holes=holes)
+    w = runner.maxx - runner.minx
+    h = runner.maxy - runner.miny
+    if density is not None:
+        numP = runner.numPForDensity(density)
+
+    # Job list in the same order as the sequential loops in run.py
+    seeds = spawn_seeds(baseSeed, len(ratios) * typeNumb)
+    jobs = []
+    for r in ratios:
+        for i in range(typeNumb):
+            jobIndex = len(jobs)
+            jobs.append((jobIndex, xp, yp, holes, method, numP, r, i, timeout, seeds[jobIndex], jamming, cache))
+
+    results = {}
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for job in jobs:
+            futures[job[0]] = executor.submit(_run_job, job)
+        jobOf = {f: jobIndex for jobIndex, f in futures.items()}
+
+        for fut in as_completed(futures.values()):
+            if fut.cancelled():
+                continue
+            try:
+                jobIndex, status, rt, at, rj, stats = fut.result()
+            except Exception as exc:
+                # One failed job must not lose the rows of the others
+                jobIndex = jobOf[fut]
+                results[jobIndex] = ("Error", None, "", "", {"Placed": "", "EstMaxSeeds": ""})
+                print(f"❌ Error @ ratio={jobs[jobIndex][6]:.3f}, sample={jobs[jobIndex][7]}: {exc!r}")
+                continue
+            results[jobIndex] = (status, rt, at, rj, stats)
+
+            if status in ("Timeout", "Jammed"):
+                r, i = jobs[jobIndex][6], jobs[jobIndex][7]
+                print(f"⏱ {status} @ ratio={r:.3f}, sample={i}")
+                # Cancel what the sequential sweep would never have started
+                for other, f in futures.items():
+                    if policy == "stop_sweep" and other > jobIndex:
+                        f.cancel()
+                    elif policy == "skip_ratio" and other > jobIndex and jobs[other][6] == r:
+                        f.cancel()
+
+    except KeyboardInterrupt:
+        print("\n🛑 Interrupted — partial log will be saved.")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    # Merge in job order and apply the policy, jobs that were already running when
+    # the timeout came in are dropped so the log matches a sequential sweep
+    log = [LOG_HEADER]
+    stopAt = None
+    skipRatio = None
+    for job in jobs:
+        jobIndex, _, _, _, _, _, r, i, _, seed, _, _ = job
+        if stopAt is not None:
+            break
+        if skipRatio is not None and r == skipRatio:
+            continue
+        if jobIndex not in results:
+            continue
+
+        status, rt, at, rj, stats = results[jobIndex]
+        log.append((method, numP, w, h,
+                    f"{r:.3f}", i,
+                    "" if rt is None else f"{rt:.3f}", status,
+                    at, rj, seed,
+                    stats["Placed"], format_estimate(stats["EstMaxSeeds"]),
+                    stats.get("Cache", "")))
+
+        if status in ("Timeout", "Jammed"):
+            if policy == "stop_sweep":
+                stopAt = jobIndex
+            elif policy == "skip_ratio":
+                skipRatio = r
+
+    if cache is not None:
+        hits, misses = count_cache(log)
+        print(f"♻ Result cache: {hits} hits, {misses} misses")
+    return log
+
+
+def count_cache(rows):
+    """
+    (hits, misses) of the "Cache" column of runtime log rows (header row and old logs
+    without the column are skipped).
+    """
+    k = LOG_HEADER.index("Cache")
+    column = [row[k] for row in rows if len(row) > k]
+    return column.count("hit"), column.count("miss")
+
+
+class SweepLog:
+    def __init__(self, path, baseSeed=None, new=False):
+        """
+        Runtime log written one row at a time, doubling as the checkpoint of a long sweep.
+
+        Every finished run is appended (and flushed to disk) right away, so a crash or a kill
+        only loses the run in progress. Opening an existing log resumes it: the (ratio, sample)
+        pairs already in it are done, and the base seed stored next to it (<log>.json) gives
+        the remaining runs the same seeds as the original sweep. Partial seeds of timed-out
+        runs go to <log>_partial/ as .npy files, see save_partial.
+
+        Parameters:
+            path (str): Log file (.csv), same columns as LOG_HEADER.
+            baseSeed (int or None): Root seed of a new sweep, None draws one and records it.
+                                    When resuming it must be None or match the stored one,
+                                    and it is required when <log>.json is missing.
+            new (bool): Never resume. The log is created exclusively, and if path is taken
+                        (e.g. two sweeps started in the same second) _1, _2, ... is added to
+                        the file name, self.path is the name actually used.
+
+        After initialization, these instance attributes are set:
+            self.baseSeed: Root seed of the sweep (always an int).
+            self.done: Set of (ratio "0.xxx", sample) pairs already logged.
+            self.stopped: Ratios "0.xxx" with a logged "Timeout" or "Jammed" run.
+        """
+        self.done = set()
+        self.stopped = set()
+        self.columns = len(LOG_HEADER)
+
+        fresh = new or not os.path.exists(path)
+        if fresh:
+            path = self._create(path)
+        self.path = path
+        self.metaPath = os.path.splitext(path)[0] + ".json"
+        self.partialDir = os.path.splitext(path)[0] + "_partial"
+        self.profilePath = os.path.splitext(path)[0] + "_profile.csv"
+
+        if fresh:
+            self.baseSeed = int(np.random.SeedSequence(baseSeed).entropy)
+            with open(self.metaPath, "w") as f:
+                json.dump({"baseSeed": self.baseSeed}, f)
+        else:
+            if os.path.exists(self.metaPath):
+                with open(self.metaPath) as f:
+                    stored = json.load(f)["baseSeed"]
+                if baseSeed is not None and baseSeed != stored:
+                    raise ValueError(f"{path} was started with baseSeed {stored}, not {baseSeed}")
+            elif baseSeed is None:
+                # Older logs (or a lost meta file) do not record the seed of the sweep
+                raise ValueError(f"{self.metaPath} is missing, pass the baseSeed of the sweep to resume {path}")
+            else:
+                stored = int(baseSeed)
+                with open(self.metaPath, "w") as f:
+                    json.dump({"baseSeed": stored}, f)
+            self.baseSeed = stored
+            with open(path, newline="") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    self._mark(row["Ratio"], int(row["Sample"]), row["Status"])
+                self.columns = len(reader.fieldnames or LOG_HEADER) # older logs have fewer columns
+            print(f"↻ Resuming {path}, {len(self.done)} runs already done")
+
+    @staticmethod
+    def _create(path):
+        """
+        Create a new log with its header, exclusively (mode "x") so an existing log is never
+        picked up as a checkpoint. Returns the path used.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        stem, ext = os.path.splitext(path)
+        candidate, n = path, 0
+        while True:
+            try:
+                with open(candidate, "x", newline="") as f:
+                    csv.writer(f).writerow(LOG_HEADER)
+                return candidate
+            except FileExistsError:
+                n += 1
+                candidate = f"{stem}_{n}{ext}"
+
+    def _mark(self, ratio, sample, status):
+        self.done.add((ratio, sample))
+        if status in ("Timeout", "Jammed"):
+            self.stopped.add(ratio)
+
+    def is_done(self, ratio, sample):
+        """
+        True if the (ratio, sample) run is already in the log.
+        """
+        return (f"{ratio:.3f}", sample) in self.done
+
+    def append(self, row):
+        """
+        Append one LOG_HEADER row and force it to disk.
+        """
+        with open(self.path, "a", newline="") as f:
+            csv.writer(f).writerow(row[:self.columns])
+            f.flush()
+            os.fsync(f.fileno())
+        self._mark(row[4], row[5], row[7])
+
+    def append_profile(self, ratio, sample, profile):
+        """
+        Append the PhaseProfiler stats of one run to the sidecar <log>_profile.csv
+        (Ratio, Sample, then the profile columns), the header is written with the first row.
+        """
+        new = not os.path.exists(self.profilePath)
+        with open(self.profilePath, "a", newline="") as f:
+            w = csv.writer(f)
+            if new:
+                w.writerow(("Ratio", "Sample") + tuple(profile))
+            w.writerow((f"{ratio:.3f}", sample) + tuple(profile.values()))
+
+    def save_partial(self, X, placed, ratio, sample):
+        """
+        Keep the seeds placed by a run that did not complete, so it can be analysed or
+        continued later (PointAllocationProcess.startSeeds = np.load(path)).
+
+        Returns:
+            str: Path of the .npy file with the (placed, 2) seeds.
+        """
+        os.makedirs(self.partialDir, exist_ok=True)
+        path = os.path.join(self.partialDir, f"ratio_{ratio:.3f}_sample_{sample}.npy")
+        np.save(path, np.asarray(X)[:placed])
+        return path
+
+
+def writeRuntimeLog(log, method, numP, w, h):
+    """
+    Write runtime log rows to assetss/csvFile/runtime_log_<method>_<numP>_<w>x<h>_<timestamp>.csv
+
+    Returns:
+        str: Path of the written log.
+    """
+    base = os.path.join("assetss","csvFile")
+    os.makedirs(base, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    fn = f"runtime_log_{method}_{numP}_{w}x{h}_{ts}.csv"
+    path = os.path.join(base, fn)
+    with open(path,"w",newline="") as f:
+        csv.writer(f).writerows(log)
+
+    print(f"✅ Runtime log saved to {path}")
+    return path
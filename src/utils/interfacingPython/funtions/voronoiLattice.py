@@ -0,0 +1,303 @@
+import numpy as np
+import os, csv, hashlib
+from concurrent.futures import ProcessPoolExecutor
+from polygonDomain import PolygonDomain
+
+
+def content_hash(X, *params):
+    """
+    Hash of a seed array (and any extra parameters), used as cache key.
+    The same seeds give the same key whatever file or archive they were read from.
+    """
+    h = hashlib.sha1()
+    X = np.ascontiguousarray(X, dtype="<f8")
+    h.update(str(X.shape).encode())
+    h.update(X.tobytes())
+    for p in params:
+        h.update(b"|")
+        h.update(np.ascontiguousarray(p, dtype="<f8").tobytes() if isinstance(p, np.ndarray) else repr(p).encode())
+    return h.hexdigest()
+
+
+def _ccw(poly):
+    """Vertices in counter-clockwise order."""
+    x, y = poly[:, 0], poly[:, 1]
+    signed = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    return poly if signed >= 0 else poly[::-1]
+
+
+def clip_halfplane(poly, a, b, c):
+    """
+    Keep the part of a polygon where a*x + b*y <= c (one Sutherland-Hodgman step).
+
+    Returns:
+        np.ndarray: (k, 2) clipped polygon, empty if nothing is left.
+    """
+    if len(poly) == 0:
+        return poly
+    s = poly @ np.array([a, b]) - c
+    inside = s <= 0
+    if inside.all():
+        return poly
+    if not inside.any():
+        return np.zeros((0, 2))
+
+    nxt = np.roll(np.arange(len(poly)), -1)
+    out = []
+    for i in range(len(poly)):
+        j = nxt[i]
+        if inside[i]:
+            out.append(poly[i])
+        if inside[i] != inside[j]:
+            t = s[i] / (s[i] - s[j])
+            out.append(poly[i] + t * (poly[j] - poly[i]))
+    return np.array(out)
+
+
+def _remove_spikes(poly):
+    """
+    Drop repeated vertices and zero-width spikes (a vertex whose two neighbours lie on the
+    same line on the same side of it). Sutherland-Hodgman leaves such back-and-forth edges
+    along the clip lines when the subject polygon is non-convex.
+    """
+    if len(poly) < 3:
+        return poly
+    tol = 1e-9 * max(1.0, np.abs(poly).max())
+    while len(poly) >= 3:
+        a = np.roll(poly, 1, axis=0) - poly
+        b = np.roll(poly, -1, axis=0) - poly
+        cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        bad = ((np.abs(a) <= tol).all(axis=1) |
+               ((np.abs(cross) <= tol * (np.hypot(*a.T) + np.hypot(*b.T))) & ((a * b).sum(axis=1) > 0)))
+        if not bad.any():
+            return poly
+        poly = np.delete(poly, int(np.argmax(bad)), axis=0)
+    return np.zeros((0, 2))
+
+
+def clip_polygon(subject, clipper, inset=0.0):
+    """
+    Intersection of any simple polygon with a convex polygon (Sutherland-Hodgman).
+
+    Parameters:
+        subject (np.ndarray): (n, 2) polygon to clip, may be non-convex.
+        clipper (np.ndarray): (m, 2) convex polygon.
+        inset (float): Every clipper edge is first moved inwards by this distance, which
+                       insets the convex clipper exactly (short edges simply vanish).
+
+    Returns:
+        np.ndarray: (k, 2) counter-clockwise result, empty if they do not overlap. For a
+                    non-convex subject the result must be one connected piece (true for
+                    Voronoi cells unless a notch of the outline cuts a cell in two).
+    """
+    clipper = _ccw(np.asarray(clipper, dtype=float))
+    out = _ccw(np.asarray(subject, dtype=float))
+    p = clipper
+    q = np.roll(clipper, -1, axis=0)
+    e = q - p
+    length = np.hypot(e[:, 0], e[:, 1])
+    keep = length > 0
+    # Inside of a CCW edge is on its left: -(ey)*x + ex*y >= ..., written as a*x + b*y <= c
+    a = e[keep, 1] / length[keep]
+    b = -e[keep, 0] / length[keep]
+    c = a * p[keep, 0] + b * p[keep, 1] - inset
+    for k in range(len(a)):
+        out = clip_halfplane(out, a[k], b[k], c[k])
+        if len(out) == 0:
+            break
+    return _remove_spikes(out)
+
+
+def inset_polygon(vertices, d):
+    """
+    Move every edge of a simple polygon inwards by d and join the new edges with mitred
+    corners. Exact for convex polygons; for non-convex ones d must stay below the size of
+    the smallest feature (true for a panel frame a few ligaments thick).
+
+    Returns:
+        np.ndarray: (n, 2) counter-clockwise inset polygon.
+    """
+    pts = _ccw(np.asarray(vertices, dtype=float))
+    if d == 0:
+        return pts
+    e = np.roll(pts, -1, axis=0) - pts
+    e /= np.hypot(e[:, 0], e[:, 1])[:, None]
+    n = np.column_stack((-e[:, 1], e[:, 0])) # inward normals of a CCW polygon
+    p = pts + d * n                            # a point on every moved edge
+
+    # Corner i joins moved edge i-1 and moved edge i
+    pPrev, ePrev = np.roll(p, 1, axis=0), np.roll(e, 1, axis=0)
+    cross = ePrev[:, 0] * e[:, 1] - ePrev[:, 1] * e[:, 0]
+    diff = p - pPrev
+    parallel = np.abs(cross) < 1e-12
+    t = np.where(parallel, 0.0, (diff[:, 0] * e[:, 1] - diff[:, 1] * e[:, 0]) / np.where(parallel, 1.0, cross))
+    return pPrev + t[:, None] * ePrev
+
+
+def voronoi_cells(X, domain):
+    """
+    Bounded Voronoi diagram of the seeds, every cell clipped to the polygon.
+
+    Four far-away guard points are added so that every seed gets a finite region, then each
+    (convex) region is intersected with the polygon outline. Holes of the domain are not cut
+    out of the cells. On a non-convex outline, a ridge passing just past a reflex corner can
+    split a cell in two; that cell is kept as the single piece bounded by the ridge, leaving
+    a sliver at the corner uncovered (rectangular panels are not affected).
+
+    Parameters:
+        X (np.ndarray): (n, 2) seeds, all-zero rows (unplaced seeds of a timed-out run) are ignored.
+        domain (PolygonDomain): Panel outline.
+
+    Returns:
+        list of np.ndarray: One counter-clockwise (k, 2) polygon per placed seed, in seed order.
+    """
+    from scipy.spatial import Voronoi # the clipping helpers of this module do not need SciPy
+
+    X = np.asarray(X, dtype=float)
+    X = X[(X != 0).any(axis=1)]
+    size = max(domain.maxx - domain.minx, domain.maxy - domain.miny)
+    cx, cy = (domain.minx + domain.maxx) / 2, (domain.miny + domain.maxy) / 2
+    far = 10 * size
+    guard = np.array([[cx - far, cy - far], [cx + far, cy - far], [cx + far, cy + far], [cx - far, cy + far]])
+    vor = Voronoi(np.vstack((X, guard)))
+
+    cells = []
+    for i in range(len(X)):
+        region = vor.regions[vor.point_region[i]]
+        cells.append(clip_polygon(domain.vertices, vor.vertices[region]))
+    return cells
+
+
+def lattice_voids(cells, domain, thickness, frame=None):
+    """
+    Ligament-offset cells: the open area of every cell once the ligaments are added.
+
+    Each Voronoi edge becomes a ligament of width `thickness` (half on each side), and the
+    outline gets a solid frame of width `frame`.
+
+    Parameters:
+        cells (list of np.ndarray): Cells from voronoi_cells (before clipping is fine too).
+        domain (PolygonDomain): Panel outline.
+        thickness (float): Ligament thickness.
+        frame (float, optional): Frame width along the outline, defaults to thickness / 2
+                                 (the outline then looks like one more ligament half).
+
+    Returns:
+        list of np.ndarray: One (k, 2) void polygon per cell, empty where the cell is
+                            thinner than the ligaments.
+    """
+    frame = thickness / 2 if frame is None else frame
+    inner = inset_polygon(domain.vertices, frame)
+    return [clip_polygon(inner, cell, inset=thickness / 2) if len(cell) else cell for cell in cells]
+
+
+class LatticeCache:
+    def __init__(self, root=os.path.join("assetss", "voronoiCache")):
+        """
+        Disk cache of polygon lists (.npz per key), keyed by content_hash of the seeds and
+        parameters, so a seed set is tessellated once whatever file it was read from.
+
+        Parameters:
+            root (str): Cache folder.
+        """
+        self.root = root
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".npz")
+
+    def get(self, key):
+        """
+        Returns:
+            dict or None: {name: list of polygons} stored under key, None on a miss.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        out = {}
+        with np.load(path) as data:
+            for name in {k.rsplit("_", 1)[0] for k in data.files}:
+                v, o = data[name + "_vertices"], data[name + "_offsets"]
+                out[name] = [v[o[i]:o[i + 1]] for i in range(len(o) - 1)]
+        return out
+
+    def put(self, key, **polygonLists):
+        """
+        Store lists of polygons as one flat vertex array plus offsets each (ragged layout).
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        arrays = {}
+        for name, polys in polygonLists.items():
+            offsets = np.zeros(len(polys) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(p) for p in polys])
+            arrays[name + "_vertices"] = np.concatenate(polys) if offsets[-1] else np.zeros((0, 2))
+            arrays[name + "_offsets"] = offsets
+        tmp = path + f".{os.getpid()}.tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path) # readers never see a half-written file
+
+
+def build_lattice(X, xp, yp, thickness, frame=None, cache=None):
+    """
+    Voronoi cells and ligament voids of one seed set.
+
+    Parameters:
+        X (np.ndarray): (numP, 2) seeds.
+        xp, yp (list): Polygon vertices of the panel.
+        thickness (float): Ligament thickness.
+        frame (float, optional): Frame width, see lattice_voids.
+        cache (LatticeCache, optional): Reuse / store the result by seed content.
+
+    Returns:
+        dict: {"cells": [...], "voids": [...]} lists of (k, 2) polygons, one per placed seed.
+    """
+    key = None
+    if cache is not None:
+        key = content_hash(X, np.asarray(xp, dtype=float), np.asarray(yp, dtype=float), thickness, frame)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    domain = PolygonDomain(xp, yp)
+    cells = voronoi_cells(X, domain)
+    voids = lattice_voids(cells, domain, thickness, frame)
+    if cache is not None:
+        cache.put(key, cells=cells, voids=voids)
+    return {"cells": cells, "voids": voids}
+
+
+def _build_job(job):
+    X, xp, yp, thickness, frame, cacheRoot = job
+    cache = LatticeCache(cacheRoot) if cacheRoot is not None else None
+    return build_lattice(X, xp, yp, thickness, frame, cache)
+
+
+def build_lattices(seedSets, xp, yp, thickness, frame=None, cacheRoot=os.path.join("assetss", "voronoiCache"), workers=None):
+    """
+    build_lattice over many seed sets on a process pool (results in input order).
+
+    Parameters:
+        seedSets (iterable of np.ndarray): Seed arrays, e.g. SeedArchive.load(...) or
+                                           SeedCatalog.load(row) for query results.
+        cacheRoot (str or None): LatticeCache folder, None disables caching.
+        workers (int): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        list of dict: One {"cells", "voids"} result per seed set.
+    """
+    jobs = [(np.asarray(X, dtype=float), xp, yp, thickness, frame, cacheRoot) for X in seedSets]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_build_job, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def writePolygonsCSV(polygons, path):
+    """
+    Write polygons as "cell,x,y" rows (one row per vertex), e.g. the voids for a Grasshopper
+    definition that only has to extrude them.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        for i, poly in enumerate(polygons):
+            w.writerows((i, x, y) for x, y in poly)
+    return path
@@ -1,51 +1,42 @@
-import rhino3dm as rs
-import csv
+import argparse
 import os
+import sys
 
-# Path to the folder containing your CSV files
-csv_folder = r"C:\Path\To\Your\CSVFolder"
-output_folder = r"C:\Path\To\Export\Folder"
-
-# Function to read points from a CSV file
-def read_csv_points(file_path):
-    points = []
-    with open(file_path, 'r') as file:
-        csv_reader = csv.reader(file)
-        #next(csv_reader)  # Skip header (if present)
-        for row in csv_reader:
-            x, y, z = map(float, row)
-            points.append((x, y, z))
-    return points
-
-# Function to export STL
-def export_stl(file_name, points):
-    # Clear current Rhino document
-    rs.Command("_SelAll")
-    rs.Command("_Delete")
-
-    # Add points to Rhino
-    for pt in points:
-        rs.AddPoint(pt)
-    
-    # Export as STL
-    stl_path = os.path.join(output_folder, f"{file_name}.stl")
-    rs.Command(f'-_Export "{stl_path}" _Enter _Enter')
-    print(f"Exported: {stl_path}")
-
-def main():
-    # Main routine
-    for csv_file in os.listdir(csv_folder):
+# The seed/lattice modules live in ../funtions and import each other by module name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "funtions"))
+import stlExport
+
+# Panel and lattice parameters (same inputs as DefinitionVoronoiDisorderedHC.gh)
+SIZE      = "50x50" # Panel outline, rectangle at the origin
+THICKNESS = 0.5 # Ligament thickness
+DEPTH     = 3.0 # Extrusion depth
+
+
+def main(argv=None):
+    # Headless export, no Rhino session: seeds -> Voronoi lattice -> extruded mesh -> binary STL.
+    # Replaces the rs.Command / pyautogui (clicker.py) loop, all files run on a process pool.
+    # Same export as `python -m interfacingPython export --csv ...`, for a whole folder of CSVs.
+    parser = argparse.ArgumentParser(description="Export every seed CSV of a folder as a lattice STL.")
+    parser.add_argument("csv_folder", help="Folder with the seed CSV files")
+    parser.add_argument("output_folder", help="Folder the STL files are written to")
+    parser.add_argument("--size", default=SIZE, help="Panel WxH at the origin (default %(default)s)")
+    parser.add_argument("--thickness", type=float, default=THICKNESS, help="Ligament thickness")
+    parser.add_argument("--depth", type=float, default=DEPTH, help="Extrusion depth")
+    parser.add_argument("--workers", type=int, help="Worker processes, default the CPU count")
+    args = parser.parse_args(argv)
+
+    w, h = (float(v) for v in args.size.lower().split("x"))
+    xp, yp = [0, w, w, 0, 0], [0, 0, h, h, 0]
+
+    sources, paths = [], []
+    for csv_file in sorted(os.listdir(args.csv_folder)):
         if csv_file.endswith(".csv"):
-            csv_path = os.path.join(csv_folder, csv_file)
-            points = read_csv_points(csv_path)
-            file_name = os.path.splitext(csv_file)[0]
-            export_stl(file_name, points)
+            sources.append(os.path.join(args.csv_folder, csv_file))
+            paths.append(os.path.join(args.output_folder, os.path.splitext(csv_file)[0] + ".stl"))
 
-def mainTest():
-    read_csv=read_csv_points(r"C:\Users\binhn\OneDrive\Desktop\CodeProject\capstone\XTRAWIDE_50x50_n314_0.1_NEW.csv")
-    #print(read_csv)
+    for path in stlExport.export_stl_batch(sources, xp, yp, args.thickness, args.depth,
+                                           paths=paths, workers=args.workers):
+        print(f"Exported: {path}")
 
-    for pt in read_csv:
-        rs.Point(pt)
 if __name__ == "__main__":
-    mainTest()
\ No newline at end of file
+    main()
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# The modules live in src/utils/interfacingPython/funtions and import each other by module name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "src", "utils", "interfacingPython", "funtions"))
+
+
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    """Run the test inside tmp_path, so relative assetss/ outputs never touch the repo tree."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,49 @@
+from benchmarkSSI import compare
+
+
+def _suite(**results):
+    return {"meta": {}, "results": results}
+
+
+BASE = _suite(
+    in_polygon_L={"tests_per_s": 1000.0},
+    run_SSI_n314_r0_30={"status": "Completed", "attempts": 900, "placed": 314,
+                        "attempts_per_s": 5e5, "seeds_per_s": 2e5, "peak_mem_MB": 1.0},
+    run_SSI_n314_r0_50={"status": "Timeout", "attempts": 10**6, "placed": 300},
+    startup_sweepRunner={"startup_s": 0.2, "import_s": 0.1, "scipy": False, "matplotlib": False},
+)
+
+
+def test_identical_and_within_tolerance_is_clean():
+    assert compare(BASE, BASE) == []
+    near = _suite(in_polygon_L={"tests_per_s": 850.0}, # -15 %
+                  startup_sweepRunner=dict(BASE["results"]["startup_sweepRunner"], startup_s=0.23))
+    assert compare(near, BASE) == []
+
+
+def test_regressions_are_flagged():
+    cur = _suite(
+        in_polygon_L={"tests_per_s": 700.0},
+        run_SSI_n314_r0_30={"status": "Completed", "attempts": 950, "placed": 314,
+                            "attempts_per_s": 5e5, "seeds_per_s": 2e5, "peak_mem_MB": 1.5},
+        run_SSI_n314_r0_50={"status": "Jammed", "attempts": 10**5, "placed": 290},
+        startup_sweepRunner={"startup_s": 0.2, "import_s": 0.1, "scipy": True, "matplotlib": False},
+    )
+    flags = compare(cur, BASE)
+    kinds = sorted(f.split()[0] + " " + f.split()[1].rstrip(":") for f in flags)
+    assert kinds == ["CHANGED run_SSI_n314_r0_30.attempts",
+                     "IMPORT startup_sweepRunner",
+                     "MEMORY run_SSI_n314_r0_30.peak_mem_MB",
+                     "SLOWER in_polygon_L.tests_per_s",
+                     "STATUS run_SSI_n314_r0_50"]
+
+
+def test_tolerance_and_missing_benchmarks():
+    cur = _suite(in_polygon_L={"tests_per_s": 700.0}) # the other benchmarks were not run
+    assert len(compare(cur, BASE)) == 1
+    assert compare(cur, BASE, tolerance=0.5) == []
+
+
+def test_a_new_benchmark_has_nothing_to_compare():
+    cur = _suite(run_Bridson_n314_r0_30={"status": "Completed", "attempts": 1, "placed": 314})
+    assert compare(cur, BASE) == []
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import cellMetrics
+from cellMetrics import MetricsCache, analyze_cells, cell_metrics, summarize_cells
+from polygonDomain import PolygonDomain
+from voronoiLattice import voronoi_cells
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+
+
+def test_metrics_of_a_two_by_two_grid():
+    domain = PolygonDomain(*SQUARE)
+    X = np.array([[2.5, 2.5], [7.5, 2.5], [2.5, 7.5], [7.5, 7.5]])
+    m = cell_metrics(voronoi_cells(X, domain), domain)
+    assert m["area"] == pytest.approx([25] * 4)
+    assert m["perimeter"] == pytest.approx([20] * 4)
+    assert list(m["sides"]) == [4] * 4 and m["boundary"].all()
+    assert sorted(m["ligaments"]) == pytest.approx([5] * 4) # the cross, each half counted once
+
+
+def test_areas_sum_to_the_panel_and_ligaments_are_shared():
+    domain = PolygonDomain(*SQUARE)
+    X = np.random.default_rng(2).uniform(0, 10, (80, 2))
+    m = cell_metrics(voronoi_cells(X, domain), domain)
+    assert m["area"].sum() == pytest.approx(domain.area)
+    # Every inner edge is on two cells, every outline edge on one
+    assert m["perimeter"].sum() == pytest.approx(2 * m["ligaments"].sum() + 40)
+    row = summarize_cells(m)
+    assert row["Cells"] == 80 and row["Area_mean"] == pytest.approx(100 / 80)
+
+
+def test_metrics_cache_hit_skips_the_tessellation(tmp_path, monkeypatch):
+    cache = MetricsCache(str(tmp_path / "cache"))
+    X = np.random.default_rng(3).uniform(0, 10, (40, 2))
+    first = analyze_cells(X, *SQUARE, cache=cache)
+
+    def fail(*args):
+        raise AssertionError("cache miss")
+    monkeypatch.setattr(cellMetrics, "voronoi_cells", fail)
+    again = analyze_cells(X.copy(), *SQUARE, cache=cache)
+    assert again.keys() == first.keys()
+    assert all(np.array_equal(again[k], first[k]) for k in first)
+    with pytest.raises(AssertionError):
+        analyze_cells(X[:-1], *SQUARE, cache=cache) # other seeds, other key
@@ -0,0 +1,45 @@
+import time
+
+import pytest
+
+import PointAllocationProcess as Process
+from jammingMonitor import JammingMonitor
+
+SQUARE = ([0, 50, 50, 0, 0], [0, 0, 50, 50, 0])
+
+
+def _run(ratio, timeout, seed):
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI", rng=seed)
+    runner.autosave = False
+    runner.enable_jamming_stop() # default window / checkEvery
+    t0 = time.time()
+    runner.exampleRun(314, ratio, timeout)
+    return runner._run_info(314, ratio)["Status"], time.time() - t0
+
+
+@pytest.mark.parametrize("ratio", [0.5, 0.55])
+def test_saturated_panel_is_jammed_well_before_the_timeout(ratio):
+    timeout = 30
+    status, elapsed = _run(ratio, timeout, seed=0)
+    assert status == "Jammed"
+    assert elapsed < timeout / 6
+
+
+def test_reachable_count_is_not_flagged():
+    status, _ = _run(0.4, 30, seed=0)
+    assert status == "Completed"
+
+
+def test_nothing_is_judged_before_a_full_window():
+    monitor = JammingMonitor(window=1000)
+    assert not monitor.is_jammed(0, 999, 10)
+    assert monitor.is_jammed(0, 1000, 10) # no acceptance in the window -> est. max 0
+
+
+def test_estimate_follows_feders_law():
+    monitor = JammingMonitor(window=1000)
+    for attempt in range(100, 2001, 100): # rate 0.01
+        monitor.accepted(attempt)
+    assert monitor.window_rate(2000) == pytest.approx(0.01)
+    assert monitor.estimated_max(50, 2000) == pytest.approx(50 + 2 * 2000 * 0.01)
+    assert not monitor.is_jammed(50, 2000, 90) and monitor.is_jammed(50, 2000, 91)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+
+from jobServer import JobServer, normalize_request
+from seedCatalog import SeedCatalog
+
+SMALL = {"numP": 40, "ratio": 0.3, "timeout": 30}
+# Cannot complete (ratio above the hex packing), keeps the single worker busy for its timeout
+BLOCKER = {"numP": 314, "ratio": 0.6, "timeout": 2, "fresh": True}
+
+
+def _server(tmp_path, workers=1, maxQueue=8):
+    return JobServer("127.0.0.1", 0, workers, maxQueue,
+                     str(tmp_path / "archive"), str(tmp_path / "catalog.sqlite"))
+
+
+async def _ask(server, req, until=("done", "error")):
+    # One request on its own connection, returns every event up to the first one in `until`
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    writer.write((json.dumps(req) + "\n").encode())
+    await writer.drain()
+    events = []
+    while True:
+        events.append(json.loads(await reader.readline()))
+        if events[-1]["event"] in until:
+            break
+    writer.close()
+    return events
+
+
+def test_identical_requests_share_one_job(tmp_path):
+    async def run():
+        server = await _server(tmp_path).start()
+        try:
+            blocker = asyncio.create_task(_ask(server, BLOCKER))
+            while not server.running: # both requests below wait behind the blocker
+                await asyncio.sleep(0.01)
+            req = dict(SMALL, seed=3, fresh=True)
+            a, b = await asyncio.gather(_ask(server, req), _ask(server, req))
+            assert sorted([a[0]["shared"], b[0]["shared"]]) == [False, True]
+            assert a[0]["job"] == b[0]["job"]
+            assert a[-1]["status"] == "Completed" and a[-1]["seeds"] == b[-1]["seeds"]
+            assert server.counts["shared"] == 1 and server.counts["generated"] == 2
+            await blocker
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+def test_archive_serves_seeded_and_unseeded_requests(tmp_path):
+    async def run():
+        server = await _server(tmp_path).start()
+        try:
+            first = (await _ask(server, dict(SMALL, seed=7)))[-1]
+            again = (await _ask(server, dict(SMALL, seed=7)))[-1]
+            assert not first["fromArchive"] and again["fromArchive"]
+            assert again["seeds"] == first["seeds"]
+            # The generated set was handed out already, an unseeded request gets a new one
+            other = (await _ask(server, SMALL))[-1]
+            assert not other["fromArchive"] and other["seeds"] != first["seeds"]
+        finally:
+            await server.close()
+        return first["location"], other["location"]
+
+    seeded, unseeded = asyncio.run(run())
+    served = (tmp_path / "archive" / "served.txt").read_text().split()
+    assert seeded in served and unseeded in served
+
+
+def test_served_sets_survive_a_restart(tmp_path):
+    async def generate():
+        server = await _server(tmp_path).start()
+        try:
+            return (await _ask(server, SMALL))[-1]
+        finally:
+            await server.close()
+
+    first = asyncio.run(generate())
+    second = asyncio.run(generate())
+    assert not second["fromArchive"] and second["location"] != first["location"]
+
+
+def test_set_is_served_only_after_it_loaded(tmp_path, monkeypatch):
+    async def generate():
+        server = await _server(tmp_path).start()
+        try:
+            return (await _ask(server, SMALL))[-1], server
+        finally:
+            await server.close()
+
+    first, _ = asyncio.run(generate())
+    (tmp_path / "archive" / "served.txt").unlink() # the set is free again
+
+    load = SeedCatalog.load
+    calls = []
+    def failing(row):
+        calls.append(row["location"])
+        if len(calls) == 1:
+            raise OSError("disk gone")
+        return load(row)
+    monkeypatch.setattr(SeedCatalog, "load", staticmethod(failing))
+
+    broken, server = asyncio.run(generate())
+    assert not broken["fromArchive"] and first["location"] not in server.served
+    assert not server.reserved
+    monkeypatch.setattr(SeedCatalog, "load", staticmethod(load))
+    served, _ = asyncio.run(generate())
+    assert served["fromArchive"] and served["location"] == first["location"]
+
+
+def test_full_queue_rejects_requests(tmp_path):
+    async def run():
+        server = await _server(tmp_path, workers=1, maxQueue=1).start()
+        try:
+            blocker = asyncio.create_task(_ask(server, BLOCKER))
+            while not server.running: # wait until the worker took the blocker
+                await asyncio.sleep(0.01)
+            waiting = asyncio.create_task(_ask(server, dict(SMALL, fresh=True)))
+            while not server.queue.full():
+                await asyncio.sleep(0.01)
+            rejected = await _ask(server, dict(SMALL, numP=41, fresh=True))
+            assert rejected == [{"event": "error", "message": rejected[0]["message"]}]
+            assert "queue full" in rejected[0]["message"]
+            assert server.counts["rejected"] == 1
+            assert (await blocker)[-1]["status"] != "Completed"
+            assert (await waiting)[-1]["status"] == "Completed"
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+def test_only_binds_to_localhost(tmp_path):
+    with pytest.raises(ValueError):
+        JobServer("0.0.0.0", 0, 1, 1, str(tmp_path / "a"), str(tmp_path / "c.sqlite"))
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import PointAllocationProcess as Process
+from phaseProfiler import PhaseProfiler
+
+SQUARE = ([0, 30, 30, 0, 0], [0, 0, 30, 30, 0])
+L_SHAPE = ([0, 30, 30, 15, 15, 0, 0], [0, 0, 15, 15, 30, 30, 0])
+
+
+def _run(xp, yp, profile, autosave=False):
+    runner = Process.PointAllocationProcess(xp, yp, "SSI", rng=5)
+    runner.autosave = autosave
+    if profile:
+        runner.enable_profiling()
+    status, _, attempts, rejects = runner.exampleRun(150, 0.4, 30)
+    assert status == "Completed"
+    return runner, attempts, rejects
+
+
+def test_counters_match_the_run():
+    runner, attempts, _ = _run(*SQUARE, profile=True)
+    p = runner.lastRunStats["Profile"]
+    # On a rectangle every draw is inside, one draw / containment test / distance check per
+    # attempt of the loop (the first seed is placed before it, without a check)
+    assert p["N_draw"] == p["N_containment"] == p["N_distance"] == attempts - 1
+    assert p["N_io"] == 0 # autosave off
+    assert p["Attempts@1"] == attempts and p["Attempts@0.5"] < attempts
+    assert all(p[f"T_{phase}_s"] >= 0 for phase in ("draw", "containment", "distance", "io", "other"))
+
+
+def test_polygon_draws_and_io_are_counted(in_tmp):
+    runner, attempts, _ = _run(*L_SHAPE, profile=True, autosave=True)
+    p = runner.lastRunStats["Profile"]
+    assert p["N_draw"] == p["N_containment"] > attempts # draws outside the L are drawn again
+    assert p["N_distance"] == attempts - 1
+    assert p["N_io"] == 1
+
+
+def test_profiling_does_not_change_the_seeds():
+    plain, attempts, rejects = _run(*L_SHAPE, profile=False)
+    profiled, pAttempts, pRejects = _run(*L_SHAPE, profile=True)
+    assert np.array_equal(plain.lastSeeds, profiled.lastSeeds)
+    assert (attempts, rejects) == (pAttempts, pRejects)
+    assert "Profile" not in plain.lastRunStats
+
+
+def test_acceptance_curve():
+    prof = PhaseProfiler(fillFractions=(1.0, 0.5, 0.9))
+    prof.reset(10)
+    prof.accepted(5, 20)   # crosses 0.5
+    prof.accepted(9, 60)   # crosses 0.9
+    prof.accepted(10, 160) # crosses 1.0
+    stats = prof.stats(1.0)
+    assert (stats["Attempts@0.5"], stats["Rate@0.5"]) == (20, pytest.approx(5 / 20))
+    assert (stats["Attempts@0.9"], stats["Rate@0.9"]) == (60, pytest.approx(4 / 40))
+    assert (stats["Attempts@1"], stats["Rate@1"]) == (160, pytest.approx(1 / 100))
+
+
+def test_unreached_fill_levels_are_blank():
+    prof = PhaseProfiler(fillFractions=(0.5, 1.0))
+    prof.reset(10)
+    prof.accepted(6, 30)
+    prof.add("draw", 0.25)
+    stats = prof.stats(1.0)
+    assert stats["Attempts@1"] == "" and stats["Rate@1"] == ""
+    assert stats["N_draw"] == 1 and stats["T_other_s"] == pytest.approx(0.75)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from polygonDomain import PolygonDomain
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+HOLE = ([2, 4, 4, 2, 2], [2, 2, 4, 4, 2])
+# Regular hexagon with side 10 around the origin, area 3 * sqrt(3) / 2 * 10**2
+HEXAGON = ([10 * np.cos(k * np.pi / 3) for k in range(7)], [10 * np.sin(k * np.pi / 3) for k in range(7)])
+
+
+def test_rectangle_area_and_fast_path():
+    d = PolygonDomain(*SQUARE)
+    assert d.isRectangle
+    assert d.area == pytest.approx(100.0)
+
+
+def test_area_with_holes():
+    d = PolygonDomain(*SQUARE, holes=[HOLE, ([6, 8, 7, 6], [6, 6, 8, 6])])
+    assert d.area == pytest.approx(100.0 - 4.0 - 2.0)
+
+
+def test_l_shape_with_hole_area():
+    xp, yp = [0, 10, 10, 5, 5, 0, 0], [0, 0, 5, 5, 10, 10, 0]
+    d = PolygonDomain(xp, yp, holes=[HOLE])
+    assert d.area == pytest.approx(75.0 - 4.0)
+
+
+def test_hexagon_area_either_orientation():
+    xp, yp = HEXAGON
+    assert PolygonDomain(xp, yp).area == pytest.approx(150 * np.sqrt(3))
+    assert PolygonDomain(xp[::-1], yp[::-1]).area == pytest.approx(150 * np.sqrt(3))
+
+
+def test_l_shape_area_and_containment():
+    xp, yp = [0, 10, 10, 5, 5, 0, 0], [0, 0, 5, 5, 10, 10, 0]
+    d = PolygonDomain(xp, yp)
+    assert not d.isRectangle
+    assert d.area == pytest.approx(75.0)
+    assert d.contains(2, 8) and not d.contains(8, 8)
+
+
+def test_contains_points_matches_contains_with_holes():
+    d = PolygonDomain(*SQUARE, holes=[HOLE])
+    pts = np.random.default_rng(0).uniform(-1, 11, (2000, 2))
+    mask = d.contains_points(pts)
+    assert (mask == np.array([d.contains(x, y) for x, y in pts])).all()
+    assert not d.contains(3, 3)
+    assert d.contains(5, 5)
+    # Monte Carlo area of the holed square
+    inside = d.contains_points(np.random.default_rng(1).uniform(0, 10, (200000, 2))).mean() * 100
+    assert inside == pytest.approx(d.area, rel=0.02)
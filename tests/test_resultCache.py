@@ -0,0 +1,77 @@
+import numpy as np
+
+import PointAllocationProcess as Process
+from resultCache import ResultCache
+
+SQUARE = ([0, 20, 20, 0, 0], [0, 0, 20, 20, 0])
+
+
+def _put(cache, key, nbytes=8000):
+    X = np.zeros((nbytes // 16, 2))
+    cache.put(key, X, {"Status": "Completed", "Placed": np.int64(len(X)), "Profile": {"skip": 1}})
+
+
+def test_hit_miss_and_stats(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    assert cache.get("ab" * 32) is None
+    X = np.random.default_rng(0).uniform(size=(50, 2))
+    cache.put("ab" * 32, X, {"Status": "Completed", "Time_s": 0.5, "Placed": np.int64(50)})
+
+    seeds, stats = cache.get("ab" * 32)
+    assert np.array_equal(seeds, X)
+    assert stats == {"Status": "Completed", "Time_s": 0.5, "Placed": 50} # numpy scalars stored as plain values
+    assert cache.stats()["Entries"] == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    keys = [f"{i:02d}" * 32 for i in range(4)]
+    for key in keys:
+        _put(cache, key)
+    size = cache.stats()["Bytes"] // 4
+    assert cache.get(keys[0]) is not None # keys[1] is now the oldest entry
+
+    assert cache.evict(maxBytes=2 * size) == 2
+    assert cache.get(keys[1]) is None and cache.get(keys[2]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[3]) is not None
+
+    # put keeps the cache under maxBytes on its own, new settings open the same index
+    small = ResultCache(str(tmp_path / "cache"), maxBytes=size)
+    _put(small, "ff" * 32)
+    assert small.stats()["Entries"] == 1 and small.get("ff" * 32) is not None
+    cache.close()
+    small.close()
+
+
+def _runner(cache, seed):
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI_batched", rng=seed)
+    runner.cache = cache
+    return runner
+
+
+def test_sampler_runs_are_served_from_the_cache(in_tmp):
+    cache = ResultCache()
+    first = _runner(cache, 3)
+    assert first.exampleRun(80, 0.3, 30)[0] == "Completed"
+    assert first.lastRunStats["Cache"] == "miss"
+    saved = list((in_tmp / "assetss" / "csvFile").rglob("*.csv"))
+    assert len(saved) == 1
+
+    second = _runner(cache, 3)
+    assert second.exampleRun(80, 0.3, 30)[0] == "Completed"
+    assert second.lastRunStats["Cache"] == "hit"
+    assert np.array_equal(second.lastSeeds, first.lastSeeds)
+    assert list((in_tmp / "assetss" / "csvFile").rglob("*.csv")) == saved # a hit is not saved again
+
+    # Other parameters or another seed are different entries
+    _runner(cache, 4).exampleRun(80, 0.3, 30)
+    _runner(cache, 3).exampleRun(80, 0.31, 30)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # The second run of the same stream does not follow from the seed, it is never cached
+    first.exampleRun(80, 0.3, 30)
+    assert "Cache" not in first.lastRunStats
+    assert cache.hits == 1
+    cache.close()
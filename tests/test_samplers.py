@@ -0,0 +1,167 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+
+import PointAllocationProcess as Process
+from seedArchive import SeedArchive
+
+SQUARE = ([0, 30, 30, 0, 0], [0, 0, 30, 30, 0])
+METHODS = ["SSI", "SSI_batched", "SSI_freeRegion", "SSI_highN", "Bridson"]
+
+
+def _run(method, numP, ratio, seed, xp=SQUARE[0], yp=SQUARE[1], holes=None):
+    runner = Process.PointAllocationProcess(xp, yp, method, rng=seed, holes=holes)
+    runner.autosave = False
+    status, _, _, _ = runner.exampleRun(numP, ratio, 30)
+    return runner, status
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_minimum_spacing_and_containment(method):
+    numP, ratio = 200, 0.35
+    runner, status = _run(method, numP, ratio, seed=11)
+    assert status == "Completed"
+    X = runner.lastSeeds
+    assert X.shape == (numP, 2)
+    r = ratio * runner.SeedMaxDis(runner.getArea(), numP)
+    assert pdist(X).min() > r * (1 - 1e-12)
+    assert runner.domain.contains_points(X).all()
+
+
+@pytest.mark.parametrize("method", ["SSI_batched", "SSI_highN"])
+def test_spacing_and_holes_on_a_polygon(method):
+    xp, yp = [0, 30, 30, 15, 15, 0, 0], [0, 0, 15, 15, 30, 30, 0]
+    holes = [([3, 8, 8, 3, 3], [3, 3, 8, 8, 3])]
+    numP, ratio = 150, 0.35
+    runner, status = _run(method, numP, ratio, seed=5, xp=xp, yp=yp, holes=holes)
+    assert status == "Completed"
+    X = runner.lastSeeds
+    assert pdist(X).min() > ratio * runner.SeedMaxDis(runner.getArea(), numP) * (1 - 1e-12)
+    assert runner.domain.contains_points(X).all()
+
+
+def test_inhibition_distance_on_a_hexagon():
+    # Side 10: A = 150 * sqrt(3), so SeedMaxDis = sqrt(2 * A / 100 * sqrt(3)) = sqrt(9) = 3 for 100 seeds
+    xp = [10 * np.cos(k * np.pi / 3) for k in range(7)]
+    yp = [10 * np.sin(k * np.pi / 3) for k in range(7)]
+    runner, status = _run("SSI", 100, 0.35, seed=2, xp=xp, yp=yp)
+    assert runner.getArea() == pytest.approx(150 * np.sqrt(3))
+    assert runner.SeedMaxDis(runner.getArea(), 100) == pytest.approx(3.0)
+    assert status == "Completed"
+    assert pdist(runner.lastSeeds).min() > 0.35 * 3.0
+    assert runner.domain.contains_points(runner.lastSeeds).all()
+    # The bounding box (20 x 10 * sqrt(3)) would give sqrt(12) instead
+    assert runner.SeedMaxDis(runner.getAreaQUAD(), 100) == pytest.approx(np.sqrt(12))
+
+
+def test_inhibition_distance_on_an_l_shape_with_hole():
+    xp, yp = [0, 10, 10, 5, 5, 0, 0], [0, 0, 5, 5, 10, 10, 0]
+    runner = Process.PointAllocationProcess(xp, yp, holes=[([1, 3, 3, 1, 1], [1, 1, 3, 3, 1])])
+    # A = 100 - 25 - 4 = 71
+    assert runner.SeedMaxDis(runner.getArea(), 71) == pytest.approx(np.sqrt(2 * np.sqrt(3)))
+    assert runner.numPForDensity(0.5) == 36
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_same_seed_same_set(method):
+    a, _ = _run(method, 100, 0.3, seed=3)
+    b, _ = _run(method, 100, 0.3, seed=3)
+    c, _ = _run(method, 100, 0.3, seed=4)
+    assert np.array_equal(a.lastSeeds, b.lastSeeds)
+    assert not np.array_equal(a.lastSeeds, c.lastSeeds)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_reseed_replays_a_logged_run(method):
+    # The sweeps reuse one runner and reseed it per run, the "Seed" column must replay that run
+    runner = Process.PointAllocationProcess(*SQUARE, method, rng=0)
+    runner.autosave = False
+    runner.exampleRun(100, 0.3, 30)
+    runner.reseed(3)
+    runner.exampleRun(100, 0.3, 30)
+    fresh, _ = _run(method, 100, 0.3, seed=runner.seed)
+    assert np.array_equal(runner.lastSeeds, fresh.lastSeeds)
+
+
+def _quadrants(X, xp, yp):
+    cx, cy = (min(xp) + max(xp)) / 2, (min(yp) + max(yp)) / 2
+    return np.bincount((X[:, 0] >= cx) * 2 + (X[:, 1] >= cy), minlength=4)
+
+
+@pytest.mark.parametrize("ratio", [0.1, 0.3, 0.5])
+def test_bridson_covers_the_panel(ratio):
+    # A front grown from one seed and stopped at numP stays around its start seed
+    numP = 120
+    runner, status = _run("Bridson", numP, ratio, seed=1)
+    assert status == "Completed"
+    X = runner.lastSeeds
+    counts = _quadrants(X, *SQUARE)
+    assert counts.min() > 0.15 * numP, counts
+    assert pdist(X).min() > ratio * runner.SeedMaxDis(runner.getArea(), numP) * (1 - 1e-12)
+    assert runner.lastRunStats["EstMaxSeeds"] >= numP
+
+
+def test_bridson_reports_saturation():
+    # Beyond what any random packing holds (a hex lattice needs ratio <= 1/sqrt(3))
+    numP = 120
+    runner, status = _run("Bridson", numP, 0.56, seed=2)
+    assert status == "Saturated"
+    placed = runner.lastRunStats["Placed"]
+    assert placed == runner.lastRunStats["EstMaxSeeds"] < numP
+    X = runner.lastSeeds[:placed]
+    assert pdist(X).min() > 0.56 * runner.SeedMaxDis(runner.getArea(), numP) * (1 - 1e-12)
+    assert runner.lastRunStats["FreeArea"] < 1e-6 * runner.getArea()
+
+
+def test_batched_resolves_conflicts_inside_one_block():
+    numP, ratio = 150, 0.35
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI_batched", rng=8)
+    runner.autosave = False
+    plain = runner.draw_candidates
+
+    def clustered(n):
+        # Every candidate comes with a twin closer than r, in the same block
+        pts = plain(n // 2)
+        twins = pts + runner.rng.uniform(-0.05, 0.05, pts.shape)
+        return np.column_stack((pts, twins)).reshape(-1, 2)
+
+    runner.draw_candidates = clustered
+    status, _, attempts, rejects = runner.exampleRun(numP, ratio, 30)
+    assert status == "Completed"
+    X = runner.lastSeeds
+    assert pdist(X).min() > ratio * runner.SeedMaxDis(runner.getArea(), numP) * (1 - 1e-12)
+    assert rejects >= numP - 1 # at least every accepted candidate's twin was rejected
+
+
+def test_iter_seed_sets_is_lazy_and_writes_nothing_by_default(in_tmp):
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI_batched", rng=1) # autosave stays on
+    runs = []
+    run = runner.exampleRun
+    runner.exampleRun = lambda *args: runs.append(args) or run(*args)
+
+    sets = runner.iterSeedSets(50, 0.3, 30) # endless
+    assert runs == []
+    first = next(sets)
+    assert len(runs) == 1
+    rest = list(itertools.islice(sets, 2))
+    assert len(runs) == 3
+    sets.close()
+
+    collected = [first[0]] + [X for X, _ in rest]
+    assert not np.array_equal(collected[0], collected[1]) # each set kept its own array
+    assert [info["Sample"] for _, info in [first] + rest] == [0, 1, 2]
+    assert "Location" not in first[1]
+    assert os.listdir(in_tmp) == []
+    assert runner.autosave
+
+
+def test_iter_seed_sets_saves_to_the_sink(in_tmp):
+    runner = Process.PointAllocationProcess(*SQUARE, "SSI_batched", rng=1)
+    runner.sink = SeedArchive(str(in_tmp / "archive"))
+    infos = [info for _, info in runner.iterSeedSets(50, 0.3, 30, samples=2, save=True)]
+    assert all(info["Location"] for info in infos)
+    assert runner.sink.count(30, 30, 50, 0.3) == 2
+    assert os.listdir(in_tmp) == ["archive"] # no CSV tree next to it
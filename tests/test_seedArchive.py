@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+
+from seedArchive import SeedArchive
+
+
+def _sets(n, numP, seed=0):
+    return np.random.default_rng(seed).uniform(0, 50, size=(n, numP, 2))
+
+
+def test_append_load_get_round_trip(tmp_path):
+    archive = SeedArchive(str(tmp_path / "archive"))
+    sets = _sets(3, 40)
+    ids = [archive.append(X, 50, 50, 0.3, {"Method": "SSI", "Status": "Completed", "Time_s": 0.12345})
+           for X in sets]
+    assert ids == [0, 1, 2]
+    assert archive.count(50, 50, 40, 0.3) == 3
+
+    stored = archive.load(50, 50, 40, 0.3)
+    assert stored.shape == (3, 40, 2)
+    assert np.array_equal(stored, sets) # float64 records are bit exact
+    assert np.array_equal(archive.get(50, 50, 40, 0.3, 1), sets[1])
+
+    rows = archive.index(50, 50, 40, 0.3)
+    assert [r["Sample"] for r in rows] == ["0", "1", "2"]
+    assert rows[0]["Method"] == "SSI" and rows[0]["Time_s"] == "0.123"
+
+
+def test_save_reference_opens_the_same_record(tmp_path):
+    archive = SeedArchive(str(tmp_path / "archive"))
+    X0, X1 = _sets(2, 25, seed=1)
+    info = {"Width": 30, "Height": 20, "Ratio": 0.1, "Method": "Bridson"}
+    archive.save(X0, info)
+    location = archive.save(X1, info)
+
+    directory, sample = location.rsplit("#", 1)
+    assert sample == "1"
+    assert os.path.samefile(directory, archive.group_dir(30, 20, 25, 0.1))
+    assert np.array_equal(SeedArchive.open_group(directory)[int(sample)], X1)
+
+
+def test_float32_groups_and_missing_groups(tmp_path):
+    archive = SeedArchive(str(tmp_path / "archive"), dtype="float32")
+    X = _sets(1, 10)[0]
+    archive.append(X, 50, 50, 0.5)
+    assert archive.load(50, 50, 10, 0.5).dtype == np.dtype("<f4")
+    assert np.allclose(archive.get(50, 50, 10, 0.5, 0), X, atol=1e-5)
+
+    # The group keeps the dtype it was created with
+    assert SeedArchive(str(tmp_path / "archive")).load(50, 50, 10, 0.5).dtype == np.dtype("<f4")
+    assert archive.load(50, 50, 11, 0.5).shape == (0, 11, 2)
+    assert archive.count(50, 50, 11, 0.5) == 0
+
+
+def test_import_csv_tree_merges_ratio_folders(tmp_path):
+    csvRoot = tmp_path / "csvFile"
+    X = _sets(2, 5, seed=2)
+    for name, Xi in zip(("ratio_0.10", "ratio_0.100"), X):
+        folder = csvRoot / "50x50" / "numP_5" / name
+        folder.mkdir(parents=True)
+        np.savetxt(folder / "SSI_0.csv", Xi, delimiter=",")
+
+    archive = SeedArchive(str(tmp_path / "archive"))
+    assert archive.import_csv_tree(str(csvRoot)) == 2
+    assert archive.count(50, 50, 5, 0.1) == 2
+    assert np.allclose(archive.load(50, 50, 5, 0.1), X)
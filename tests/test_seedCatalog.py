@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+from seedArchive import SeedArchive
+from seedCatalog import SeedCatalog, normalize_ratio, seed_spacing
+
+
+def _info(**extra):
+    info = {"Width": 50, "Height": 50, "numP": 4, "Ratio": 0.1, "Method": "SSI"}
+    info.update(extra)
+    return info
+
+
+X = np.array([[1.0, 1.0], [4.0, 1.0], [1.0, 5.0], [9.0, 9.0]])
+
+
+def test_seed_spacing_ignores_unplaced_rows():
+    assert seed_spacing(X) == (4, 3.0)
+    partial = X.copy()
+    partial[2:] = 0
+    assert seed_spacing(partial) == (2, 3.0)
+    assert seed_spacing(np.zeros((3, 2))) == (0, None)
+    assert normalize_ratio("0.10") == normalize_ratio(0.100) == 0.1
+
+
+def test_register_query_and_load_csv_and_archive(tmp_path):
+    catalog = SeedCatalog(str(tmp_path / "catalog.sqlite"))
+
+    folder = tmp_path / "csvFile" / "50x50" / "numP_4" / "ratio_0.10"
+    folder.mkdir(parents=True)
+    csvPath = str(folder / "SSI_0.csv")
+    np.savetxt(csvPath, X, delimiter=",")
+    catalog.register(csvPath, X, _info(Status="Completed", Seed=2**63 + 5))
+
+    archive = SeedArchive(str(tmp_path / "archive"))
+    Y = X + 10
+    location = archive.save(Y, _info(Ratio=0.100, Method="Bridson"))
+    catalog.register(location, Y, _info(Ratio=0.100, Method="Bridson", Status="Timeout"))
+
+    rows = catalog.query(width=50, numP=4, ratio=0.1)
+    assert len(rows) == 2 # both ratio spellings land in one group
+    byKind = {r["kind"]: r for r in rows}
+    assert byKind["csv"]["seed"] == str(2**63 + 5) and byKind["csv"]["sample"] == 0
+    assert byKind["archive"]["minSpacing"] == 3.0 and byKind["archive"]["placed"] == 4
+
+    assert [r["kind"] for r in catalog.query(status="Completed")] == ["csv"]
+    assert len(catalog.query(status=("Completed", "Timeout"), limit=1)) == 1
+    assert catalog.query(minSpacing=3.5) == []
+    assert np.allclose(SeedCatalog.load(byKind["csv"]), X)
+    assert np.array_equal(SeedCatalog.load(byKind["archive"]), Y)
+    catalog.close()
+
+
+def test_scan_is_incremental_and_keeps_run_info(tmp_path):
+    csvRoot = tmp_path / "csvFile"
+    folder = csvRoot / "30x20" / "numP_4" / "ratio_0.300"
+    folder.mkdir(parents=True)
+    for i in range(2):
+        np.savetxt(folder / f"SSI_{i}.csv", X + i, delimiter=",")
+    archive = SeedArchive(str(tmp_path / "archive"))
+    archive.append(X, 30, 20, 0.3, {"Method": "SSI", "Status": "Completed", "Seed": 7})
+
+    catalog = SeedCatalog(str(tmp_path / "catalog.sqlite"))
+    counts = catalog.scan(str(csvRoot), archive.root)
+    assert counts == {"added": 3, "updated": 0, "removed": 0} # 2 CSVs + 1 archive record
+    assert len(catalog.query(width=30, height=20, ratio=0.3)) == 3
+
+    # Nothing changed: no file is read again
+    assert catalog.scan(str(csvRoot), archive.root) == {"added": 0, "updated": 0, "removed": 0}
+
+    os.remove(folder / "SSI_1.csv")
+    archive.append(X + 1, 30, 20, 0.3, {"Method": "SSI", "Status": "Timeout"})
+    assert catalog.scan(str(csvRoot), archive.root) == {"added": 1, "updated": 0, "removed": 1}
+    statuses = sorted(r["status"] for r in catalog.query(ratio=0.3))
+    assert statuses == ["Completed", "Completed", "Timeout"]
+    seeds = [r["seed"] for r in catalog.query(ratio=0.3) if r["kind"] == "archive"]
+    assert "7" in seeds
+    catalog.close()
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist, squareform
+
+import PointAllocationProcess as Process
+from polygonDomain import PolygonDomain
+from seedStatistics import analyze_sets
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+
+
+def test_ripley_l_is_r_for_uniform_points():
+    domain = PolygonDomain(*SQUARE)
+    sets = np.random.default_rng(0).uniform(0, 10, (20, 500, 2))
+    out = analyze_sets(sets, domain)
+    L = np.nanmean(out["L"], axis=0)
+    r = out["radii"]
+    # Complete spatial randomness: L(r) = r, the smallest radii hold too few pairs to judge
+    assert L[5:] / r[5:] == pytest.approx(1.0, abs=0.03)
+
+
+def test_spacing_matches_brute_force_with_unplaced_rows():
+    domain = PolygonDomain(*SQUARE)
+    sets = np.random.default_rng(1).uniform(0, 10, (4, 60, 2))
+    sets[2, 50:] = 0 # timed-out run
+    out = analyze_sets(sets, domain)
+    assert list(out["placed"]) == [60, 60, 50, 60]
+    for s, X in enumerate(sets):
+        X = X[(X != 0).any(axis=1)]
+        d = squareform(pdist(X))
+        np.fill_diagonal(d, np.inf)
+        assert out["minSpacing"][s] == pytest.approx(d.min())
+        assert out["meanNN"][s] == pytest.approx(d.min(axis=1).mean())
+    assert out["delta"] == pytest.approx(out["minSpacing"] / out["rMax"])
+
+
+def test_ssi_sets_have_no_pairs_inside_the_inhibition_distance():
+    domain = PolygonDomain(*SQUARE)
+    ratio, numP = 0.4, 80
+    sets = []
+    for seed in range(3):
+        runner = Process.PointAllocationProcess(*SQUARE, "SSI", rng=seed)
+        runner.autosave = False
+        runner.exampleRun(numP, ratio, 30)
+        sets.append(runner.lastSeeds)
+    out = analyze_sets(np.array(sets), domain)
+    inside = out["radii"] < ratio * out["rMax"]
+    assert (out["K"][:, inside] == 0).all()
+    assert (out["delta"] > ratio).all()
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from spatialHashGrid import SpatialHashGrid
+from seedGrid import SeedGrid
+
+
+def _brute(pts, seeds, dis):
+    d2 = ((pts[:, None, :] - seeds[None, :, :]) ** 2).sum(axis=2)
+    return (d2 <= dis * dis).any(axis=1)
+
+
+@pytest.mark.parametrize("dis", [0.5, 1.0, 2.5])
+def test_spatial_hash_grid_matches_brute_force(dis):
+    rng = np.random.default_rng(1)
+    seeds = rng.uniform(0, 20, (300, 2))
+    grid = SpatialHashGrid(0.0, 0.0, dis)
+    for x, y in seeds:
+        grid.insert(x, y)
+    pts = rng.uniform(-1, 21, (2000, 2))
+    got = np.array([grid.has_neighbour_within(x, y, dis) for x, y in pts])
+    assert grid.count == len(seeds)
+    assert (got == _brute(pts, seeds, dis)).all()
+
+
+def test_spatial_hash_grid_distance_rule_is_inclusive():
+    grid = SpatialHashGrid(0.0, 0.0, 1.0)
+    grid.insert(0.0, 0.0)
+    assert grid.has_neighbour_within(1.0, 0.0, 1.0)
+    assert not grid.has_neighbour_within(1.0 + 1e-9, 0.0, 1.0)
+
+
+@pytest.mark.parametrize("dis", [0.5, 1.0, 2.5])
+def test_seed_grid_conflicts_match_brute_force(dis):
+    rng = np.random.default_rng(2)
+    X = rng.uniform(0, 20, (500, 2))
+    grid = SeedGrid(0.0, 0.0, 20.0, 20.0, dis, capacity=1) # capacity 1 forces slot growth
+    for k, (x, y) in enumerate(X):
+        grid.insert(k, x, y)
+    pts = rng.uniform(-1, 21, (3000, 2))
+    assert (grid.conflicts(pts, X, dis) == _brute(pts, X, dis)).all()
+
+
+def test_seed_grid_insert_block_equals_single_inserts():
+    rng = np.random.default_rng(3)
+    X = rng.uniform(0, 10, (400, 2))
+    one = SeedGrid(0.0, 0.0, 10.0, 10.0, 0.7, capacity=2)
+    block = SeedGrid(0.0, 0.0, 10.0, 10.0, 0.7, capacity=2)
+    for k, (x, y) in enumerate(X):
+        one.insert(k, x, y)
+    block.insert_block(0, X[:150])
+    block.insert_block(150, X[150:])
+    assert (one.counts == block.counts).all()
+    for cell in range(len(one.counts)):
+        assert sorted(one.slots[cell][one.slots[cell] >= 0]) == sorted(block.slots[cell][block.slots[cell] >= 0])
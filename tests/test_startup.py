@@ -0,0 +1,29 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarkSSI import WORKER_MODULES, bench_startup
+
+SRC_UTILS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "utils")
+
+
+@pytest.mark.parametrize("module", WORKER_MODULES)
+def test_worker_modules_do_not_import_scipy_or_matplotlib(module):
+    startup = bench_startup(module, rounds=1) # fresh interpreter per check
+    assert not startup["scipy"] and not startup["matplotlib"]
+
+
+def test_cli_help_does_not_import_scipy_or_matplotlib():
+    code = ("import json, runpy, sys\n"
+            "sys.argv = ['interfacingPython', 'generate', '--help']\n"
+            "try:\n"
+            "    runpy.run_module('interfacingPython', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(json.dumps(['scipy' in sys.modules, 'matplotlib' in sys.modules]))")
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC_UTILS))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert json.loads(out.stdout.splitlines()[-1]) == [False, False]
@@ -0,0 +1,78 @@
+import numpy as np
+
+import stlExport
+import voronoiLattice
+from polygonDomain import PolygonDomain
+from stlWriter import read_binary_stl
+
+W, H = 20.0, 12.0
+XP, YP = [0, W, W, 0, 0], [0, 0, H, H, 0]
+
+
+def _seeds(n=25, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform([1, 1], [W - 1, H - 1], size=(n, 2))
+
+
+def _edge_counts(tris):
+    """How many facets use every (undirected) edge, vertices welded on a fine grid."""
+    v = np.round(tris.reshape(-1, 3) / 1e-7).astype(np.int64).reshape(-1, 3, 3)
+    counts = {}
+    for tri in v:
+        for a, b in ((0, 1), (1, 2), (2, 0)):
+            key = tuple(sorted((tuple(tri[a]), tuple(tri[b]))))
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _on_outline(cell):
+    """Cell edges lying on the rectangle outline."""
+    q = np.roll(cell, -1, axis=0)
+    tol = 1e-9
+    same = lambda k, v: (np.abs(cell[:, k] - v) < tol) & (np.abs(q[:, k] - v) < tol)
+    return int((same(0, 0) | same(0, W) | same(1, 0) | same(1, H)).sum())
+
+
+def test_extruded_lattice_is_watertight_with_the_expected_facets():
+    lattice = voronoiLattice.build_lattice(_seeds(), XP, YP, thickness=0.4)
+    tris = stlExport.extrude_lattice(lattice["cells"], lattice["voids"], PolygonDomain(XP, YP), depth=2.0)
+
+    expected = 0
+    for cell, void in zip(lattice["cells"], lattice["voids"]):
+        if len(void) >= 3:
+            expected += 2 * (len(cell) + len(void)) + 2 * len(void) # top + bottom rings, void walls
+        else:
+            expected += 2 * (len(cell) - 2)
+        expected += 2 * _on_outline(cell)
+    assert len(tris) == expected
+
+    counts = _edge_counts(tris)
+    assert set(counts.values()) == {2} # every edge shared by exactly two facets
+    assert tris[..., 2].min() == 0 and tris[..., 2].max() == 2.0
+
+
+def test_export_batch_writes_one_stl_per_seed_set(tmp_path):
+    sources = []
+    for k in range(2):
+        path = tmp_path / "csv" / f"SSI_{k}.csv"
+        path.parent.mkdir(exist_ok=True)
+        np.savetxt(path, _seeds(seed=k), delimiter=",")
+        sources.append(str(path))
+    paths = [str(tmp_path / "stl" / f"SSI_{k}.stl") for k in range(2)]
+
+    written = stlExport.export_stl_batch(sources, XP, YP, 0.4, 2.0, paths=paths, cacheRoot=None, workers=2)
+    assert written == paths
+    for src, out in zip(sources, written):
+        X = np.loadtxt(src, delimiter=",")
+        lattice = voronoiLattice.build_lattice(X, XP, YP, 0.4)
+        tris = stlExport.extrude_lattice(lattice["cells"], lattice["voids"], PolygonDomain(XP, YP), 2.0)
+        facets = read_binary_stl(out)
+        assert len(facets) == len(tris)
+        assert np.allclose(facets["vertices"], tris, atol=1e-5)
+
+
+def test_stl_path_mirrors_the_seed_location():
+    csv = "assetss/csvFile/50x50/numP_314/ratio_0.400/SSI_3.csv"
+    assert stlExport.stl_path(csv, root="out") == "out/50x50/numP_314/ratio_0.400/SSI_3.stl"
+    ref = "assetss/seedArchive/50x50/numP_314/ratio_0.400#7"
+    assert stlExport.stl_path(ref, root="out") == "out/50x50/numP_314/ratio_0.400/archive_7.stl"
@@ -0,0 +1,44 @@
+import numpy as np
+
+from stlWriter import STL_DTYPE, facet_normals, read_binary_stl, write_binary_stl
+
+
+def _tris(n, seed=0):
+    return np.random.default_rng(seed).uniform(-10, 10, size=(n, 3, 3))
+
+
+def test_round_trip_and_facet_count(tmp_path):
+    tris = _tris(1000)
+    path = write_binary_stl(str(tmp_path / "out" / "mesh.stl"), tris, name="panel")
+
+    data = (tmp_path / "out" / "mesh.stl").read_bytes()
+    assert len(data) == 84 + 50 * len(tris)
+    assert data[:80].rstrip() == b"panel"
+    assert int(np.frombuffer(data[80:84], dtype="<u4")[0]) == len(tris)
+
+    facets = read_binary_stl(path)
+    assert facets.dtype == STL_DTYPE and len(facets) == len(tris)
+    assert np.array_equal(facets["vertices"], tris.astype(np.float32))
+    assert np.allclose(facets["normal"], facet_normals(tris), atol=1e-6)
+    assert np.allclose(np.linalg.norm(facets["normal"], axis=1), 1, atol=1e-6)
+    assert not facets["attr"].any()
+
+
+def test_memmap_path_writes_the_same_bytes(tmp_path):
+    tris = _tris(257, seed=1)
+    direct = tmp_path / "direct.stl"
+    mapped = tmp_path / "mapped.stl"
+    write_binary_stl(str(direct), tris)
+    write_binary_stl(str(mapped), tris, memmapAbove=1, chunk=50) # last chunk is partial
+    assert direct.read_bytes() == mapped.read_bytes()
+
+
+def test_degenerate_and_empty_meshes(tmp_path):
+    tris = np.zeros((2, 3, 3))
+    tris[1] = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    facets = read_binary_stl(write_binary_stl(str(tmp_path / "a.stl"), tris))
+    assert np.array_equal(facets["normal"], [[0, 0, 0], [0, 0, 1]])
+
+    write_binary_stl(str(tmp_path / "empty.stl"), np.zeros((0, 3, 3)))
+    data = (tmp_path / "empty.stl").read_bytes()
+    assert len(data) == 84 and int(np.frombuffer(data[80:84], dtype="<u4")[0]) == 0
@@ -0,0 +1,107 @@
+import csv
+import json
+
+import pytest
+
+import run
+import sweepRunner
+from sweepRunner import LOG_HEADER, SweepLog
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+
+
+def _row(ratio, sample, status="Completed"):
+    return ("SSI", 20, 10, 10, f"{ratio:.3f}", sample, "0.010", status, 1, 0, 123, 20, "", "")
+
+
+def _rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_resume_skips_done_runs_and_keeps_the_base_seed(tmp_path):
+    path = str(tmp_path / "log.csv")
+    log = SweepLog(path, baseSeed=42)
+    assert log.baseSeed == 42
+    log.append(_row(0.1, 0))
+    log.append(_row(0.2, 0, "Timeout"))
+
+    resumed = SweepLog(path)
+    assert resumed.baseSeed == 42
+    assert resumed.is_done(0.1, 0) and resumed.is_done(0.2, 0)
+    assert not resumed.is_done(0.1, 1)
+    assert resumed.stopped == {"0.200"}
+    with pytest.raises(ValueError):
+        SweepLog(path, baseSeed=43)
+
+    # Same job order and seeds after the restart
+    assert sweepRunner.spawn_seeds(resumed.baseSeed, 4) == sweepRunner.spawn_seeds(42, 4)
+
+
+def test_resume_without_meta_file(tmp_path):
+    path = tmp_path / "log.csv"
+    SweepLog(str(path), baseSeed=7).append(_row(0.1, 0))
+    (tmp_path / "log.json").unlink()
+
+    with pytest.raises(ValueError):
+        SweepLog(str(path))
+    assert SweepLog(str(path), baseSeed=7).baseSeed == 7
+    assert json.loads((tmp_path / "log.json").read_text()) == {"baseSeed": 7}
+    assert SweepLog(str(path)).baseSeed == 7
+
+
+def test_a_new_log_never_resumes_an_existing_one(tmp_path):
+    path = str(tmp_path / "log.csv")
+    SweepLog(path, baseSeed=1).append(_row(0.1, 0))
+
+    log = SweepLog(path, baseSeed=2, new=True)
+    assert log.path == str(tmp_path / "log_1.csv")
+    assert log.done == set() and log.baseSeed == 2
+    assert json.loads((tmp_path / "log_1.json").read_text()) == {"baseSeed": 2}
+    assert SweepLog(path, new=True).path == str(tmp_path / "log_2.csv")
+    assert len(_rows(path)) == 1 # the first log is untouched
+
+
+def test_fresh_sweeps_in_the_same_second_do_not_share_a_log(in_tmp, monkeypatch):
+    class _Frozen(run.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 1, 1, 12, 0, 0)
+
+    monkeypatch.setattr(run, "datetime", _Frozen)
+    first = run._sequential_sweep(*SQUARE, 20, [0.2], 2, 5, "SSI", 1, None, None)
+    second = run._sequential_sweep(*SQUARE, 20, [0.2], 2, 5, "SSI", 2, None, None)
+    assert first != second
+    assert len(_rows(first)) == len(_rows(second)) == 2
+
+
+def test_older_logs_keep_their_columns(tmp_path):
+    path = tmp_path / "log.csv"
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerow(LOG_HEADER[:-1]) # logs from before the Cache column
+    (tmp_path / "log.json").write_text(json.dumps({"baseSeed": 1}))
+
+    log = SweepLog(str(path))
+    log.append(_row(0.1, 0))
+    with open(path, newline="") as f:
+        assert [len(r) for r in csv.reader(f)] == [len(LOG_HEADER) - 1] * 2
+
+
+@pytest.mark.parametrize("policy, rows, timeouts", [("stop_sweep", 3, 1), ("skip_ratio", 5, 1), ("continue", 6, 2)])
+def test_sequential_sweep_policies(in_tmp, policy, rows, timeouts):
+    # ratio 0.9 cannot be reached, every run of it times out
+    ratios = [0.2, 0.9, 0.25]
+    path = run._sequential_sweep(*SQUARE, 20, ratios, 2, 0.2, "SSI", 5, None, None, policy=policy)
+    logged = _rows(path)
+    assert len(logged) == rows
+    assert [r["Status"] for r in logged[:3]] == ["Completed", "Completed", "Timeout"]
+
+    # A resumed sweep applies the policy to the logged timeout and runs nothing new
+    run._sequential_sweep(*SQUARE, 20, ratios, 2, 0.2, "SSI", None, None, path, policy=policy)
+    assert _rows(path) == logged
+    assert len(list((in_tmp / "assetss" / "csvFile").glob("runtime_log_*_partial/*.npy"))) == timeouts
+
+
+def test_unknown_policy(in_tmp):
+    with pytest.raises(ValueError):
+        run._sequential_sweep(*SQUARE, 20, [0.2], 1, 0.2, "SSI", 5, None, None, policy="retry")
@@ -0,0 +1,77 @@
+import csv
+
+import numpy as np
+import pytest
+
+import run
+from resultCache import ResultCache
+from sweepRunner import LOG_HEADER, run_sweep_parallel
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+STATUS = LOG_HEADER.index("Status")
+
+
+class _FailingCache:
+    """Stands in for a ResultCache, raises inside the worker for one ratio."""
+
+    def __init__(self, badRatio):
+        self.badRatio = badRatio
+
+    def key_for(self, runner, numP, ratio):
+        if ratio == self.badRatio:
+            raise RuntimeError("broken job")
+        return None
+
+    def get(self, key):
+        return None
+
+    def put(self, key, X, stats):
+        pass
+
+
+def test_a_failed_job_is_logged_and_the_sweep_goes_on(in_tmp):
+    log = run_sweep_parallel(*SQUARE, 20, [0.2, 0.25, 0.3], 2, 5, method="SSI_batched", workers=2,
+                             baseSeed=1, cache=_FailingCache(0.25))
+    assert log[0] == LOG_HEADER
+    assert [(row[4], row[STATUS]) for row in log[1:]] == [
+        ("0.200", "Completed"), ("0.200", "Completed"),
+        ("0.250", "Error"), ("0.250", "Error"),
+        ("0.300", "Completed"), ("0.300", "Completed")]
+    assert all(len(row) == len(LOG_HEADER) for row in log)
+
+
+def test_every_job_failing_still_returns_the_log(in_tmp):
+    log = run_sweep_parallel(*SQUARE, 20, [0.2], 3, 5, method="NoSuchSampler", workers=2, baseSeed=1)
+    assert [row[STATUS] for row in log[1:]] == ["Error"] * 3
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        run_sweep_parallel(*SQUARE, 20, [0.2], 1, 5, policy="retry")
+
+
+def _cached_sets(root):
+    sets = {}
+    for path in sorted(root.glob("*/*.npz")):
+        with np.load(path) as data:
+            sets[path.stem] = data["X"]
+    return sets
+
+
+def test_sequential_and_parallel_sweeps_give_the_same_sets(in_tmp):
+    # Every completed run lands in its cache under a key that includes the run's seed
+    ratios, typeNumb = [0.2, 0.3], 3
+    seqCache, parCache = ResultCache(str(in_tmp / "seq")), ResultCache(str(in_tmp / "par"))
+    path = run._sequential_sweep(*SQUARE, 20, ratios, typeNumb, 5, "SSI", 42, None, None, cache=seqCache)
+    log = run_sweep_parallel(*SQUARE, 20, ratios, typeNumb, 5, method="SSI", workers=2, baseSeed=42,
+                             cache=parCache)
+
+    with open(path) as f:
+        seqRows = list(csv.reader(f))[1:]
+    seedCol = LOG_HEADER.index("Seed")
+    assert [row[seedCol] for row in seqRows] == [str(row[seedCol]) for row in log[1:]]
+    assert [row[STATUS] for row in seqRows] == ["Completed"] * len(ratios) * typeNumb
+
+    seq, par = _cached_sets(in_tmp / "seq"), _cached_sets(in_tmp / "par")
+    assert len(seq) == len(ratios) * typeNumb and seq.keys() == par.keys()
+    assert all(np.array_equal(seq[k], par[k]) for k in seq)
@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+from scipy.spatial import KDTree
+
+import tiledSSI
+
+W = 80.0
+SQUARE = ([0, W, W, 0, 0], [0, 0, W, W, 0])
+
+
+def _min_spacing(X):
+    d, _ = KDTree(X).query(X, k=2)
+    return d[:, 1].min()
+
+
+def test_spacing_holds_across_tile_seams():
+    numP, ratio = 2000, 0.4
+    X, stats = tiledSSI.tiled_ssi(*SQUARE, numP, ratio, 60, tiles=(3, 2), workers=2, seed=4)
+    assert stats["Status"] == "Completed"
+    assert stats["Placed"] == numP and stats["SeamPlaced"] > 0
+    r = ratio * np.sqrt(2 * W * W / numP * np.sqrt(3))
+    assert _min_spacing(X) > r * (1 - 1e-12)
+
+    # Seeds on both sides of every seam, close to it
+    for seam in (W / 3, 2 * W / 3):
+        near = X[np.abs(X[:, 0] - seam) < 2 * r]
+        assert (near[:, 0] < seam).any() and (near[:, 0] > seam).any()
+    assert ((X >= 0) & (X <= W)).all()
+
+
+def test_same_seed_same_set():
+    a, _ = tiledSSI.tiled_ssi(*SQUARE, 500, 0.3, 60, tiles=(2, 2), workers=2, seed=9)
+    b, _ = tiledSSI.tiled_ssi(*SQUARE, 500, 0.3, 60, tiles=(2, 2), workers=2, seed=9)
+    assert np.array_equal(a, b)
+
+
+def test_jammed_tiles_stop_before_the_timeout():
+    timeout = 60
+    t0 = time.time()
+    X, stats = tiledSSI.tiled_ssi(*SQUARE, 2000, 0.6, timeout, tiles=(2, 2), workers=2, seed=1,
+                                  jamming={"mode": "estimate"})
+    assert time.time() - t0 < timeout / 4
+    assert stats["Status"] == "Jammed"
+    assert {t["Status"] for t in stats["Tiles"]} == {"Jammed"}
+    assert _min_spacing(X[:stats["Placed"]]) > 0
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import voronoiLattice
+from polygonDomain import PolygonDomain
+from voronoiLattice import LatticeCache, build_lattice, clip_polygon, inset_polygon, voronoi_cells
+
+SQUARE = ([0, 10, 10, 0, 0], [0, 0, 10, 10, 0])
+L_SHAPE = np.array([[0, 0], [10, 0], [10, 5], [5, 5], [5, 10], [0, 10]], dtype=float)
+
+
+def _area(poly):
+    x, y = poly[:, 0], poly[:, 1]
+    return 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _box(x0, y0, x1, y1):
+    return np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=float)
+
+
+def test_clip_overlapping_squares():
+    out = clip_polygon(_box(0, 0, 4, 4), _box(2, 1, 6, 3))
+    assert _area(out) == pytest.approx(2 * 2) # [2, 4] x [1, 3], counter-clockwise
+    assert len(out) == 4
+
+
+def test_clip_non_convex_subject_and_orientation():
+    # Clockwise clipper over the notch of the L: [3, 8] x [3, 8] minus [5, 8] x [5, 8]
+    out = clip_polygon(L_SHAPE, _box(3, 3, 8, 8)[::-1])
+    assert _area(out) == pytest.approx(25 - 9)
+    assert len(out) == 6 # no zero-width spikes along the clip lines
+
+
+def test_clip_disjoint_and_inset():
+    assert len(clip_polygon(_box(0, 0, 1, 1), _box(2, 2, 3, 3))) == 0
+    assert _area(clip_polygon(_box(0, 0, 10, 10), _box(2, 2, 6, 6), inset=0.5)) == pytest.approx(3 * 3)
+    assert len(clip_polygon(_box(0, 0, 10, 10), _box(2, 2, 3, 3), inset=0.5)) == 0
+
+
+def test_inset_polygon():
+    assert _area(inset_polygon(_box(0, 0, 10, 10), 1.0)) == pytest.approx(8 * 8)
+    # [1, 9] x [1, 4] plus [1, 4] x [4, 9]
+    inner = inset_polygon(L_SHAPE[::-1], 1.0)
+    assert _area(inner) == pytest.approx(24 + 15)
+    assert {tuple(p) for p in np.round(inner, 12)} == {(1, 1), (9, 1), (9, 4), (4, 4), (4, 9), (1, 9)}
+
+
+def test_voronoi_cells_tile_a_rectangle():
+    domain = PolygonDomain(*SQUARE)
+    X = np.random.default_rng(0).uniform(0, 10, (60, 2))
+    cells = voronoi_cells(np.vstack((X, np.zeros((5, 2)))), domain) # unplaced rows are ignored
+    assert len(cells) == len(X)
+    assert sum(_area(c) for c in cells) == pytest.approx(domain.area)
+    assert all(PolygonDomain(c[:, 0], c[:, 1]).contains(x, y) for c, (x, y) in zip(cells, X))
+
+
+def test_lattice_cache_hit_skips_the_tessellation(tmp_path, monkeypatch):
+    cache = LatticeCache(str(tmp_path / "cache"))
+    X = np.random.default_rng(1).uniform(0, 10, (30, 2))
+    first = build_lattice(X, *SQUARE, 0.4, cache=cache)
+    assert len(list((tmp_path / "cache").glob("*/*.npz"))) == 1
+
+    def fail(*args):
+        raise AssertionError("cache miss")
+    monkeypatch.setattr(voronoiLattice, "voronoi_cells", fail)
+    again = build_lattice(X.copy(), *SQUARE, 0.4, cache=cache) # same content, other array
+    for name in ("cells", "voids"):
+        assert len(again[name]) == len(first[name])
+        assert all(np.array_equal(a, b) for a, b in zip(again[name], first[name]))
+    with pytest.raises(AssertionError):
+        build_lattice(X, *SQUARE, 0.5, cache=cache) # other thickness, other key